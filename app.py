@@ -1,16 +1,24 @@
 from flask import Flask, render_template, request, jsonify, redirect, url_for, session
 from functools import wraps
 from datetime import timedelta
-import csv
+import atexit
 import os
-import sqlite3
+import threading
+import time
 
 # ===============================
 # 🔥 ML + RULE BASED LOGIC
 # ===============================
-from src.models.demand_predictor import predict_job_demand
-
-print("🔥 RUNNING app.py FILE")
+from src.models.demand_predictor import predict_job_demand_batch
+from src.models.rule_engine import rule_engine
+from src.models.prediction_cache import PredictionCache, prediction_cache as rules_cache
+from src.models.model_server import model_server
+from src.database.connection import db
+from src.database.write_queue import PredictionWriteQueue
+from src.database.user_store import user_store
+from src.database.session_store import ServerSessionInterface
+from src.analytics.db_summary import get_db_summary
+from src.monitoring.metrics import metrics
 
 # ===============================
 # APP SETUP
@@ -18,85 +26,154 @@ print("🔥 RUNNING app.py FILE")
 app = Flask(__name__, static_folder="static", template_folder="templates")
 app.secret_key = "jobai_secret_key"
 app.permanent_session_lifetime = timedelta(days=7)
+app.session_interface = ServerSessionInterface()
+
+# ===============================
+# PREDICTION MODE
+# ===============================
+# "rules" → explainable rule-based predictor (default)
+# "model" → trained RandomForest pipeline, micro-batched per worker
+PREDICT_MODE = os.environ.get("JOBAI_PREDICT_MODE", "rules")
+
+if PREDICT_MODE == "model":
+    prediction_cache = PredictionCache(
+        predict_fn=model_server.predict_job_demand,
+        version_fn=model_server.served_version
+    )
+else:
+    prediction_cache = rules_cache
 
 # ===============================
 # PATHS
 # ===============================
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR, "jobai.db")
 DATA_DIR = os.path.join(BASE_DIR, "data")
 USERS_FILE = os.path.join(DATA_DIR, "users.csv")
 
-os.makedirs(DATA_DIR, exist_ok=True)
+# ===============================
+# DATABASE HELPERS
+# ===============================
+prediction_queue = PredictionWriteQueue(db)
+atexit.register(prediction_queue.stop)
+atexit.register(model_server.stop)
+
+
+def save_prediction_to_db(data):
+    prediction_queue.submit(data)
+
+
+HISTORY_PAGE_SIZE = 10
+HISTORY_MAX_PAGE_SIZE = 100
+
+
+def get_prediction_page(args, default_limit=HISTORY_PAGE_SIZE):
+    """Read one history page from request args (limit, before, filters)."""
+    limit = min(max(args.get("limit", default_limit, type=int), 1), HISTORY_MAX_PAGE_SIZE)
+    before_id = args.get("before", type=int)
+
+    filters = {
+        "demand": args.get("demand", "").strip().capitalize(),
+        "jobtitle": args.get("jobtitle", "").lower().strip(),
+        "location": args.get("location", "").lower().strip()
+    }
+
+    # Make the user's own latest prediction visible before reading
+    prediction_queue.flush()
+    rows, next_cursor = db.prediction_page(limit=limit, before_id=before_id, **filters)
+    return rows, next_cursor, filters
+
 
 # ===============================
-# INIT USERS FILE
+# METRICS (JOBAI_METRICS=0 disables)
 # ===============================
-if not os.path.exists(USERS_FILE):
-    with open(USERS_FILE, "w", newline="") as f:
-        csv.writer(f).writerow(["email", "password"])
+metrics.init_app(app, db)
+metrics.register_collector("write_queue", prediction_queue.stats)
+metrics.register_collector("prediction_cache", prediction_cache.stats)
+metrics.register_collector("model_server", model_server.stats)
 
 # ===============================
-# DATABASE HELPERS
+# STARTUP / WARMUP
 # ===============================
-def get_db_connection():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
-
-
-def ensure_predictions_table():
-    with get_db_connection() as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS predictions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                jobtitle TEXT,
-                location TEXT,
-                experience_level TEXT,
-                industry TEXT,
-                skill_count INTEGER,
-                demand TEXT,
-                confidence REAL,
-                created_at TEXT
-            )
-        """)
+# Importing this module touches neither the filesystem nor the database.
+# warmup() runs once per worker: explicitly through create_app(), or
+# lazily in front of the first request otherwise.
+_startup_lock = threading.Lock()
 
+startup_state = {
+    "ready": False,
+    "warmup_seconds": None,
+    "steps": {}
+}
 
-def save_prediction_to_db(data):
-    ensure_predictions_table()
-    with get_db_connection() as conn:
-        conn.execute("""
-            INSERT INTO predictions
-            (jobtitle, location, experience_level,
-             industry, skill_count, demand, confidence, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
-        """, (
-            data["jobtitle"],
-            data["location"],
-            data["experience_level"],
-            data["industry"],
-            data["skill_count"],
-            data["demand"],
-            data["confidence"]
-        ))
-
-
-def get_last_10_predictions():
-    ensure_predictions_table()
-    with get_db_connection() as conn:
-        rows = conn.execute("""
-            SELECT jobtitle, location, experience_level,
-                   industry, skill_count, demand,
-                   confidence, created_at
-            FROM predictions
-            ORDER BY id DESC
-            LIMIT 10
-        """).fetchall()
-    return [dict(row) for row in rows]
-
-
-ensure_predictions_table()
-print("✅ predictions table ready")
+
+def _migrate_users():
+    # One-shot import of the legacy users.csv into the users table
+    migrated = user_store.migrate_from_csv(USERS_FILE)
+    if migrated:
+        print(f"✅ migrated {migrated} users from users.csv")
+
+
+def _prime_predictors():
+    # Compiles the rule lookup table (and pays the NumPy import) here
+    # instead of on the first /predict or /predict/batch
+    rule_engine.compile()
+
+    # Model mode: load the pipeline (pandas/sklearn/joblib) before serving
+    if PREDICT_MODE == "model":
+        model_server.load()
+
+
+def _compile_templates():
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+
+WARMUP_STEPS = (
+    ("database", db.init_schema),
+    ("users", _migrate_users),
+    ("predictors", _prime_predictors),
+    ("templates", _compile_templates),
+)
+
+
+def warmup():
+    with _startup_lock:
+        if startup_state["ready"]:
+            return startup_state
+
+        started = time.perf_counter()
+        steps = {}
+        for name, fn in WARMUP_STEPS:
+            step_start = time.perf_counter()
+            fn()
+            steps[name] = round((time.perf_counter() - step_start) * 1000, 2)
+
+        startup_state.update({
+            "ready": True,
+            "warmup_seconds": round(time.perf_counter() - started, 4),
+            "steps": steps
+        })
+        print(f"✅ JobAI ready (warmup {startup_state['warmup_seconds']}s)")
+
+    return startup_state
+
+
+@app.before_request
+def ensure_warm():
+    if not startup_state["ready"] and request.endpoint != "ready":
+        warmup()
+
+
+def create_app(warm=True):
+    """WSGI entry point, e.g. gunicorn "app:create_app()"."""
+    if warm:
+        warmup()
+    return app
+
+
+@app.route("/ready")
+def ready():
+    return jsonify(startup_state), (200 if startup_state["ready"] else 503)
 
 # ===============================
 # DECORATORS
@@ -141,16 +218,14 @@ def init_prediction_state():
 @app.route("/login", methods=["GET", "POST"])
 def login():
     if request.method == "POST":
-        email = request.form.get("email")
+        email = (request.form.get("email") or "").strip()
         password = request.form.get("password")
 
-        with open(USERS_FILE) as f:
-            for row in csv.DictReader(f):
-                if row["email"] == email and row["password"] == password:
-                    init_prediction_state()
-                    session["user"] = email
-                    session.permanent = True
-                    return redirect(url_for("dashboard"))
+        if user_store.authenticate(email, password):
+            init_prediction_state()
+            session["user"] = email
+            session.permanent = True
+            return redirect(url_for("dashboard"))
 
         return render_template("auth.html", error="Invalid credentials")
 
@@ -160,11 +235,14 @@ def login():
 @app.route("/signup", methods=["GET", "POST"])
 def signup():
     if request.method == "POST":
-        with open(USERS_FILE, "a", newline="") as f:
-            csv.writer(f).writerow([
-                request.form.get("email"),
-                request.form.get("password")
-            ])
+        email = (request.form.get("email") or "").strip()
+        password = request.form.get("password")
+
+        if not email or not password:
+            return render_template("signup.html", error="Email and password are required")
+
+        if not user_store.create(email, password):
+            return render_template("signup.html", error="Account already exists")
         return redirect(url_for("login"))
 
     return render_template("signup.html")
@@ -206,12 +284,26 @@ def analytics():
 @app.route("/history")
 @login_required
 def history():
+    predictions, next_cursor, filters = get_prediction_page(request.args)
     return render_template(
         "history.html",
-        predictions=get_last_10_predictions()
+        predictions=predictions,
+        next_cursor=next_cursor,
+        filters=filters
     )
 
 
+@app.route("/api/history")
+@login_required
+def history_api():
+    predictions, next_cursor, filters = get_prediction_page(request.args, default_limit=20)
+    return jsonify({
+        "predictions": predictions,
+        "next_cursor": next_cursor,
+        "filters": {k: v for k, v in filters.items() if v}
+    })
+
+
 @app.route("/skill-gap")
 @login_required
 @prediction_required
@@ -239,7 +331,7 @@ def predict():
     industry = data.get("industry", "").lower().strip()
     skills = data.get("required_skills", "").lower().strip()
 
-    demand, confidence, career_risk, ai_probability = predict_job_demand(
+    demand, confidence, career_risk, ai_probability = prediction_cache.predict(
         jobtitle, location, experience, industry, skills
     )
 
@@ -285,8 +377,73 @@ def predict():
 
     return jsonify({"status": "ok"})
 
+
+MAX_BATCH_SIZE = 10000
+
+
+@app.route("/predict/batch", methods=["POST"])
+@login_required
+def predict_batch():
+    data = request.get_json(force=True, silent=True) or {}
+    profiles = data.get("profiles")
+
+    if not isinstance(profiles, list) or not all(isinstance(p, dict) for p in profiles):
+        return jsonify({"status": "error", "message": "'profiles' must be a list of objects"}), 400
+    if len(profiles) > MAX_BATCH_SIZE:
+        return jsonify({
+            "status": "error",
+            "message": f"at most {MAX_BATCH_SIZE} profiles per request"
+        }), 400
+
+    # Same per-field normalization as /predict
+    def column(key, lower=True):
+        values = [str(p.get(key) or "").strip() for p in profiles]
+        return [v.lower() for v in values] if lower else values
+
+    demand, confidence, career_risk, ai_probability = predict_job_demand_batch(
+        column("jobtitle"),
+        column("experience_level", lower=False),
+        column("required_skills")
+    )
+
+    return jsonify({
+        "status": "ok",
+        "count": len(profiles),
+        "predictions": [
+            {
+                "demand": d,
+                "confidence": c,
+                "career_risk": r,
+                "ai_probability": a
+            }
+            for d, c, r, a in zip(
+                demand.tolist(), confidence.tolist(),
+                career_risk.tolist(), ai_probability.tolist()
+            )
+        ]
+    })
+
+
+@app.route("/api/summary")
+@login_required
+def summary_api():
+    prediction_queue.flush()
+    return jsonify(get_db_summary())
+
+
+@app.route("/api/write-queue")
+@login_required
+def write_queue_stats():
+    return jsonify(prediction_queue.stats())
+
+
+@app.route("/api/prediction-cache")
+@login_required
+def prediction_cache_stats():
+    return jsonify(prediction_cache.stats())
+
 # ===============================
 # RUN
 # ===============================
 if __name__ == "__main__":
-    app.run(debug=True)
+    create_app().run(debug=True)
@@ -0,0 +1,94 @@
+"""
+Benchmark: loading the processed job dataset, untyped CSV (every
+column re-parsed as object strings) vs CSV with usecols + the shared
+schema vs the Parquet copy (dictionary-encoded columns, column
+projection), on the real 10k-row file and a synthetic file resampled
+from it.
+
+Parquet rows need pyarrow (pip install -r requirements.txt).
+
+Command:
+python benchmarks/bench_columnar.py [synthetic_rows]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd  # noqa: E402
+
+from src.data_pipeline import columnar_store  # noqa: E402
+from src.data_pipeline.columnar_store import DATASETS, load_dataset, parquet_path, write_parquet  # noqa: E402
+
+SYNTHETIC_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+# What the training scripts actually use
+TRAINING_COLUMNS = ["job_title", "location", "experience_level", "industry", "required_skills", "demand_label"]
+
+
+def measure(label, load, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        df = load()
+        best = min(best, time.perf_counter() - start)
+    return label, best, df.memory_usage(deep=True).sum() / 1e6, df.shape[1]
+
+
+def run(csv_path):
+    rows = [
+        measure("CSV, all columns", lambda: pd.read_csv(csv_path)),
+        measure("CSV, 6 columns", lambda: pd.read_csv(csv_path, usecols=TRAINING_COLUMNS)),
+    ]
+
+    columnar_store.HAS_PYARROW = False
+    rows.append(measure("CSV, 6 cols + schema", lambda: load_dataset(csv_path, TRAINING_COLUMNS)))
+    columnar_store.HAS_PYARROW = PYARROW
+
+    if PYARROW:
+        start = time.perf_counter()
+        write_parquet(csv_path)
+        convert = time.perf_counter() - start
+        rows.append(measure("Parquet, all columns", lambda: load_dataset(csv_path)))
+        rows.append(measure("Parquet, 6 columns", lambda: load_dataset(csv_path, TRAINING_COLUMNS)))
+        sizes = (os.path.getsize(csv_path) / 1e6, os.path.getsize(parquet_path(csv_path)) / 1e6, convert)
+    else:
+        sizes = (os.path.getsize(csv_path) / 1e6, None, None)
+    return rows, sizes
+
+
+def report(title, rows, sizes):
+    csv_mb, parquet_mb, convert = sizes
+    print(f"\n⏱️ {title}")
+    print("=" * 62)
+    print(f"{'loader':<28} | {'cols':>4} | {'load ms':>8} | {'memory MB':>10}")
+    print("-" * 62)
+    for label, seconds, memory, cols in rows:
+        print(f"{label:<28} | {cols:>4} | {seconds * 1000:>8.1f} | {memory:>10.1f}")
+    print("-" * 62)
+    if parquet_mb is None:
+        print(f"File size: {csv_mb:.1f} MB CSV (pyarrow not installed, Parquet rows skipped)")
+    else:
+        print(f"File size: {csv_mb:.1f} MB CSV → {parquet_mb:.1f} MB Parquet (written in {convert:.2f}s)")
+
+
+if __name__ == "__main__":
+    PYARROW = columnar_store.HAS_PYARROW
+    tmp = tempfile.mkdtemp(prefix="jobai_columnar_")
+    try:
+        real = os.path.join(tmp, "real.csv")
+        shutil.copy(DATASETS["analytics"], real)
+        report("REAL DATASET (10k rows)", *run(real))
+
+        synthetic = os.path.join(tmp, "synthetic.csv")
+        df = pd.read_csv(real)
+        df.sample(SYNTHETIC_ROWS, replace=True, random_state=0).to_csv(synthetic, index=False)
+        del df
+        report(f"SYNTHETIC ({SYNTHETIC_ROWS:,} rows)", *run(synthetic))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
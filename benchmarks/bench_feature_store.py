@@ -0,0 +1,71 @@
+"""
+Benchmark: loading the model feature frame, per-script CSV parsing
+with the old lambda feature code vs the shared feature store (cold
+build and warm artifact load), on the real dataset and a resampled
+larger copy written to a temporary directory.
+
+Command:
+python benchmarks/bench_feature_store.py [synthetic_rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.data_pipeline.feature_store import DATA_PATH, COLUMN_MAP, load_features  # noqa: E402
+
+SYNTHETIC_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+
+def legacy_load(csv_path):
+    df = pd.read_csv(csv_path)
+    df.fillna("Unknown", inplace=True)
+    df.columns = [c.lower() for c in df.columns]
+    df.rename(columns={k: v for k, v in COLUMN_MAP.items() if k in df.columns}, inplace=True)
+    df["skill_count"] = df["required_skills"].apply(
+        lambda x: len(str(x).split(",")) if x != "Unknown" else 0
+    )
+    df["demand_binary"] = df["demand_label"].apply(lambda x: 1 if x == "High" else 0)
+    return df
+
+
+def best_of(fn, runs=3):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def measure(label, csv_path, store_dir):
+    legacy = best_of(lambda: legacy_load(csv_path))
+    cold = best_of(lambda: load_features(csv_path, rebuild=True, store_dir=store_dir), runs=1)
+    warm = best_of(lambda: load_features(csv_path, store_dir=store_dir))
+    rows = len(load_features(csv_path, store_dir=store_dir))
+    print(f"{label:<12} | {rows:>9,} | {legacy:>11.1f} | {cold:>10.1f} | {warm:>10.1f} | {legacy / warm:>7.1f}x")
+
+
+if __name__ == "__main__":
+    tmp = tempfile.mkdtemp(prefix="jobai_features_")
+    store_dir = os.path.join(tmp, "store")
+
+    synthetic_path = os.path.join(tmp, "synthetic.csv")
+    raw = pd.read_csv(DATA_PATH)
+    idx = np.random.default_rng(0).integers(0, len(raw), SYNTHETIC_ROWS)
+    raw.iloc[idx].to_csv(synthetic_path, index=False)
+
+    print("\n⏱️ FEATURE FRAME LOAD (ms, best of 3)")
+    print("=" * 73)
+    print(f"{'dataset':<12} | {'rows':>9} | {'CSV+lambda':>11} | {'store cold':>10} | "
+          f"{'store warm':>10} | {'speed-up':>8}")
+    print("-" * 73)
+    measure("real", DATA_PATH, store_dir)
+    measure("synthetic", synthetic_path, store_dir)
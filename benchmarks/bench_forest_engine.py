@@ -0,0 +1,69 @@
+"""
+Benchmark: demand-model inference latency, sklearn Pipeline.predict_proba
+(DataFrame build, ColumnTransformer, 500 estimator calls through joblib)
+vs the array-based ForestEngine walking all trees at once in NumPy.
+
+Command:
+python benchmarks/bench_forest_engine.py [single_row_calls]
+"""
+
+import os
+import sys
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.data_pipeline.feature_store import FEATURE_COLUMNS, load_features  # noqa: E402
+from src.models.forest_engine import ForestEngine  # noqa: E402
+from src.models.model_server import MODEL_PATH  # noqa: E402
+
+CALLS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+
+def latency(fn, rows, calls):
+    timings = []
+    for i in range(calls):
+        row = rows[i % len(rows)]
+        start = time.perf_counter()
+        fn(row)
+        timings.append(time.perf_counter() - start)
+    timings = np.array(timings) * 1000
+    return np.percentile(timings, 50), np.percentile(timings, 99)
+
+
+if __name__ == "__main__":
+    pipeline = joblib.load(MODEL_PATH)
+
+    start = time.perf_counter()
+    engine = ForestEngine.from_pipeline(pipeline)
+    export = time.perf_counter() - start
+
+    X = load_features()[FEATURE_COLUMNS].sample(5000, random_state=0)
+    rows = X.to_dict("records")
+
+    sk_p50, sk_p99 = latency(lambda r: pipeline.predict_proba(pd.DataFrame([r])), rows, CALLS // 10)
+    np_p50, np_p99 = latency(engine.predict_proba, rows, CALLS)
+
+    start = time.perf_counter()
+    expected = pipeline.predict_proba(X)
+    sk_batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = engine.predict_proba(rows)
+    np_batch = time.perf_counter() - start
+
+    print(f"\n⏱️ FOREST INFERENCE ({len(engine.roots)} trees, {engine.feature.size:,} nodes)")
+    print("=" * 60)
+    print(f"Export to arrays        : {export * 1000:.1f} ms")
+    print(f"Single row p50 / p99    : sklearn {sk_p50:6.2f} / {sk_p99:6.2f} ms"
+          f" | numpy {np_p50:6.2f} / {np_p99:6.2f} ms")
+    print(f"Batch of {len(X):,} rows     : sklearn {sk_batch:6.2f} s"
+          f"          | numpy {np_batch:6.2f} s")
+    print("-" * 60)
+    print(f"Single-row speed-up     : {sk_p50 / np_p50:.1f}x")
+    print(f"Max |probability diff|  : {np.abs(expected - got).max():.2e}")
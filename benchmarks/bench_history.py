@@ -0,0 +1,76 @@
+"""
+Benchmark: history page latency at increasing table sizes, keyset
+pagination vs LIMIT/OFFSET, for the first and a deep page.
+
+Command:
+python benchmarks/bench_history.py [sizes...]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.database.connection import HISTORY_COLUMNS, INSERT_PREDICTION, Database  # noqa: E402
+
+SIZES = [int(n) for n in sys.argv[1:]] or [100_000, 1_000_000, 5_000_000]
+PAGE_SIZE = 20
+REPEAT = 50
+
+ROLES = ["data analyst", "software engineer", "data engineer", "ai engineer"]
+CITIES = ["bangalore", "hyderabad", "pune", "chennai", "mumbai", "delhi"]
+DEMAND = ["High", "Medium", "Low"]
+
+
+def fill(database, target):
+    current = database.query_one("SELECT COUNT(*) AS n FROM predictions")["n"]
+    rng = random.Random(current)
+    batch = 100_000
+    while current < target:
+        n = min(batch, target - current)
+        database.executemany(INSERT_PREDICTION, (
+            (rng.choice(ROLES), rng.choice(CITIES), "2-5 years", "it",
+             rng.randint(1, 8), rng.choice(DEMAND), 70.0)
+            for _ in range(n)
+        ))
+        current += n
+
+
+def timed(fn):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+if __name__ == "__main__":
+    database = Database(os.path.join(tempfile.mkdtemp(prefix="jobai_hist_"), "history.db"))
+    database.init_schema()
+
+    print("\n⏱️ HISTORY PAGE LATENCY (ms per page, demand='High' filter)")
+    print("=" * 78)
+    print(f"{'rows':>10} | {'keyset p1':>10} | {'keyset deep':>11} | {'offset p1':>10} | {'offset deep':>11}")
+    print("-" * 78)
+
+    for size in SIZES:
+        fill(database, size)
+
+        # Cursor roughly 90% of the way back through the history
+        deep_cursor = size // 10
+        deep_offset = database.query_one(
+            "SELECT COUNT(*) AS n FROM predictions WHERE demand = 'High' AND id >= ?",
+            (deep_cursor,)
+        )["n"]
+
+        offset_sql = HISTORY_COLUMNS + " WHERE demand = ? ORDER BY id DESC LIMIT ? OFFSET ?"
+
+        k1 = timed(lambda: database.prediction_page(PAGE_SIZE, demand="High"))
+        kd = timed(lambda: database.prediction_page(PAGE_SIZE, before_id=deep_cursor, demand="High"))
+        o1 = timed(lambda: database.query(offset_sql, ("High", PAGE_SIZE, 0)))
+        od = timed(lambda: database.query(offset_sql, ("High", PAGE_SIZE, deep_offset)))
+
+        print(f"{size:>10,} | {k1:>10.3f} | {kd:>11.3f} | {o1:>10.3f} | {od:>11.3f}")
@@ -0,0 +1,82 @@
+"""
+Benchmark: login lookup latency with the old users.csv scan vs the
+indexed SQLite user store (cold index lookup and warm cache hit).
+
+Command:
+python benchmarks/bench_login.py [sizes...]
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.database.connection import Database  # noqa: E402
+from src.database.user_store import UserStore  # noqa: E402
+
+SIZES = [int(n) for n in sys.argv[1:]] or [1_000, 100_000, 1_000_000]
+LOOKUPS = 200
+
+
+# ===============================
+# LEGACY LOGIN (BASELINE)
+# ===============================
+def csv_login(path, email, password):
+    with open(path) as f:
+        for row in csv.DictReader(f):
+            if row["email"] == email and row["password"] == password:
+                return True
+    return False
+
+
+def timed(fn, emails, repeat):
+    start = time.perf_counter()
+    for i in range(repeat):
+        email = emails[i % len(emails)]
+        assert fn(email, "pw")
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def build(size, tmp_dir):
+    csv_path = os.path.join(tmp_dir, f"users_{size}.csv")
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["email", "password"])
+        writer.writerows((f"user{i}@jobai.com", "pw") for i in range(size))
+
+    database = Database(os.path.join(tmp_dir, f"users_{size}.db"))
+    database.init_schema()
+    store = UserStore(database)
+    store.migrate_from_csv(csv_path)
+    return csv_path, store
+
+
+if __name__ == "__main__":
+    tmp_dir = tempfile.mkdtemp(prefix="jobai_login_")
+
+    print("\n⏱️ LOGIN LOOKUP LATENCY (ms per login, worst-case = last user)")
+    print("=" * 72)
+    print(f"{'users':>10} | {'csv scan':>12} | {'sqlite index':>12} | {'cached':>10}")
+    print("-" * 72)
+
+    for size in SIZES:
+        csv_path, store = build(size, tmp_dir)
+
+        # Users near the end of the file are the slow case for the scan
+        emails = [f"user{size - 1 - i}@jobai.com" for i in range(min(LOOKUPS, size))]
+        csv_repeat = max(3, min(LOOKUPS, 2_000_000 // size))
+
+        csv_ms = timed(lambda e, p: csv_login(csv_path, e, p), emails, csv_repeat)
+
+        store.cache_size = 0
+        index_ms = timed(store.authenticate, emails, LOOKUPS)
+
+        store.cache_size = len(emails)
+        timed(store.authenticate, emails, LOOKUPS)
+        cached_ms = timed(store.authenticate, emails, LOOKUPS)
+
+        print(f"{size:>10,} | {csv_ms:>12.4f} | {index_ms:>12.4f} | {cached_ms:>10.4f}")
@@ -0,0 +1,115 @@
+"""
+Benchmark: loading the demand model in a web worker, joblib.load of the
+pickled pipeline (every worker deserialises its own private copy) vs
+the registry's memory-mapped ForestEngine arrays (file-backed pages the
+OS shares between workers), plus the time to hot-swap versions.
+
+Each load runs in a fresh interpreter; "anon MB" is the anonymous
+memory the load added, which every extra worker pays again, while
+mapped file pages are counted in RSS but shared through the page cache.
+
+Command:
+python benchmarks/bench_model_registry.py
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.models.model_registry import ModelRegistry  # noqa: E402
+from src.models.model_server import MODEL_PATH, MicroBatchModelServer  # noqa: E402
+
+PROBE = r"""
+import json, sys, time
+
+
+def smaps():
+    totals = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                totals[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return totals
+
+
+import numpy, pandas, sklearn.ensemble  # noqa: E401,F401  (same imports in both modes)
+from src.models.model_registry import ModelRegistry
+
+mode, path = sys.argv[1], sys.argv[2]
+before = smaps()
+start = time.perf_counter()
+if mode == "pickle":
+    import joblib
+    model = joblib.load(path)
+    score = lambda rows: model.predict_proba(pandas.DataFrame(rows))
+else:
+    model = ModelRegistry(path).load_engine()
+    score = model.predict_proba
+load_s = time.perf_counter() - start
+
+rows = [{"jobtitle": "AI Engineer", "location": "Pune", "experience_level": "Senior",
+         "industry": "IT", "skill_count": 5}] * 32
+score(rows)
+after = smaps()
+
+print(json.dumps({
+    "load_s": load_s,
+    "anon_mb": after["Anonymous"] - before["Anonymous"],
+    "rss_mb": after["Rss"] - before["Rss"]
+}))
+"""
+
+
+def probe(mode, path):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, mode, path],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    tmp = tempfile.mkdtemp(prefix="jobai_registry_")
+    try:
+        import joblib
+
+        registry = ModelRegistry(os.path.join(tmp, "registry"))
+        pipeline = joblib.load(MODEL_PATH)
+        start = time.perf_counter()
+        registry.register(pipeline)
+        register_s = time.perf_counter() - start
+        registry.register(pipeline)
+        registry.promote(1, export_path=None)
+
+        results = {
+            "joblib pickle": probe("pickle", MODEL_PATH),
+            "registry (mmap)": probe("mmap", registry.root)
+        }
+
+        server = MicroBatchModelServer(registry=registry, poll_seconds=3600)
+        server.load()
+        registry.promote(2, export_path=None)
+        start = time.perf_counter()
+        server.swap()
+        swap_s = time.perf_counter() - start
+        server.stop()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"\n⏱️ MODEL LOADING PER WORKER ({os.path.getsize(MODEL_PATH) / 1e6:.0f} MB pickle)")
+    print("=" * 48)
+    print(f"{'mode':<18} | {'load ms':>8} | {'RSS MB':>7} | {'anon MB':>7}")
+    print("-" * 48)
+    for mode, r in results.items():
+        print(f"{mode:<18} | {r['load_s'] * 1000:>8.1f} | {r['rss_mb']:>7.1f} | {r['anon_mb']:>7.1f}")
+    print("-" * 48)
+    print(f"Register a version  : {register_s * 1000:.0f} ms")
+    print(f"Hot swap to v0002   : {swap_s * 1000:.1f} ms")
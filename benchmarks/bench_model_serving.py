@@ -0,0 +1,100 @@
+"""
+Benchmark: serving the trained demand pipeline to concurrent clients,
+one-row-at-a-time pipeline.predict vs dynamic micro-batching.
+
+Requires data/models/job_demand_model.pkl (run train_demand_model.py).
+
+Command:
+python benchmarks/bench_model_serving.py [clients] [requests_per_client]
+"""
+
+import os
+import statistics
+import sys
+import threading
+import time
+
+import joblib
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.models.model_server import FEATURE_COLUMNS, MODEL_PATH, MicroBatchModelServer  # noqa: E402
+
+CLIENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+PER_CLIENT = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+
+DATA_PATH = os.path.join(
+    PROJECT_ROOT, "data", "processed",
+    "job_market_analytics_final_with_certificates.csv"
+)
+
+
+def sample_rows(n):
+    df = pd.read_csv(DATA_PATH, nrows=max(n, 1))
+    df["skill_count"] = df["required_skills"].str.count(",") + 1
+    df = df.rename(columns={"job_title": "jobtitle"})
+    return df[FEATURE_COLUMNS].to_dict("records")
+
+
+def run_clients(label, score_one, rows):
+    latencies = []
+    lock = threading.Lock()
+
+    def client(offset):
+        local = []
+        for i in range(PER_CLIENT):
+            row = rows[(offset + i) % len(rows)]
+            start = time.perf_counter()
+            score_one(row)
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client, args=(c * PER_CLIENT,)) for c in range(CLIENTS)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    rps = len(latencies) / elapsed
+    print(f"{label:<26} | {rps:>9.1f} | {p50:>8.2f} | {p99:>8.2f}")
+    return rps
+
+
+if __name__ == "__main__":
+    if not os.path.exists(MODEL_PATH):
+        print("❌ Model not found – run: python src/models/train_demand_model.py")
+        sys.exit(1)
+
+    pipeline = joblib.load(MODEL_PATH)
+    rows = sample_rows(CLIENTS * PER_CLIENT)
+
+    print(f"\n⏱️ MODEL SERVING ({CLIENTS} concurrent clients x {PER_CLIENT} requests)")
+    print("=" * 60)
+    print(f"{'mode':<26} | {'req/s':>9} | {'p50 ms':>8} | {'p99 ms':>8}")
+    print("-" * 60)
+
+    before = run_clients(
+        "pipeline.predict (1 row)",
+        lambda row: pipeline.predict(pd.DataFrame([row], columns=FEATURE_COLUMNS)),
+        rows
+    )
+
+    server = MicroBatchModelServer()
+    server.load()
+    after = run_clients("micro-batched", server.predict_proba_high, rows)
+    server.stop()
+
+    stats = server.stats()
+    print("-" * 60)
+    print(f"Speed-up            : {after / before:.2f}x")
+    print(f"Avg / max batch size: {stats['avg_batch_size']} / {stats['max_batch_size']}")
+    print(f"Avg / max queue wait: {stats['avg_queue_delay_ms']} / {stats['max_queue_delay_ms']} ms")
+    print(f"Avg batch inference : {stats['avg_batch_inference_ms']} ms")
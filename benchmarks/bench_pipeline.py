@@ -0,0 +1,91 @@
+"""
+Benchmark: the Review-2 pipeline end to end, the old main.py chain (one
+fresh interpreter per script, every script rerun) vs the in-process
+DAG runner cold (one worker, then all CPUs), fully cached, and after a
+change that only affects statistical validation.
+
+Everything runs in a temporary copy of the project, so the real model
+and results are not touched. Each cold run takes about a minute.
+
+Command:
+python benchmarks/bench_pipeline.py
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.pipeline.runner import ANALYTICS_CSV, REVIEW_STAGES  # noqa: E402
+
+ENV = dict(os.environ, MPLBACKEND="Agg", SHOW_PLOTS="0")
+
+
+def copy_project():
+    root = tempfile.mkdtemp(prefix="jobai_pipeline_")
+    shutil.copytree(
+        os.path.join(PROJECT_ROOT, "src"), os.path.join(root, "src"),
+        ignore=shutil.ignore_patterns("__pycache__", "tests")
+    )
+    shutil.copy(os.path.join(PROJECT_ROOT, "eda_feature_engineering.py"), root)
+    os.makedirs(os.path.join(root, os.path.dirname(ANALYTICS_CSV)))
+    shutil.copy(os.path.join(PROJECT_ROOT, ANALYTICS_CSV), os.path.join(root, ANALYTICS_CSV))
+    for folder in ("data/models", "results/reports"):
+        os.makedirs(os.path.join(root, folder), exist_ok=True)
+    return root
+
+
+def reset(root):
+    shutil.rmtree(os.path.join(root, "data", "features"), ignore_errors=True)
+    state_path = os.path.join(root, "data", "pipeline_state.json")
+    if os.path.exists(state_path):
+        os.remove(state_path)
+
+
+def timed(root, commands):
+    start = time.perf_counter()
+    for command in commands:
+        subprocess.run(command, cwd=root, env=ENV, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def runner(*args):
+    return [sys.executable, os.path.join("src", "pipeline", "runner.py"), *args]
+
+
+if __name__ == "__main__":
+    root = copy_project()
+    cpus = os.cpu_count() or 1
+    results = []
+    try:
+        reset(root)
+        chain = [[sys.executable, stage.script] for stage in REVIEW_STAGES]
+        results.append(("subprocess chain (old main.py)", timed(root, chain)))
+
+        reset(root)
+        results.append(("runner, cold, 1 worker", timed(root, [runner("--workers", "1")])))
+
+        if cpus > 1:
+            reset(root)
+            results.append((f"runner, cold, {cpus} workers", timed(root, [runner("--workers", str(cpus))])))
+
+        results.append(("runner, nothing changed", timed(root, [runner()])))
+
+        with open(os.path.join(root, "src", "models", "fold_validation.py"), "a") as f:
+            f.write("\n# touched\n")
+        results.append(("runner, validation code changed", timed(root, [runner()])))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print(f"\n⏱️ REVIEW-2 PIPELINE ({len(REVIEW_STAGES)} stages, {cpus} CPU)")
+    print("=" * 52)
+    print(f"{'mode':<34} | {'wall clock s':>13}")
+    print("-" * 52)
+    for label, seconds in results:
+        print(f"{label:<34} | {seconds:>13.2f}")
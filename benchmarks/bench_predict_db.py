@@ -0,0 +1,114 @@
+"""
+Benchmark: /predict requests/sec with the old connect-per-call
+SQLite helpers vs the persistent WAL connection layer.
+
+Command:
+python benchmarks/bench_predict_db.py [requests]
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+
+# ===============================
+# ISOLATED DATABASE
+# ===============================
+TMP_DIR = tempfile.mkdtemp(prefix="jobai_bench_")
+os.environ["JOBAI_DB_PATH"] = os.path.join(TMP_DIR, "bench.db")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import app as web  # noqa: E402
+
+N_REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+PAYLOAD = {
+    "jobtitle": "Data Engineer",
+    "location": "Bangalore",
+    "experience_level": "2-5 years",
+    "industry": "IT",
+    "required_skills": "Python, SQL, Spark"
+}
+
+
+# ===============================
+# LEGACY HELPERS (BASELINE)
+# ===============================
+def legacy_connection():
+    conn = sqlite3.connect(os.environ["JOBAI_DB_PATH"])
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def legacy_ensure_predictions_table():
+    with legacy_connection() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS predictions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                jobtitle TEXT,
+                location TEXT,
+                experience_level TEXT,
+                industry TEXT,
+                skill_count INTEGER,
+                demand TEXT,
+                confidence REAL,
+                created_at TEXT
+            )
+        """)
+
+
+def legacy_save_prediction_to_db(data):
+    legacy_ensure_predictions_table()
+    conn = legacy_connection()
+    with conn:
+        conn.execute(
+            "INSERT INTO predictions (jobtitle, location, experience_level, "
+            "industry, skill_count, demand, confidence, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))",
+            (
+                data["jobtitle"], data["location"], data["experience_level"],
+                data["industry"], data["skill_count"], data["demand"],
+                data["confidence"]
+            )
+        )
+    conn.close()
+
+
+# ===============================
+# RUNNER
+# ===============================
+def run(label):
+    client = web.app.test_client()
+    client.get("/guest")
+
+    start = time.perf_counter()
+    for _ in range(N_REQUESTS):
+        client.post("/predict", json=PAYLOAD)
+    elapsed = time.perf_counter() - start
+
+    rps = N_REQUESTS / elapsed
+    print(f"{label:<28} {N_REQUESTS} requests in {elapsed:.3f}s → {rps:,.0f} req/s")
+    return rps
+
+
+if __name__ == "__main__":
+    print("\n⏱️ /predict THROUGHPUT BENCHMARK")
+    print("=" * 60)
+
+    pooled_save = web.save_prediction_to_db
+
+    # Legacy journal mode for a fair baseline
+    with web.db.checkout() as conn:
+        conn.execute("PRAGMA journal_mode=DELETE")
+    web.save_prediction_to_db = legacy_save_prediction_to_db
+    before = run("connect-per-call (before)")
+
+    web.db.close_all()
+    web.save_prediction_to_db = pooled_save
+    after = run("pooled WAL (after)")
+
+    print("-" * 60)
+    print(f"Speed-up: {after / before:.2f}x")
@@ -0,0 +1,89 @@
+"""
+Benchmark: refreshing the demand model with new labeled predictions,
+a full refit of the current best parameters on the original training
+split plus the new rows (train_demand_model.py additionally re-runs the
+search) vs warm-starting extra trees on the new rows only.
+
+Command:
+python benchmarks/bench_retrain.py [new_rows] [new_trees]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import joblib
+import pandas as pd
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.data_pipeline.feature_store import FEATURE_COLUMNS, load_features  # noqa: E402
+from src.database.connection import INSERT_PREDICTION, Database  # noqa: E402
+from src.models.incremental_training import reference_holdout, retrain  # noqa: E402
+from src.models.model_registry import ModelRegistry  # noqa: E402
+from src.models.model_server import MODEL_PATH  # noqa: E402
+
+NEW_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+NEW_TREES = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+
+if __name__ == "__main__":
+    df = load_features()
+    X_train, _, y_train, _ = train_test_split(
+        df[FEATURE_COLUMNS], df["demand_binary"],
+        test_size=0.2, stratify=df["demand_binary"], random_state=42
+    )
+    reference = reference_holdout()
+
+    # Simulated feedback: rows as the web app stores them (lower-cased,
+    # with whatever demand was served), then labeled with the outcome
+    feedback = df.sample(NEW_ROWS, replace=True, random_state=1)
+    rows = [
+        (r.jobtitle.lower(), r.location.lower(), r.experience_level.lower(), r.industry.lower(),
+         int(r.skill_count), "Medium", 70.0)
+        for r in feedback.itertuples()
+    ]
+    labels = [
+        (i + 1, "High" if r.demand_binary else "Low", None)
+        for i, r in enumerate(feedback.itertuples())
+    ]
+
+    tmp = tempfile.mkdtemp(prefix="jobai_retrain_")
+    try:
+        model_path = os.path.join(tmp, "model.pkl")
+        shutil.copy(MODEL_PATH, model_path)
+        database = Database(os.path.join(tmp, "jobai.db"))
+        database.executemany(INSERT_PREDICTION, rows)
+        database.label_predictions(labels)
+        pipeline = joblib.load(model_path)
+
+        start = time.perf_counter()
+        full = clone(pipeline).fit(
+            pd.concat([X_train, feedback[FEATURE_COLUMNS]]),
+            pd.concat([y_train, feedback["demand_binary"]])
+        )
+        full_refit = time.perf_counter() - start
+
+        summary = retrain(
+            pipeline=pipeline, database=database, registry=ModelRegistry(os.path.join(tmp, "registry")),
+            n_new_trees=NEW_TREES, min_rows=1, reference=reference, model_path=model_path,
+            state_path=os.path.join(tmp, "state.json")
+        )
+        database.close_all()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"\n⏱️ MODEL REFRESH ({NEW_ROWS:,} new rows)")
+    print("=" * 60)
+    print(f"{f'Full refit, {len(full.steps[-1][1].estimators_)} trees':<32}: {full_refit:>7.2f}s")
+    print(f"{f'Warm start, +{NEW_TREES} trees (fit)':<32}: {summary['fit_seconds']:>7.2f}s")
+    print(f"{'Warm start, end to end':<32}: {summary['total_seconds']:>7.2f}s")
+    print("-" * 60)
+    print(f"Holdout F1   : {summary['before']['f1']} → {summary['after']['f1']}")
+    print(f"Reference F1 : {summary['reference_before']['f1']} → {summary['reference_after']['f1']}")
+    print(f"Version {summary['version']} {summary['status']}")
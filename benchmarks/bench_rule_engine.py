@@ -0,0 +1,66 @@
+"""
+Benchmark: rule-based demand predictions, reference rule walk vs the
+precompiled lookup-table engine (scalar calls and columnar batches).
+
+Command:
+python benchmarks/bench_rule_engine.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.models import demand_predictor  # noqa: E402
+from src.models.rule_engine import RuleTableEngine  # noqa: E402
+
+N_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+ROLES = list(demand_predictor.ROLE_BASE_DEMAND) + ["Mechanical Engineer", "  AI Engineer "]
+EXPERIENCE = list(demand_predictor.EXPERIENCE_BONUS) + ["Fresher", "10 years"]
+SKILLS = ["python", "python, sql", "python, sql, aws", "a, b, c, d", "a, b, c, d, e, f"]
+
+
+def make_rows(n):
+    rng = random.Random(0)
+    return (
+        [rng.choice(ROLES) for _ in range(n)],
+        [rng.choice(EXPERIENCE) for _ in range(n)],
+        [rng.choice(SKILLS) for _ in range(n)]
+    )
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    titles, levels, skills = make_rows(N_ROWS)
+    rows = list(zip(titles, levels, skills))
+
+    engine = RuleTableEngine()
+    compile_s = timed(engine.compile)
+
+    reference_scalar = timed(lambda: [
+        demand_predictor.predict_job_demand(t, "", e, "", s) for t, e, s in rows
+    ])
+    engine_scalar = timed(lambda: [engine.predict(t, "", e, "", s) for t, e, s in rows])
+    engine_batch = timed(lambda: engine.predict_batch(titles, levels, skills))
+
+    print(f"\n⏱️ RULE PREDICTOR ({N_ROWS:,} rows)")
+    print("=" * 60)
+    print(f"table compile                 {compile_s * 1000:>10.2f} ms")
+    print(f"reference predict_job_demand  {reference_scalar * 1000:>10.1f} ms   "
+          f"({N_ROWS / reference_scalar:,.0f} rows/s)")
+    print(f"lookup engine, scalar         {engine_scalar * 1000:>10.1f} ms   "
+          f"({N_ROWS / engine_scalar:,.0f} rows/s)")
+    print(f"lookup engine, batch          {engine_batch * 1000:>10.1f} ms   "
+          f"({N_ROWS / engine_batch:,.0f} rows/s)")
+    print("-" * 60)
+    print(f"Scalar speed-up               {reference_scalar / engine_scalar:>10.2f}x")
+    print(f"Batch vs reference loop       {reference_scalar / engine_batch:>10.2f}x")
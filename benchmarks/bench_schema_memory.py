@@ -0,0 +1,62 @@
+"""
+Benchmark: in-memory size and load time of the processed job dataset,
+pandas defaults (object strings, int64/float64, dates as text) vs the
+shared schema (categoricals, parsed dates, downcast numerics), on the
+real 10k-row file and a synthetic file resampled from it.
+
+Command:
+python benchmarks/bench_schema_memory.py [synthetic_rows]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd  # noqa: E402
+
+from src.data_pipeline import schema  # noqa: E402
+from src.data_pipeline.columnar_store import DATASETS  # noqa: E402
+
+SYNTHETIC_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+
+def timed(load):
+    start = time.perf_counter()
+    df = load()
+    return df, time.perf_counter() - start
+
+
+def run(title, csv_path):
+    before, default_seconds = timed(lambda: pd.read_csv(csv_path))
+    after, schema_seconds = timed(lambda: schema.read_csv(csv_path))
+    report = schema.memory_report(before, after)
+
+    print(f"\n📦 {title}")
+    print("=" * 78)
+    print(report.to_string())
+    print("-" * 78)
+    total = report.loc["TOTAL"]
+    print(f"Memory: {total['mb_before']:.1f} MB → {total['mb_after']:.1f} MB "
+          f"({total['reduction']:.0%} less)")
+    print(f"Load  : {default_seconds * 1000:.0f} ms → {schema_seconds * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    tmp = tempfile.mkdtemp(prefix="jobai_schema_")
+    try:
+        real = os.path.join(tmp, "real.csv")
+        shutil.copy(DATASETS["analytics"], real)
+        run("REAL DATASET (10k rows)", real)
+
+        synthetic = os.path.join(tmp, "synthetic.csv")
+        df = pd.read_csv(real)
+        df.sample(SYNTHETIC_ROWS, replace=True, random_state=0).to_csv(synthetic, index=False)
+        del df
+        run(f"SYNTHETIC ({SYNTHETIC_ROWS:,} rows)", synthetic)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
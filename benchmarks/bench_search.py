@@ -0,0 +1,100 @@
+"""
+Benchmark: demand-model hyperparameter search, the original
+RandomizedSearchCV (10 candidates x 3 folds, full-size forests) vs
+budgeted successive halving, on the same split and search space.
+Each search log is written next to the training logs in results/reports.
+
+Command:
+python benchmarks/bench_search.py [budget_seconds]
+"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import f1_score
+from sklearn.model_selection import RandomizedSearchCV, train_test_split
+from sklearn.pipeline import Pipeline
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.models.encoding import build_preprocessor  # noqa: E402
+from src.models.hyperparameter_search import (  # noqa: E402
+    SuccessiveHalvingSearch, random_search_log, save_search_log
+)
+
+BUDGET = float(sys.argv[1]) if len(sys.argv) > 1 else 20.0
+
+DATA_PATH = os.path.join(
+    PROJECT_ROOT, "data", "processed",
+    "job_market_analytics_final_with_certificates.csv"
+)
+REPORT_PATH = os.path.join(PROJECT_ROOT, "results", "reports")
+
+PARAM_DIST = {
+    "model__n_estimators": [300, 400, 500],
+    "model__max_depth": [15, 20, 25],
+    "model__min_samples_split": [2, 5],
+    "model__min_samples_leaf": [1, 2]
+}
+
+
+def load_split():
+    df = pd.read_csv(DATA_PATH).rename(columns={"job_title": "jobtitle"})
+    df["skill_count"] = df["required_skills"].str.split(",").str.len()
+    X = df[["jobtitle", "location", "experience_level", "industry", "skill_count"]]
+    y = (df["demand_label"] == "High").astype(int)
+    return train_test_split(X, y, test_size=0.2, stratify=y, random_state=42)
+
+
+def make_pipeline():
+    return Pipeline([
+        ("preprocessor", build_preprocessor()),
+        ("model", RandomForestClassifier(class_weight="balanced", random_state=42, n_jobs=-1))
+    ])
+
+
+def run(label, search, X_train, X_test, y_train, y_test):
+    start = time.perf_counter()
+    search.fit(X_train, y_train)
+    elapsed = time.perf_counter() - start
+
+    test_f1 = f1_score(y_test, search.best_estimator_.predict(X_test))
+    fits = len(search.log_) if hasattr(search, "log_") else len(search.cv_results_["params"])
+    print(f"{label:<28} | {elapsed:>8.1f} | {fits:>10} | {search.best_score_:>7.4f} | {test_f1:>7.4f}")
+    return search
+
+
+if __name__ == "__main__":
+    X_train, X_test, y_train, y_test = load_split()
+
+    print("\n⏱️ HYPERPARAMETER SEARCH (search + refit wall clock)")
+    print("=" * 74)
+    print(f"{'search':<28} | {'total s':>8} | {'CV evals':>10} | {'CV F1':>7} | {'test F1':>7}")
+    print("-" * 74)
+
+    random_search = run("random (10 x full size)", RandomizedSearchCV(
+        make_pipeline(), PARAM_DIST, n_iter=10, cv=3, scoring="f1",
+        random_state=42, n_jobs=-1
+    ), X_train, X_test, y_train, y_test)
+    save_search_log(random_search_log(random_search), os.path.join(REPORT_PATH, "search_log_random.csv"))
+
+    halving = run("halving (n_estimators)", SuccessiveHalvingSearch(
+        make_pipeline(), PARAM_DIST, resource="model__n_estimators", max_resource=500
+    ), X_train, X_test, y_train, y_test)
+    save_search_log(halving.log_, os.path.join(REPORT_PATH, "search_log_halving.csv"))
+
+    run("halving (n_samples)", SuccessiveHalvingSearch(
+        make_pipeline(), PARAM_DIST, resource="n_samples"
+    ), X_train, X_test, y_train, y_test)
+
+    budgeted = run(f"halving ({BUDGET:.0f}s budget)", SuccessiveHalvingSearch(
+        make_pipeline(), PARAM_DIST, time_budget=BUDGET
+    ), X_train, X_test, y_train, y_test)
+
+    print("-" * 74)
+    print("CV evals = candidate x rung evaluations, each a 3-fold cross-validation")
+    print("Budget exhausted:", budgeted.budget_exhausted_)
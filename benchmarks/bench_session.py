@@ -0,0 +1,71 @@
+"""
+Benchmark: request cookie bytes and render time on /analytics and
+/dashboard with Flask's signed-cookie session vs the server-side store.
+
+Command:
+python benchmarks/bench_session.py [requests]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+TMP_DIR = tempfile.mkdtemp(prefix="jobai_bench_")
+os.environ["JOBAI_DB_PATH"] = os.path.join(TMP_DIR, "bench.db")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from flask.sessions import SecureCookieSessionInterface  # noqa: E402
+
+import app as web  # noqa: E402
+from src.database.session_store import (  # noqa: E402
+    MemorySessionBackend,
+    ServerSessionInterface,
+    SQLiteSessionBackend
+)
+
+N_REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+PAGES = ["/analytics", "/dashboard"]
+
+PAYLOAD = {
+    "jobtitle": "Software Engineer",
+    "location": "Hyderabad",
+    "experience_level": "2-5 years",
+    "industry": "IT",
+    "required_skills": "Python, Django, REST APIs, Docker, Kubernetes, AWS"
+}
+
+
+def run(label, interface):
+    web.app.session_interface = interface
+    client = web.app.test_client()
+    client.get("/guest")
+    client.post("/predict", json=PAYLOAD)
+
+    cookie = client.get_cookie(web.app.config["SESSION_COOKIE_NAME"])
+    cookie_bytes = len(f"{cookie.key}={cookie.value}")
+
+    timings = {}
+    for page in PAGES:
+        start = time.perf_counter()
+        for _ in range(N_REQUESTS):
+            response = client.get(page)
+            assert response.status_code == 200, page
+        timings[page] = (time.perf_counter() - start) / N_REQUESTS * 1000
+
+    cols = " | ".join(f"{timings[p]:>10.3f}" for p in PAGES)
+    print(f"{label:<22} | {cookie_bytes:>12} | {cols}")
+
+
+if __name__ == "__main__":
+    print("\n⏱️ SESSION PAYLOAD + RENDER TIME (ms per request)")
+    print("=" * 72)
+    header = " | ".join(f"{p:>10}" for p in PAGES)
+    print(f"{'session backend':<22} | {'cookie bytes':>12} | {header}")
+    print("-" * 72)
+
+    run("signed cookie (before)", SecureCookieSessionInterface())
+    run("server: sqlite", ServerSessionInterface(SQLiteSessionBackend()))
+    run("server: memory", ServerSessionInterface(MemorySessionBackend()))
@@ -0,0 +1,77 @@
+"""
+Benchmark: cold-start cost of a web worker, measured in fresh
+interpreters — module import, warmup, and first request. Exits non-zero
+if `import app` loads numpy/pandas/sklearn/joblib or creates the DB file.
+
+Command:
+python benchmarks/bench_startup.py [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+PROBE = r"""
+import json, os, sys, time
+t0 = time.perf_counter()
+import app
+t1 = time.perf_counter()
+created_on_import = os.path.exists(os.environ["JOBAI_DB_PATH"])
+app.create_app()
+t2 = time.perf_counter()
+client = app.app.test_client()
+client.get("/guest")
+client.post("/predict", json={"jobtitle": "AI Engineer", "location": "Pune",
+    "experience_level": "2-5 years", "industry": "IT", "required_skills": "python, sql"})
+t3 = time.perf_counter()
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    "warmup_ms": (t2 - t1) * 1000,
+    "first_request_ms": (t3 - t2) * 1000,
+    "db_created_on_import": created_on_import
+}))
+"""
+
+IMPORT_ONLY = r"""
+import json, sys
+import app
+print(json.dumps(sorted(m for m in ("numpy", "pandas", "sklearn", "joblib") if m in sys.modules)))
+"""
+
+
+def run_probe(code):
+    env = dict(os.environ)
+    env["JOBAI_DB_PATH"] = os.path.join(tempfile.mkdtemp(prefix="jobai_start_"), "start.db")
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    samples = [run_probe(PROBE) for _ in range(RUNS)]
+    heavy_on_import = run_probe(IMPORT_ONLY)
+
+    print("\n⏱️ WEB WORKER COLD START (median of", RUNS, "fresh interpreters)")
+    print("=" * 60)
+    for key in ("import_ms", "warmup_ms", "first_request_ms"):
+        values = [s[key] for s in samples]
+        print(f"{key:<20} {statistics.median(values):>10.1f} ms   (min {min(values):.1f})")
+
+    total = [s["import_ms"] + s["warmup_ms"] + s["first_request_ms"] for s in samples]
+    print(f"{'cold start total':<20} {statistics.median(total):>10.1f} ms")
+    print("-" * 60)
+    print("Heavy modules loaded by import :", heavy_on_import or "none")
+    db_created = any(s["db_created_on_import"] for s in samples)
+    print("DB file created by import      :", db_created)
+
+    assert not heavy_on_import, f"import app loaded {', '.join(heavy_on_import)}"
+    assert not db_created, "import app created the database file"
+    print("✅ import app stays light")
@@ -0,0 +1,100 @@
+"""
+Benchmark: raw-to-clean pipeline on a synthetic scrape, the in-memory
+path (read_csv, drop_duplicates, medians and features on the whole
+frame) vs the two-pass chunked streaming mode. Each run is a fresh
+interpreter so peak RSS reflects only that mode.
+
+Command:
+python benchmarks/bench_streaming_clean.py [rows] [chunksize]
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+CHUNK_SIZE = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+PROBE = r"""
+import json, resource, sys, time
+import pandas as pd
+from src.data_pipeline.cleaning_pipeline import (
+    clean_job_data, clean_job_data_streaming, feature_engineering
+)
+
+mode, raw_path, out_path, chunksize = sys.argv[1], sys.argv[2], sys.argv[3], int(sys.argv[4])
+start = time.perf_counter()
+if mode == "in-memory":
+    df = feature_engineering(clean_job_data(pd.read_csv(raw_path)))
+    df.to_csv(out_path, index=False)
+else:
+    clean_job_data_streaming(raw_path, out_path, chunksize)
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+}))
+"""
+
+
+def write_scrape(path, rows, seed=0, part=500_000):
+    """
+    Raw scrape written in parts. Postings are keyed by a random jobid, so
+    re-scraped postings repeat exactly (~40% duplicate rows); every
+    column has gaps.
+    """
+    rng = np.random.default_rng(seed)
+    titles = np.array(["Data Analyst", "ML Engineer", "Java Developer", "Tester", "DevOps", None], dtype=object)
+    skills = np.array(["Python, SQL", "Java,Spring", "aws, docker, linux", "Excel", "unknown", None], dtype=object)
+    places = np.array(["Bangalore", "Pune, MH", "Indore", "New Delhi", "Kochi", None], dtype=object)
+    for offset in range(0, rows, part):
+        jobid = rng.integers(0, int(rows * 0.9), min(part, rows - offset))
+        df = pd.DataFrame({
+            "jobid": jobid,
+            "jobtitle": titles[jobid % len(titles)],
+            "skills": skills[jobid // 7 % len(skills)],
+            "joblocation_address": places[jobid // 3 % len(places)],
+            "payrate": np.where(jobid % 7 == 0, np.nan, (jobid % 38 + 2) * 1e5),
+            "numberofpositions": np.where(jobid % 5 == 0, np.nan, jobid % 9 + 1)
+        })
+        df.to_csv(path, mode="w" if offset == 0 else "a", header=offset == 0, index=False)
+
+
+def run(mode, raw_path, out_path):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, mode, raw_path, out_path, str(CHUNK_SIZE)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    tmp = tempfile.mkdtemp(prefix="jobai_clean_")
+    try:
+        raw_path = os.path.join(tmp, "raw.csv")
+        write_scrape(raw_path, ROWS)
+        size_mb = os.path.getsize(raw_path) / 1e6
+
+        results = {}
+        for mode in ("in-memory", "streaming"):
+            out_path = os.path.join(tmp, f"{mode}.csv")
+            results[mode] = run(mode, raw_path, out_path)
+        with open(os.path.join(tmp, "in-memory.csv")) as a, open(os.path.join(tmp, "streaming.csv")) as b:
+            identical = a.read() == b.read()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"\n⏱️ RAW → CLEAN ({ROWS:,} rows, {size_mb:.0f} MB CSV, chunks of {CHUNK_SIZE:,})")
+    print("=" * 48)
+    print(f"{'mode':<12} | {'seconds':>8} | {'peak RSS MB':>11}")
+    print("-" * 48)
+    for mode, r in results.items():
+        print(f"{mode:<12} | {r['seconds']:>8.2f} | {r['peak_rss_mb']:>11.1f}")
+    print("-" * 48)
+    print(f"Identical output: {identical}")
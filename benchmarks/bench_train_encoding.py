@@ -0,0 +1,101 @@
+"""
+Benchmark: demand-model training memory and time per encoding mode
+(dense one-hot, sparse CSR one-hot, ordinal codes) on the real 10k-row
+dataset and on a synthetic dataset resampled from it. Every run is a
+fresh interpreter so peak RSS is not polluted by earlier runs.
+
+Command:
+python benchmarks/bench_train_encoding.py [trees] [synthetic_rows]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TREES = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+SYNTHETIC_ROWS = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+
+MODES = ("dense", "sparse", "ordinal")
+
+PROBE = r"""
+import json, os, resource, sys, time
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import f1_score
+from sklearn.pipeline import Pipeline
+
+from src.models.encoding import build_preprocessor
+
+encoding, rows, trees = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+
+df = pd.read_csv(os.path.join("data", "processed", "job_market_analytics_final_with_certificates.csv"))
+df = df.rename(columns={"job_title": "jobtitle"})
+df["skill_count"] = df["required_skills"].str.split(",").str.len()
+df["demand_binary"] = (df["demand_label"] == "High").astype(int)
+df = df[["jobtitle", "location", "experience_level", "industry", "skill_count", "demand_binary"]]
+
+if rows > len(df):
+    idx = np.random.default_rng(0).integers(0, len(df), rows)
+    df = df.iloc[idx].reset_index(drop=True)
+
+X, y = df.drop(columns="demand_binary"), df["demand_binary"]
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+start = time.perf_counter()
+preprocessor = build_preprocessor(encoding)
+encoded = preprocessor.fit_transform(X)
+encode_s = time.perf_counter() - start
+
+if sparse.issparse(encoded):
+    matrix_bytes = encoded.data.nbytes + encoded.indices.nbytes + encoded.indptr.nbytes
+else:
+    matrix_bytes = encoded.nbytes
+
+pipeline = Pipeline([
+    ("preprocessor", build_preprocessor(encoding)),
+    ("model", RandomForestClassifier(
+        n_estimators=trees, max_depth=20, class_weight="balanced",
+        random_state=42, n_jobs=-1
+    ))
+])
+start = time.perf_counter()
+pipeline.fit(X, y)
+fit_s = time.perf_counter() - start
+
+print(json.dumps({
+    "rows": len(X),
+    "columns": encoded.shape[1],
+    "matrix_mb": matrix_bytes / 1e6,
+    "encode_s": encode_s,
+    "fit_s": fit_s,
+    "train_f1": f1_score(y, pipeline.predict(X)),
+    "rss_before_mb": rss_before / 1024,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+}))
+"""
+
+
+def run(encoding, rows):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, encoding, str(rows), str(TREES)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    print(f"\n⏱️ TRAINING BY ENCODING MODE ({TREES} trees, max_depth=20)")
+    for label, rows in (("real dataset", 0), ("synthetic", SYNTHETIC_ROWS)):
+        print("=" * 88)
+        print(f"{label:<12} | {'mode':<8} | {'rows':>9} | {'cols':>4} | {'matrix MB':>9} | "
+              f"{'fit s':>7} | {'peak RSS MB':>11} | {'F1':>6}")
+        print("-" * 88)
+        for mode in MODES:
+            r = run(mode, rows)
+            print(f"{'':<12} | {mode:<8} | {r['rows']:>9,} | {r['columns']:>4} | "
+                  f"{r['matrix_mb']:>9.1f} | {r['encode_s'] + r['fit_s']:>7.2f} | "
+                  f"{r['peak_rss_mb']:>11.1f} | {r['train_f1']:>6.3f}")
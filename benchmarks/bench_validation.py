@@ -0,0 +1,63 @@
+"""
+Benchmark: statistical validation, two sequential cross_val_score
+passes (preprocessor refitted in every fold of both pipelines) vs the
+cached-fold engine (one encoding per fold, model fits in a process
+pool), plus the cost of repeated k-fold.
+
+Command:
+python benchmarks/bench_validation.py [repeats]
+"""
+
+import os
+import sys
+import time
+
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import cross_val_score
+from sklearn.pipeline import Pipeline
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.data_pipeline.feature_store import FEATURE_COLUMNS, load_features  # noqa: E402
+from src.models.encoding import build_preprocessor  # noqa: E402
+from src.models.fold_validation import paired_ttest, validate_models  # noqa: E402
+
+REPEATS = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+
+def make_models():
+    return {
+        "baseline": RandomForestClassifier(n_estimators=100, random_state=42),
+        "tuned": RandomForestClassifier(n_estimators=200, random_state=42)
+    }
+
+
+if __name__ == "__main__":
+    df = load_features()
+    X, y = df[FEATURE_COLUMNS], df["demand_label"]
+    preprocessor = build_preprocessor()
+
+    start = time.perf_counter()
+    for model in make_models().values():
+        cross_val_score(Pipeline([("preprocessor", preprocessor), ("model", model)]),
+                        X, y, cv=3, scoring="f1_weighted")
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = validate_models(make_models(), preprocessor, X, y, n_splits=3)
+    engine = time.perf_counter() - start
+
+    start = time.perf_counter()
+    repeated = validate_models(make_models(), preprocessor, X, y, n_splits=3, n_repeats=REPEATS)
+    engine_repeated = time.perf_counter() - start
+
+    print(f"\n⏱️ STATISTICAL VALIDATION ({os.cpu_count()} CPU)")
+    print("=" * 64)
+    print(f"2 x cross_val_score (3 folds)       : {sequential:>7.2f}s")
+    print(f"cached folds + pool (3 folds)       : {engine:>7.2f}s")
+    print(f"cached folds + pool (3 x {REPEATS} repeats) : {engine_repeated:>7.2f}s")
+    print("-" * 64)
+    print(f"p-value, 3 paired samples           : {paired_ttest(results, 'tuned', 'baseline').pvalue:.4f}")
+    print(f"p-value, {3 * REPEATS} paired samples           : "
+          f"{paired_ttest(repeated, 'tuned', 'baseline').pvalue:.4f}")
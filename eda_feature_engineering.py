@@ -1,6 +1,5 @@
-import pandas as pd
 import os
-import joblib
+import sys
 
 # 🔧 Disable GUI backend (prevents Tkinter issues)
 import matplotlib
@@ -11,6 +10,10 @@ import matplotlib.pyplot as plt
 # PROJECT ROOT
 # ===============================
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.data_pipeline.feature_store import engineered_output, load_features  # noqa: E402
 
 # ===============================
 # PATHS
@@ -37,11 +40,9 @@ if not os.path.exists(DATA_PATH):
     print("❌ Dataset not found!")
     exit(1)
 
-df = pd.read_csv(DATA_PATH)
-df.fillna("Unknown", inplace=True)
-
-# Normalize column names
-df.columns = [c.lower() for c in df.columns]
+# Normalized columns, "Unknown" for missing values, skill_count and
+# certificate_count come from the shared feature store
+df = load_features(DATA_PATH)
 
 print("✅ Dataset loaded:", df.shape)
 
@@ -77,22 +78,15 @@ plt.close()
 # ---------- FEATURE ENGINEERING ----------
 # ===============================
 
-# Skill count (USED BY MODEL)
-df["skill_count"] = df["required_skills"].apply(
-    lambda x: len(str(x).split(",")) if x != "Unknown" else 0
-)
-
-# ⚠️ Certificate count is NOT used by model
-# Keep it only for analysis (optional)
-if "certificates" in df.columns:
-    df["certificate_count"] = df["certificates"].apply(
-        lambda x: len(str(x).split(",")) if x != "Unknown" else 0
-    )
+# Skill count (USED BY MODEL) and certificate count (analysis only)
+# are computed once in src/data_pipeline/feature_store.py
 
 # ===============================
 # ---------- SAVE CLEAN DATA ----------
 # ===============================
-df.to_csv(OUTPUT_PATH, index=False)
+# Same columns as before the feature store (job_title, no demand_binary);
+# posting_date is parsed by the shared schema, so write it back day-first
+engineered_output(df).to_csv(OUTPUT_PATH, index=False, date_format="%d-%m-%Y")
 
 print("\n✅ Feature-engineered dataset saved to:")
 print(OUTPUT_PATH)
@@ -1,19 +1,22 @@
 """
 MAIN EXECUTION FILE – REVIEW 2
 Runs:
-1. Baseline models
-2. Advanced model + hyperparameter tuning
-3. Statistical validation
-4. Business optimization
-5. Interactive prediction demo (INPUT → OUTPUT)
+1. Feature store build, then in parallel:
+   EDA, baseline models, advanced model + hyperparameter tuning
+2. Statistical validation (needs the trained model)
+3. Business optimization
+4. Interactive prediction demo (INPUT → OUTPUT)
+
+Stages 1-3 run in this process through src/pipeline/runner.py and are
+skipped when their script, inputs and outputs are unchanged since the
+last run (--force reruns everything).
 
 Command:
-python main.py
+python main.py [--force] [--workers N] [--dry-run]
 """
 
 import os
 import sys
-import subprocess
 
 # ===============================
 # FORCE SAFE NON-GUI MODE
@@ -25,50 +28,29 @@ os.environ["SHOW_PLOTS"] = "0"
 # PROJECT ROOT
 # ===============================
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.pipeline.runner import failed, parse_args, print_report, run_pipeline  # noqa: E402
 
-def run_step(title, script_path):
-    print("\n" + "=" * 70)
-    print(f"▶ {title}")
-    print("=" * 70)
-    subprocess.run([sys.executable, script_path], check=True)
+args = parse_args()
 
 print("\n🚀 JOB MARKET ANALYTICS – REVIEW 2")
 print("=" * 70)
 
 # ===============================
-# STEP 1: BASELINE MODELS
-# ===============================
-run_step(
-    "Review-2 Point 2: Baseline Model Comparison",
-    os.path.join(PROJECT_ROOT, "src", "models", "baseline_models.py")
-)
-
-# ===============================
-# STEP 2: ADVANCED MODEL + HYPERPARAMETER TUNING
-# ===============================
-run_step(
-    "Review-2 Point 3 & 4: Advanced Model + Hyperparameter Tuning",
-    os.path.join(PROJECT_ROOT, "src", "models", "train_demand_model.py")
-)
-
-# ===============================
-# STEP 3: STATISTICAL VALIDATION
+# STEPS 1-3: PIPELINE STAGES
 # ===============================
-run_step(
-    "Review-2 Point 6: Statistical Validation",
-    os.path.join(PROJECT_ROOT, "src", "models", "statistical_validation.py")
-)
+rows, total = run_pipeline(max_workers=args.workers, force=args.force, dry_run=args.dry_run)
+print_report(rows, total)
 
-# ===============================
-# STEP 4: BUSINESS OPTIMIZATION
-# ===============================
-run_step(
-    "Review-2 Point 7: Business Optimization",
-    os.path.join(PROJECT_ROOT, "src", "models", "business_optimization.py")
-)
+if failed(rows):
+    raise SystemExit(f"❌ Failed stages: {', '.join(failed(rows))}")
+if args.dry_run:
+    raise SystemExit(0)
 
 # ===============================
-# STEP 5: LIVE INPUT → OUTPUT DEMO
+# STEP 4: LIVE INPUT → OUTPUT DEMO
 # ===============================
 print("\n" + "=" * 70)
 print("▶ Review-2 Point 5: Model Interpretation (INPUT → OUTPUT)")
@@ -1,8 +1,14 @@
-import pandas as pd
+import os
+import sys
 
-df = pd.read_csv(
-    "data/processed/job_market_analytics_final_with_certificates.csv"
-)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.data_pipeline.columnar_store import load_dataset  # noqa: E402
+
+# Categoricals, parsed dates and downcast numerics (shared schema)
+df = load_dataset("analytics")
 
 print("Dataset Shape:", df.shape)
 print("\nData Info:")
@@ -1,12 +1,18 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.data_pipeline.columnar_store import load_dataset  # noqa: E402
 
 # ===============================
 # LOAD CLEAN DATA
 # ===============================
-DATA_PATH = "data/processed/job_market_clean.csv"
-df = pd.read_csv(DATA_PATH)
+# Only the three columns plotted below (columnar copy when available)
+df = load_dataset("clean", columns=["job_title", "location", "demand_label"])
 
 # Create output folder
 os.makedirs("results/plots", exist_ok=True)
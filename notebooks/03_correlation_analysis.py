@@ -1,12 +1,18 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.data_pipeline.columnar_store import load_dataset  # noqa: E402
 
 # ===============================
 # LOAD CLEAN DATA
 # ===============================
-df = pd.read_csv("data/processed/job_market_clean.csv")
+df = load_dataset("clean", columns=["required_skills", "demand_label"])
 
 # ===============================
 # FEATURE ENGINEERING (LOCAL)
@@ -23,7 +29,8 @@ demand_map = {
     "Medium": 2,
     "High": 3
 }
-df["demand_numeric"] = df["demand_label"].map(demand_map)
+# demand_label is categorical, so map() returns categories; make them numbers
+df["demand_numeric"] = df["demand_label"].map(demand_map).astype(float)
 
 # ===============================
 # SELECT NUMERIC FEATURES
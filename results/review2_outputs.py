@@ -4,6 +4,7 @@ HYBRID ML + RULE-BASED (BINARY DEMAND)
 """
 
 import os
+import sys
 import pandas as pd
 import joblib
 import numpy as np
@@ -33,7 +34,11 @@ def show_or_save(name):
 # ===============================
 # PATH SETUP
 # ===============================
-PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.data_pipeline.feature_store import FEATURE_COLUMNS, load_features  # noqa: E402
 
 DATA_PATH = os.path.join(
     PROJECT_ROOT, "data", "processed",
@@ -45,60 +50,29 @@ MODEL_PATH = os.path.join(
     "job_demand_model.pkl"
 )
 
+# Written by src/models/baseline_models.py; the tracked table is the
+# fallback until that script has been run
 RESULTS_PATH = os.path.join(
-    PROJECT_ROOT, "results",
-    "baseline_results.csv"
+    PROJECT_ROOT, "results", "reports",
+    "baseline_comparison.csv"
 )
+if not os.path.exists(RESULTS_PATH):
+    RESULTS_PATH = os.path.join(
+        PROJECT_ROOT, "results",
+        "baseline_results.csv"
+    )
 
 # ===============================
 # LOAD ARTIFACTS
 # ===============================
 print("\n🔹 Loading Review-2 Artifacts")
 
-df = pd.read_csv(DATA_PATH)
+df = load_features(DATA_PATH)
 model = joblib.load(MODEL_PATH)
 results_df = pd.read_csv(RESULTS_PATH)
 
-df.columns = df.columns.str.lower()
-
-# ===============================
-# COLUMN NORMALIZATION
-# ===============================
-COLUMN_MAP = {
-    "job_title": "jobtitle",
-    "jobrole": "jobtitle",
-    "job_role": "jobtitle",
-    "city": "location",
-    "experience": "experience_level",
-}
-
-df.rename(
-    columns={k: v for k, v in COLUMN_MAP.items() if k in df.columns},
-    inplace=True
-)
-
-# ===============================
-# FEATURE ENGINEERING
-# ===============================
-df["skill_count"] = df["required_skills"].fillna("Unknown").apply(
-    lambda x: len(str(x).split(",")) if x != "Unknown" else 0
-)
-
-# ===============================
-# NUMERIC BINARY TARGET
-# ===============================
-df["demand_binary"] = df["demand_label"].apply(
-    lambda x: 1 if x == "High" else 0
-)
-
-FEATURE_COLUMNS = [
-    "jobtitle",
-    "location",
-    "experience_level",
-    "industry",
-    "skill_count"
-]
-
+# Column normalization, skill_count and the numeric binary target
+# (demand_binary) come from the shared feature store
 X = df[FEATURE_COLUMNS]
 y = df["demand_binary"]
 
@@ -106,6 +80,7 @@ print("\n📊 DATASET SUMMARY")
 print(y.value_counts())
 
 print("\n📈 BASELINE MODEL COMPARISON")
+print("Source:", os.path.relpath(RESULTS_PATH, PROJECT_ROOT))
 print(results_df)
 
 # ===============================
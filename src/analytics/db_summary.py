@@ -1,18 +1,89 @@
-import sqlite3
 import os
-import pandas as pd
+import sys
 
 # ===============================
 # PATH SETUP
 # ===============================
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-DB_PATH = os.path.join(BASE_DIR, "jobai.db")
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
 
-def get_db_connection():
-    return sqlite3.connect(DB_PATH)
+from src.database.connection import db  # noqa: E402
 
-def show_db_summary():
-    conn = get_db_connection()
+# ===============================
+# ROLLUP QUERIES
+# ===============================
+# prediction_rollups is maintained by triggers on every insert, update
+# and delete, so each summary is an index range read, never a
+# predictions scan. Top-N stops after N rows of idx_rollups_count
+# (LIMIT -1 = all rows).
+SELECT_TOP_KEYS = """
+    SELECT key, count, confidence_sum
+    FROM prediction_rollups
+    WHERE dimension = ?
+    ORDER BY count DESC, key
+    LIMIT ?
+"""
+
+# Newest days first; get_dimension puts them back in date order
+SELECT_DAYS = """
+    SELECT key, count, confidence_sum
+    FROM prediction_rollups
+    WHERE dimension = 'day'
+    ORDER BY key DESC
+    LIMIT ?
+"""
+
+SELECT_TOTAL = """
+    SELECT count, confidence_sum
+    FROM prediction_rollups
+    WHERE dimension = 'total' AND key = ''
+"""
+
+DIMENSIONS = ("demand", "jobtitle", "location", "day")
+
+# The day dimension grows by one row per day; summaries show the last N
+SUMMARY_DAYS = int(os.environ.get("JOBAI_SUMMARY_DAYS", 30))
+
+
+def _avg(total, count):
+    return round(total / count, 2) if count else 0.0
+
+
+def get_dimension(dimension, database=db, top=None):
+    limit = top or -1
+    if dimension == "day":
+        rows = database.query(SELECT_DAYS, (limit,))[::-1]
+    else:
+        rows = database.query(SELECT_TOP_KEYS, (dimension, limit))
+    return [
+        {
+            dimension: row["key"],
+            "count": row["count"],
+            "avg_confidence": _avg(row["confidence_sum"], row["count"])
+        }
+        for row in rows
+    ]
+
+
+def get_db_summary(database=db, top=10):
+    total = database.query_one(SELECT_TOTAL) or {"count": 0, "confidence_sum": 0}
+
+    summary = {
+        "total": total["count"],
+        "avg_confidence": _avg(total["confidence_sum"], total["count"]),
+    }
+    limits = {"demand": None, "day": SUMMARY_DAYS}
+    for dimension in DIMENSIONS:
+        summary[dimension] = get_dimension(
+            dimension, database, top=limits.get(dimension, top)
+        )
+    return summary
+
+
+def show_db_summary(database=db):
+    database.init_schema()
+    summary = get_db_summary(database)
 
     print("\n📊 DATABASE ANALYTICS SUMMARY")
     print("=" * 45)
@@ -20,38 +91,39 @@ def show_db_summary():
     # -------------------------------
     # Total Predictions
     # -------------------------------
-    total = pd.read_sql(
-        "SELECT COUNT(*) AS total FROM predictions",
-        conn
-    )
-    print(f"\nTotal Predictions: {total.iloc[0]['total']}")
+    print(f"\nTotal Predictions: {summary['total']}")
+    print(f"Average Confidence: {summary['avg_confidence']}%")
 
     # -------------------------------
     # Demand Distribution
     # -------------------------------
-    dist = pd.read_sql("""
-        SELECT demand, COUNT(*) as count
-        FROM predictions
-        GROUP BY demand
-    """, conn)
-
     print("\nDemand Distribution:")
-    print(dist)
+    for row in summary["demand"]:
+        print(f"  {row['demand'] or '-':<10} {row['count']:>8}  avg conf {row['avg_confidence']}%")
 
     # -------------------------------
-    # Last 10 Predictions
+    # Top Roles / Locations
     # -------------------------------
-    recent = pd.read_sql("""
-        SELECT jobtitle, location, demand, confidence, created_at
-        FROM predictions
-        ORDER BY created_at DESC
-        LIMIT 10
-    """, conn)
+    for dimension, title in (("jobtitle", "Top Roles"), ("location", "Top Locations")):
+        print(f"\n{title}:")
+        for row in summary[dimension]:
+            print(f"  {row[dimension] or '-':<24} {row['count']:>8}")
 
+    # -------------------------------
+    # Last 10 Predictions
+    # -------------------------------
     print("\nLast 10 Predictions:")
-    print(recent)
+    for row in database.recent_predictions(limit=10):
+        confidence = "-" if row["confidence"] is None else row["confidence"]
+        print(
+            f"  {row['jobtitle'] or '-':<24} {row['location'] or '-':<12} "
+            f"{row['demand'] or '-':<8} {confidence:>6}  {row['created_at'] or '-'}"
+        )
 
-    conn.close()
 
 if __name__ == "__main__":
+    if "--rebuild" in sys.argv:
+        db.init_schema()
+        db.rebuild_rollups()
+        print("✅ prediction_rollups rebuilt from predictions")
     show_db_summary()
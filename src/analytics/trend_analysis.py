@@ -1,11 +1,18 @@
-import pandas as pd
 import matplotlib.pyplot as plt
+import os
+import sys
 
-# Load data
-df = pd.read_csv("data/indian_jobs.csv")
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-# Convert date
-df["postdate"] = pd.to_datetime(df["postdate"], errors="coerce")
+from src.data_pipeline import schema  # noqa: E402
+
+# Load data (postdate is parsed by the shared schema; the other
+# columns are never used)
+df = schema.read_csv(
+    "data/indian_jobs.csv", columns=["postdate", "joblocation_address", "skills"]
+)
 df = df.dropna(subset=["postdate"])
 
 # Monthly trend
@@ -23,7 +30,7 @@ plt.savefig("results/job_trend.png")
 plt.show()
 cities = ["bangalore", "hyderabad", "pune", "chennai", "mumbai", "delhi"]
 
-df["joblocation_address"] = df["joblocation_address"].fillna("").str.lower()
+df["joblocation_address"] = df["joblocation_address"].str.lower().fillna("")
 
 plt.figure(figsize=(10,5))
 
@@ -1,10 +1,20 @@
+import argparse
+import numpy as np
 import pandas as pd
 import os
+import re
+import sys
+import time
 
 # ===============================
 # PATH CONFIGURATION
 # ===============================
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from src.data_pipeline.columnar_store import write_parquet  # noqa: E402
 
 RAW_DATA_PATH = os.path.join(
     BASE_DIR, "data", "raw", "indian_jobs.csv"
@@ -15,6 +25,23 @@ CLEAN_DATA_PATH = os.path.join(
 )
 
 
+METRO_CITIES = ["bangalore", "hyderabad", "pune", "chennai", "mumbai", "delhi"]
+
+# One alternation instead of a Python `any(city in x ...)` per row
+METRO_PATTERN = re.compile("|".join(re.escape(city) for city in METRO_CITIES))
+
+TEXT_COLUMNS = ["skills", "joblocation_address"]
+
+# ===============================
+# STREAMING SETTINGS
+# ===============================
+CHUNK_SIZE = 100_000
+
+# Distinct values a median sketch keeps exactly before it starts
+# merging neighbouring values into equal-weight bins
+MAX_SKETCH_BINS = 100_000
+
+
 # ===============================
 # CLEANING PIPELINE
 # ===============================
@@ -27,16 +54,25 @@ def clean_job_data(df: pd.DataFrame) -> pd.DataFrame:
     # Remove duplicate records
     df = df.drop_duplicates()
 
+    medians = {col: df[col].median() for col in df.columns if df[col].dtype != "object"}
+    return clean_rows(df, medians)
+
+
+def clean_rows(df: pd.DataFrame, medians: dict) -> pd.DataFrame:
+    """
+    Missing values and text normalization for already deduplicated
+    rows, with numeric gaps filled from precomputed column medians.
+    """
+
     # Handle missing values
     for col in df.columns:
         if df[col].dtype == "object":
             df[col] = df[col].fillna("Unknown")
         else:
-            df[col] = df[col].fillna(df[col].median())
+            df[col] = df[col].fillna(medians[col])
 
     # Normalize text columns
-    text_cols = ["skills", "joblocation_address"]
-    for col in text_cols:
+    for col in TEXT_COLUMNS:
         if col in df.columns:
             df[col] = df[col].astype(str).str.lower().str.strip()
 
@@ -49,35 +85,189 @@ def clean_job_data(df: pd.DataFrame) -> pd.DataFrame:
 def feature_engineering(df: pd.DataFrame) -> pd.DataFrame:
     """
     Feature engineering for job market analysis.
+    Scraped skills and addresses repeat heavily, so each feature is
+    computed once per distinct value and broadcast back to the rows.
     """
 
-    # Skill count feature
-    df["skill_count"] = df["skills"].apply(
-        lambda x: len(x.split(",")) if x != "unknown" else 0
-    )
+    # Skill count feature: commas + 1, "unknown" means no skills
+    codes, skills = pd.factorize(df["skills"], use_na_sentinel=False)
+    skill_counts = np.where(skills == "unknown", 0, skills.str.count(",") + 1)
+    df["skill_count"] = skill_counts[codes]
 
     # Location tier feature
-    metros = ["bangalore", "hyderabad", "pune", "chennai", "mumbai", "delhi"]
-
-    df["location_tier"] = df["joblocation_address"].apply(
-        lambda x: "Metro" if any(city in x for city in metros) else "Non-Metro"
-    )
+    codes, addresses = pd.factorize(df["joblocation_address"], use_na_sentinel=False)
+    tiers = np.where(addresses.str.contains(METRO_PATTERN), "Metro", "Non-Metro")
+    df["location_tier"] = tiers.astype(object)[codes]
 
     return df
 
 
+# ===============================
+# STREAMING MODE
+# ===============================
+class QuantileSketch:
+    """
+    Mergeable median summary for one numeric column. Keeps exact value
+    counts while there are at most max_bins distinct values, then
+    merges neighbours into equal-weight bins (each represented by its
+    weighted mean), which bounds the median's rank error to about
+    2 / max_bins of the rows.
+    """
+
+    def __init__(self, max_bins=MAX_SKETCH_BINS):
+        self.max_bins = max_bins
+        self.counts = pd.Series(dtype="float64")
+        self.exact = True
+
+    def update(self, values):
+        counts = pd.Series(values, dtype="float64").value_counts()
+        if counts.empty:
+            return
+        self.counts = self.counts.add(counts, fill_value=0)
+        if len(self.counts) > self.max_bins:
+            self._compact()
+
+    def _compact(self):
+        counts = self.counts.sort_index()
+        keys = counts.index.to_numpy()
+        weights = counts.to_numpy()
+
+        bins = self.max_bins // 2
+        group = ((np.cumsum(weights) - weights) / weights.sum() * bins).astype(int)
+        totals = np.bincount(group, weights=weights)
+        means = np.bincount(group, weights=keys * weights)
+
+        used = totals > 0
+        self.counts = pd.Series(totals[used], index=means[used] / totals[used])
+        self.exact = False
+
+    def median(self):
+        if self.counts.empty:
+            return np.nan
+        counts = self.counts.sort_index()
+        cumulative = counts.cumsum().to_numpy()
+        keys = counts.index.to_numpy()
+        n = int(cumulative[-1])
+
+        # Same convention as Series.median: mean of the two middle values
+        low = keys[np.searchsorted(cumulative, (n - 1) // 2 + 1)]
+        high = keys[np.searchsorted(cumulative, n // 2 + 1)]
+        return (low + high) / 2
+
+
+def _merge_dtype(current, dtype):
+    # The dtype read_csv would infer for the column over the whole file
+    if current is None:
+        return dtype
+    if current == object or dtype == object:
+        return np.dtype(object)
+    return np.result_type(current, dtype)
+
+
+def _row_hashes(chunk):
+    # Numbers hash as float64 so a column read as int in one chunk and
+    # as float (because of gaps) in another still matches across chunks
+    numeric = {col: "float64" for col in chunk.columns if chunk[col].dtype.kind in "iub"}
+    return pd.util.hash_pandas_object(chunk.astype(numeric), index=False).to_numpy()
+
+
+def clean_job_data_streaming(raw_path=RAW_DATA_PATH, out_path=CLEAN_DATA_PATH,
+                             chunksize=CHUNK_SIZE, engineer_features=True):
+    """
+    clean_job_data (+ feature_engineering) in two passes over raw_path,
+    holding one chunk at a time.
+    Pass 1 keeps the first occurrence of every row via a set of 64-bit
+    row hashes and feeds the kept numeric values into a QuantileSketch
+    per column. Pass 2 fills, normalizes and appends the kept rows to
+    out_path.
+    """
+    start = time.perf_counter()
+    seen = set()
+    keep_masks = []
+    dtypes = {}
+    sketches = {}
+    rows_in = 0
+
+    # Pass 1: duplicates and medians
+    for chunk in pd.read_csv(raw_path, chunksize=chunksize):
+        rows_in += len(chunk)
+        for col in chunk.columns:
+            dtypes[col] = _merge_dtype(dtypes.get(col), chunk[col].dtype)
+
+        hashes = _row_hashes(chunk)
+        first = np.flatnonzero(~pd.Series(hashes).duplicated().to_numpy())
+        candidates = hashes[first].tolist()
+        fresh = np.fromiter((h not in seen for h in candidates), bool, len(candidates))
+        seen.update(h for h, new in zip(candidates, fresh) if new)
+
+        keep = np.zeros(len(chunk), dtype=bool)
+        keep[first[fresh]] = True
+        keep_masks.append(np.packbits(keep))
+
+        for col in chunk.columns:
+            if chunk[col].dtype != object:
+                sketches.setdefault(col, QuantileSketch()).update(chunk[col].to_numpy()[keep])
+
+    medians = {col: sketches[col].median() for col, dtype in dtypes.items() if dtype != object}
+    unique_rows = len(seen)
+    del seen
+
+    # Pass 2: clean and append
+    tmp_path = out_path + ".tmp"
+    rows_out = 0
+    chunks = pd.read_csv(raw_path, chunksize=chunksize)
+    for i, (chunk, mask) in enumerate(zip(chunks, keep_masks)):
+        keep = np.unpackbits(mask, count=len(chunk)).astype(bool)
+        chunk = chunk[keep].astype(dtypes)
+        chunk = clean_rows(chunk, medians)
+        if engineer_features:
+            chunk = feature_engineering(chunk)
+
+        chunk.to_csv(tmp_path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        rows_out += len(chunk)
+
+    if keep_masks:
+        os.replace(tmp_path, out_path)
+
+    return {
+        "rows_in": rows_in,
+        "rows_out": rows_out,
+        "duplicates": rows_in - unique_rows,
+        "chunks": len(keep_masks),
+        "exact_medians": all(s.exact for s in sketches.values()),
+        "seconds": round(time.perf_counter() - start, 2)
+    }
+
+
 # ===============================
 # PIPELINE EXECUTION
 # ===============================
 if __name__ == "__main__":
-    df = pd.read_csv(RAW_DATA_PATH)
-    print("Raw dataset loaded:", df.shape)
+    parser = argparse.ArgumentParser(description="Clean the raw job scrape")
+    parser.add_argument("--stream", action="store_true",
+                        help="process the raw file in bounded-size chunks")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    if args.stream:
+        stats = clean_job_data_streaming(RAW_DATA_PATH, CLEAN_DATA_PATH, args.chunksize)
+        print(f"Streamed {stats['rows_in']} raw rows in {stats['chunks']} chunks "
+              f"({stats['duplicates']} duplicates removed)")
+        print("Clean dataset saved to:", CLEAN_DATA_PATH, f"({stats['rows_out']} rows)")
+        # The columnar copy is built from the CSV on the first load_dataset("clean")
+    else:
+        df = pd.read_csv(RAW_DATA_PATH)
+        print("Raw dataset loaded:", df.shape)
+
+        df = clean_job_data(df)
+        print("Data cleaning completed")
 
-    df = clean_job_data(df)
-    print("Data cleaning completed")
+        df = feature_engineering(df)
+        print("Feature engineering completed")
 
-    df = feature_engineering(df)
-    print("Feature engineering completed")
+        df.to_csv(CLEAN_DATA_PATH, index=False)
+        print("Clean dataset saved to:", CLEAN_DATA_PATH)
 
-    df.to_csv(CLEAN_DATA_PATH, index=False)
-    print("Clean dataset saved to:", CLEAN_DATA_PATH)
+        parquet = write_parquet(CLEAN_DATA_PATH, df)
+        if parquet:
+            print("Columnar copy saved to:", parquet)
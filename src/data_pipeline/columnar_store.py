@@ -0,0 +1,102 @@
+import argparse
+import importlib.util
+import os
+import sys
+import time
+
+import pandas as pd
+
+# ===============================
+# PATH CONFIGURATION
+# ===============================
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from src.data_pipeline import schema  # noqa: E402
+
+PROCESSED_DIR = os.path.join(BASE_DIR, "data", "processed")
+
+DATASETS = {
+    "analytics": os.path.join(PROCESSED_DIR, "job_market_analytics_final_with_certificates.csv"),
+    "clean": os.path.join(PROCESSED_DIR, "job_market_clean.csv"),
+    "features": os.path.join(PROCESSED_DIR, "job_market_features_engineered.csv"),
+}
+
+# pyarrow is optional: without it every load reads the CSV
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def parquet_path(csv_path):
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+def resolve(dataset):
+    """A DATASETS name or a CSV path."""
+    return DATASETS.get(dataset, dataset)
+
+
+# ===============================
+# WRITE
+# ===============================
+def write_parquet(csv_path, df=None):
+    """
+    Columnar copy of csv_path next to it (same name, .parquet) in the
+    shared schema: schema.CATEGORICAL_COLUMNS dictionary-encoded, dates
+    as timestamps, downcast numerics. Pass the frame that was just
+    written to skip re-reading the CSV. Returns the path, or None when
+    pyarrow is not installed.
+    """
+    if not HAS_PYARROW:
+        return None
+
+    df = schema.read_csv(csv_path) if df is None else schema.apply_schema(df)
+
+    path = parquet_path(csv_path)
+    tmp_path = path + ".tmp"
+    df.to_parquet(tmp_path, engine="pyarrow", index=False, compression="snappy")
+    os.replace(tmp_path, path)
+    return path
+
+
+def is_fresh(csv_path):
+    path = parquet_path(csv_path)
+    return os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(csv_path)
+
+
+# ===============================
+# SHARED LOADER
+# ===============================
+def load_dataset(dataset="analytics", columns=None, rebuild=False):
+    """
+    Load a processed dataset, reading only `columns` (all if None).
+    Uses the Parquet copy when pyarrow is available, (re)building it
+    when it is missing or older than the CSV; otherwise reads the CSV
+    with the same schema (see src/data_pipeline/schema.py).
+    """
+    csv_path = resolve(dataset)
+
+    if HAS_PYARROW:
+        if rebuild or not is_fresh(csv_path):
+            write_parquet(csv_path)
+        return pd.read_parquet(parquet_path(csv_path), engine="pyarrow", columns=columns)
+
+    return schema.read_csv(csv_path, columns)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write Parquet copies of the processed datasets")
+    parser.add_argument("datasets", nargs="*", default=list(DATASETS),
+                        help="dataset names or CSV paths (default: all)")
+    args = parser.parse_args()
+
+    if not HAS_PYARROW:
+        raise SystemExit("❌ pyarrow is not installed (pip install -r requirements.txt)")
+
+    for dataset in args.datasets:
+        start = time.perf_counter()
+        path = write_parquet(resolve(dataset))
+        csv_mb = os.path.getsize(resolve(dataset)) / 1e6
+        parquet_mb = os.path.getsize(path) / 1e6
+        print(f"✅ {os.path.basename(path)}: {csv_mb:.2f} MB CSV → {parquet_mb:.2f} MB "
+              f"({time.perf_counter() - start:.2f}s)")
@@ -0,0 +1,150 @@
+import hashlib
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+# ===============================
+# PATH CONFIGURATION
+# ===============================
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from src.data_pipeline import schema  # noqa: E402
+
+DATA_PATH = os.path.join(
+    BASE_DIR, "data", "processed",
+    "job_market_analytics_final_with_certificates.csv"
+)
+
+STORE_DIR = os.path.join(BASE_DIR, "data", "features")
+
+KEY_LENGTH = 16
+
+# ===============================
+# SHARED SCHEMA
+# ===============================
+COLUMN_MAP = {
+    "job_title": "jobtitle",
+    "jobrole": "jobtitle",
+    "job_role": "jobtitle",
+    "city": "location",
+    "experience": "experience_level",
+    "skills": "required_skills"
+}
+
+CATEGORICAL_COLUMNS = ["jobtitle", "location", "experience_level", "industry"]
+FEATURE_COLUMNS = CATEGORICAL_COLUMNS + ["skill_count"]
+
+
+# ===============================
+# FEATURE ENGINEERING
+# ===============================
+def count_items(series: pd.Series) -> pd.Series:
+    """Comma-separated item count, 0 for "Unknown" (vectorized)."""
+    text = series.astype(str)
+    counts = text.str.count(",") + 1
+    return counts.where(text != "Unknown", 0).astype("int64")
+
+
+def build_features(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalized frame used by every training and evaluation script:
+    lower-cased and renamed columns, missing text and categories as
+    "Unknown", skill_count, certificate_count and the binary
+    High-demand target. Dtypes from the shared schema are kept.
+    """
+    df = df.copy()
+    df.columns = df.columns.str.lower()
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            if df[col].isna().any():
+                df[col] = df[col].cat.add_categories("Unknown").fillna("Unknown")
+        elif df[col].dtype == object:
+            df[col] = df[col].replace([np.inf, -np.inf], np.nan).fillna("Unknown")
+
+    df = df.rename(columns={k: v for k, v in COLUMN_MAP.items() if k in df.columns})
+
+    df["skill_count"] = count_items(df["required_skills"])
+    if "certificates" in df.columns:
+        df["certificate_count"] = count_items(df["certificates"])
+
+    # High → 1, Not High → 0
+    df["demand_binary"] = (df["demand_label"] == "High").astype("int64")
+    return df
+
+
+def engineered_output(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Feature frame in the layout of data/processed/job_market_features_engineered.csv:
+    the source's job_title column name and no demand_binary target.
+    """
+    return df.drop(columns=["demand_binary"]).rename(columns={"jobtitle": "job_title"})
+
+
+# ===============================
+# ARTIFACT CACHE
+# ===============================
+# (path, size, mtime_ns) -> key, so a cache hit does not re-read the CSV
+_KEYS = {}
+
+
+def feature_key(csv_path=DATA_PATH):
+    """Hash of the source CSV and of this module's and the schema's code."""
+    stat = os.stat(csv_path)
+    cache_key = (os.path.abspath(csv_path), stat.st_size, stat.st_mtime_ns)
+    if cache_key in _KEYS:
+        return _KEYS[cache_key]
+
+    h = hashlib.sha1()
+    for module_path in (__file__, schema.__file__):
+        with open(module_path, "rb") as f:
+            h.update(f.read())
+    with open(csv_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    key = _KEYS[cache_key] = h.hexdigest()[:KEY_LENGTH]
+    return key
+
+
+def artifact_path(csv_path=DATA_PATH, key=None, store_dir=STORE_DIR):
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(store_dir, f"{stem}-{key or feature_key(csv_path)}.pkl")
+
+
+def load_features(csv_path=DATA_PATH, rebuild=False, store_dir=STORE_DIR):
+    """
+    Return the feature frame for csv_path, building and persisting it
+    on the first call; later calls unpickle the typed artifact.
+    """
+    path = artifact_path(csv_path, store_dir=store_dir)
+    if not rebuild and os.path.exists(path):
+        return pd.read_pickle(path)
+
+    df = build_features(schema.read_csv(csv_path))
+
+    os.makedirs(store_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+    # Drop artifacts built from older versions of the same CSV only;
+    # "jobs-extra.csv" must not match the "jobs-" prefix of "jobs.csv"
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    stale = re.compile(rf"^{re.escape(stem)}-[0-9a-f]{{{KEY_LENGTH}}}\.pkl$")
+    for name in os.listdir(store_dir):
+        if stale.match(name) and name != os.path.basename(path):
+            os.remove(os.path.join(store_dir, name))
+
+    return df
+
+
+if __name__ == "__main__":
+    # python src/data_pipeline/feature_store.py [--rebuild]
+    features = load_features(rebuild="--rebuild" in sys.argv)
+    print("✅ Feature store:", artifact_path())
+    print("Rows   :", len(features))
+    print("Columns:", list(features.columns))
@@ -0,0 +1,97 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# ===============================
+# SHARED SCHEMA
+# ===============================
+# Low-cardinality text columns (tens of distinct values in 10k+ rows)
+# are loaded as categoricals instead of one Python string per row.
+# Raw-scrape free text (joblocation_address, skills) stays object dtype.
+CATEGORICAL_COLUMNS = [
+    "job_title", "company", "industry", "location",
+    "experience_level", "demand_label"
+]
+
+# posting_date is day-first in the analytics CSVs and ISO in the clean
+# one; the raw scrape's postdate falls through to pandas' inference
+DATE_COLUMNS = ["posting_date", "postdate"]
+DATE_FORMATS = ["%d-%m-%Y", "%Y-%m-%d"]
+
+
+def parse_dates(series: pd.Series) -> pd.Series:
+    """First DATE_FORMATS entry that parses every value, else coerce."""
+    for fmt in DATE_FORMATS:
+        try:
+            return pd.to_datetime(series, format=fmt)
+        except (ValueError, TypeError):
+            continue
+    return pd.to_datetime(series, errors="coerce")
+
+
+def downcast(series: pd.Series) -> pd.Series:
+    """Smallest integer type that holds the values; floats to float32."""
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    if pd.api.types.is_integer_dtype(series):
+        return pd.to_numeric(series, downcast="integer")
+    if pd.api.types.is_float_dtype(series):
+        return pd.to_numeric(series, downcast="float")
+    return series
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Categoricals, parsed dates and downcast numerics, in place of CSV defaults."""
+    df = df.copy()
+    for col in df.columns:
+        if col in CATEGORICAL_COLUMNS:
+            df[col] = df[col].astype("category")
+        elif col in DATE_COLUMNS:
+            df[col] = parse_dates(df[col])
+        else:
+            df[col] = downcast(df[col])
+    return df
+
+
+def read_csv(path, columns=None, **kwargs) -> pd.DataFrame:
+    """pd.read_csv with the shared schema (and usecols=columns)."""
+    header = pd.read_csv(path, nrows=0).columns if columns is None else columns
+    dtype = {col: "category" for col in CATEGORICAL_COLUMNS if col in header}
+    return apply_schema(pd.read_csv(path, usecols=columns, dtype=dtype, **kwargs))
+
+
+# ===============================
+# MEMORY REPORT
+# ===============================
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """Per-column dtype and deep memory (MB) of two loads of the same data."""
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "mb_before": before.memory_usage(deep=True, index=False) / 1e6,
+        "dtype_after": after.dtypes.astype(str),
+        "mb_after": after.memory_usage(deep=True, index=False) / 1e6
+    })
+    report.loc["TOTAL"] = ["", report["mb_before"].sum(), "", report["mb_after"].sum()]
+    report["reduction"] = 1 - report["mb_after"] / report["mb_before"]
+    return report.round({"mb_before": 2, "mb_after": 2, "reduction": 3})
+
+
+if __name__ == "__main__":
+    # python src/data_pipeline/schema.py [csv_path] [rows]
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        BASE_DIR, "data", "processed", "job_market_analytics_final_with_certificates.csv"
+    )
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    before = pd.read_csv(path)
+    after = read_csv(path)
+    if rows > len(before):
+        idx = np.random.default_rng(0).integers(0, len(before), rows)
+        before = before.iloc[idx].reset_index(drop=True)
+        after = after.iloc[idx].reset_index(drop=True)
+
+    print(f"📦 Memory by column, {len(before):,} rows of {os.path.basename(path)}")
+    print(memory_report(before, after).to_string())
@@ -0,0 +1,455 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# ===============================
+# PATH SETUP
+# ===============================
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DB_PATH = os.environ.get("JOBAI_DB_PATH", os.path.join(BASE_DIR, "jobai.db"))
+
+# ===============================
+# CONNECTION TUNING
+# ===============================
+# WAL lets /history readers run while /predict writes, and
+# synchronous=NORMAL only fsyncs on checkpoint instead of every commit.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA mmap_size=134217728",
+    "PRAGMA busy_timeout=5000",
+)
+
+STATEMENT_CACHE_SIZE = 128
+
+# Idle connections kept open for reuse; busier moments open extra
+# connections that are closed again when they are returned
+POOL_SIZE = int(os.environ.get("JOBAI_DB_POOL_SIZE", 8))
+
+# ===============================
+# SCHEMA
+# ===============================
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS predictions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        jobtitle TEXT,
+        location TEXT,
+        experience_level TEXT,
+        industry TEXT,
+        skill_count INTEGER,
+        demand TEXT,
+        confidence REAL,
+        created_at TEXT,
+        actual_demand TEXT,
+        labeled_at TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT NOT NULL,
+        password TEXT NOT NULL,
+        created_at TEXT
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users (email)",
+    """
+    CREATE TABLE IF NOT EXISTS sessions (
+        id TEXT PRIMARY KEY,
+        data TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions (expires_at)",
+    # Keyset pagination: every history filter walks one index backwards
+    # from the cursor id instead of sorting the whole table
+    # Nothing orders or filters by created_at any more (summaries read
+    # prediction_rollups), so older databases drop the index it used
+    "DROP INDEX IF EXISTS idx_predictions_created_at",
+    "CREATE INDEX IF NOT EXISTS idx_predictions_demand ON predictions (demand, id)",
+    "CREATE INDEX IF NOT EXISTS idx_predictions_jobtitle ON predictions (jobtitle, id)",
+    "CREATE INDEX IF NOT EXISTS idx_predictions_location ON predictions (location, id)",
+    # Rollups: one row per (dimension, key), kept current by triggers so
+    # summaries never scan the predictions table
+    """
+    CREATE TABLE IF NOT EXISTS prediction_rollups (
+        dimension TEXT NOT NULL,
+        key TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        confidence_sum REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (dimension, key)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_predictions_rollup_insert
+    AFTER INSERT ON predictions
+    BEGIN
+        INSERT INTO prediction_rollups (dimension, key, count, confidence_sum)
+        VALUES
+            ('total', '', 1, COALESCE(NEW.confidence, 0)),
+            ('demand', COALESCE(NEW.demand, ''), 1, COALESCE(NEW.confidence, 0)),
+            ('jobtitle', COALESCE(NEW.jobtitle, ''), 1, COALESCE(NEW.confidence, 0)),
+            ('location', COALESCE(NEW.location, ''), 1, COALESCE(NEW.confidence, 0)),
+            ('day', COALESCE(substr(NEW.created_at, 1, 10), ''), 1, COALESCE(NEW.confidence, 0))
+        ON CONFLICT (dimension, key) DO UPDATE SET
+            count = count + excluded.count,
+            confidence_sum = confidence_sum + excluded.confidence_sum;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_predictions_rollup_delete
+    AFTER DELETE ON predictions
+    BEGIN
+        UPDATE prediction_rollups
+        SET count = count - 1,
+            confidence_sum = confidence_sum - COALESCE(OLD.confidence, 0)
+        WHERE (dimension = 'total' AND key = '')
+           OR (dimension = 'demand' AND key = COALESCE(OLD.demand, ''))
+           OR (dimension = 'jobtitle' AND key = COALESCE(OLD.jobtitle, ''))
+           OR (dimension = 'location' AND key = COALESCE(OLD.location, ''))
+           OR (dimension = 'day' AND key = COALESCE(substr(OLD.created_at, 1, 10), ''));
+        DELETE FROM prediction_rollups WHERE count <= 0 AND dimension != 'total';
+    END
+    """,
+    # An edited row moves its contribution from the OLD keys to the NEW ones
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_predictions_rollup_update
+    AFTER UPDATE OF demand, jobtitle, location, confidence, created_at ON predictions
+    BEGIN
+        UPDATE prediction_rollups
+        SET count = count - 1,
+            confidence_sum = confidence_sum - COALESCE(OLD.confidence, 0)
+        WHERE (dimension = 'total' AND key = '')
+           OR (dimension = 'demand' AND key = COALESCE(OLD.demand, ''))
+           OR (dimension = 'jobtitle' AND key = COALESCE(OLD.jobtitle, ''))
+           OR (dimension = 'location' AND key = COALESCE(OLD.location, ''))
+           OR (dimension = 'day' AND key = COALESCE(substr(OLD.created_at, 1, 10), ''));
+        INSERT INTO prediction_rollups (dimension, key, count, confidence_sum)
+        VALUES
+            ('total', '', 1, COALESCE(NEW.confidence, 0)),
+            ('demand', COALESCE(NEW.demand, ''), 1, COALESCE(NEW.confidence, 0)),
+            ('jobtitle', COALESCE(NEW.jobtitle, ''), 1, COALESCE(NEW.confidence, 0)),
+            ('location', COALESCE(NEW.location, ''), 1, COALESCE(NEW.confidence, 0)),
+            ('day', COALESCE(substr(NEW.created_at, 1, 10), ''), 1, COALESCE(NEW.confidence, 0))
+        ON CONFLICT (dimension, key) DO UPDATE SET
+            count = count + excluded.count,
+            confidence_sum = confidence_sum + excluded.confidence_sum;
+        DELETE FROM prediction_rollups WHERE count <= 0 AND dimension != 'total';
+    END
+    """,
+    # Top-N reads walk this index from the highest count down
+    "CREATE INDEX IF NOT EXISTS idx_rollups_count ON prediction_rollups (dimension, count DESC, key)",
+)
+
+# Observed outcomes for served predictions (the only rows incremental
+# retraining learns from); added to databases created before they existed
+LABEL_COLUMNS = (("actual_demand", "TEXT"), ("labeled_at", "TEXT"))
+LABEL_SCHEMA = (
+    "CREATE INDEX IF NOT EXISTS idx_predictions_labeled_at ON predictions (labeled_at, id)",
+)
+
+# One-off backfill for databases that had predictions before the rollup
+# triggers existed
+REBUILD_ROLLUPS = (
+    "DELETE FROM prediction_rollups",
+    """
+    INSERT INTO prediction_rollups (dimension, key, count, confidence_sum)
+    SELECT 'total', '', COUNT(*), COALESCE(SUM(confidence), 0) FROM predictions
+    UNION ALL
+    SELECT 'demand', COALESCE(demand, ''), COUNT(*), COALESCE(SUM(confidence), 0)
+    FROM predictions GROUP BY 2
+    UNION ALL
+    SELECT 'jobtitle', COALESCE(jobtitle, ''), COUNT(*), COALESCE(SUM(confidence), 0)
+    FROM predictions GROUP BY 2
+    UNION ALL
+    SELECT 'location', COALESCE(location, ''), COUNT(*), COALESCE(SUM(confidence), 0)
+    FROM predictions GROUP BY 2
+    UNION ALL
+    SELECT 'day', COALESCE(substr(created_at, 1, 10), ''), COUNT(*), COALESCE(SUM(confidence), 0)
+    FROM predictions GROUP BY 2
+    """,
+)
+
+# ===============================
+# PREPARED STATEMENTS
+# ===============================
+# Kept as module constants so sqlite3's per-connection statement
+# cache always sees the exact same SQL text and reuses the plan.
+INSERT_PREDICTION = """
+    INSERT INTO predictions
+    (jobtitle, location, experience_level,
+     industry, skill_count, demand, confidence, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
+"""
+
+INSERT_PREDICTION_AT = """
+    INSERT INTO predictions
+    (jobtitle, location, experience_level,
+     industry, skill_count, demand, confidence, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SELECT_RECENT_PREDICTIONS = """
+    SELECT jobtitle, location, experience_level,
+           industry, skill_count, demand,
+           confidence, created_at
+    FROM predictions
+    ORDER BY id DESC
+    LIMIT ?
+"""
+
+HISTORY_COLUMNS = """
+    SELECT id, jobtitle, location, experience_level,
+           industry, skill_count, demand,
+           confidence, created_at
+    FROM predictions
+"""
+
+HISTORY_FILTERS = ("demand", "jobtitle", "location")
+
+# Incremental retraining reads labeled predictions past a
+# (labeled_at, id) watermark; old rows can be labeled at any time
+SELECT_LABELED_AFTER = """
+    SELECT id, jobtitle, location, experience_level,
+           industry, skill_count, actual_demand, labeled_at
+    FROM predictions
+    WHERE labeled_at IS NOT NULL AND actual_demand IS NOT NULL
+      AND (labeled_at, id) > (?, ?)
+    ORDER BY labeled_at, id
+"""
+
+COUNT_LABELED = """
+    SELECT COUNT(*) AS n FROM predictions
+    WHERE labeled_at IS NOT NULL AND actual_demand IS NOT NULL
+"""
+
+LABEL_PREDICTION = """
+    UPDATE predictions
+    SET actual_demand = ?, labeled_at = COALESCE(?, datetime('now'))
+    WHERE id = ?
+"""
+
+
+def prediction_params(data):
+    return (
+        data["jobtitle"],
+        data["location"],
+        data["experience_level"],
+        data["industry"],
+        data["skill_count"],
+        data["demand"],
+        data["confidence"]
+    )
+
+
+# ===============================
+# DATABASE
+# ===============================
+class Database:
+    """
+    Bounded pool of open SQLite connections (per worker process).
+    Every statement checks a connection out and returns it, so request
+    threads share at most POOL_SIZE idle connections instead of
+    reconnecting on every request or keeping one per thread forever.
+    """
+
+    def __init__(self, path=DB_PATH, pool_size=POOL_SIZE):
+        self.path = path
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+        self._idle = []
+        self._pid = os.getpid()
+        self._schema_ready = False
+        self.observer = None
+
+    def connect(self):
+        conn = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def checkout(self):
+        """Borrow a pooled connection for the duration of the block."""
+        # Schema setup is deferred to the first real use of the database
+        if not self._schema_ready:
+            self.init_schema()
+
+        conn = None
+        with self._lock:
+            # A forked worker must not reuse the parent's connections
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._idle = []
+            if self._idle:
+                conn = self._idle.pop()
+        if conn is None:
+            conn = self.connect()
+
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                keep = self._pid == os.getpid() and len(self._idle) < self.pool_size
+                if keep:
+                    self._idle.append(conn)
+            if not keep:
+                conn.close()
+
+    def init_schema(self):
+        if self._schema_ready:
+            return
+
+        with self._lock:
+            if self._schema_ready:
+                return
+            conn = self.connect()
+            try:
+                with conn:
+                    for statement in SCHEMA:
+                        conn.execute(statement)
+
+                    existing = {row["name"] for row in conn.execute("PRAGMA table_info(predictions)")}
+                    for column, sql_type in LABEL_COLUMNS:
+                        if column not in existing:
+                            conn.execute(f"ALTER TABLE predictions ADD COLUMN {column} {sql_type}")
+                    for statement in LABEL_SCHEMA:
+                        conn.execute(statement)
+
+                    has_rollups = conn.execute(
+                        "SELECT 1 FROM prediction_rollups LIMIT 1"
+                    ).fetchone()
+                    has_predictions = conn.execute(
+                        "SELECT 1 FROM predictions LIMIT 1"
+                    ).fetchone()
+                    if has_predictions and not has_rollups:
+                        for statement in REBUILD_ROLLUPS:
+                            conn.execute(statement)
+            finally:
+                conn.close()
+            self._schema_ready = True
+
+    # -------------------------------
+    # STATEMENT HELPERS
+    # -------------------------------
+    def _timed(self, fn, *args):
+        # observer(seconds) is only set when request metrics are enabled
+        if self.observer is None:
+            return fn(*args)
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.observer(time.perf_counter() - start)
+
+    def _execute(self, sql, params):
+        with self.checkout() as conn, conn:
+            return conn.execute(sql, params).rowcount
+
+    def _executemany(self, sql, rows):
+        with self.checkout() as conn, conn:
+            return conn.executemany(sql, rows).rowcount
+
+    def _query(self, sql, params):
+        with self.checkout() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def _query_one(self, sql, params):
+        with self.checkout() as conn:
+            row = conn.execute(sql, params).fetchone()
+        return dict(row) if row is not None else None
+
+    def execute(self, sql, params=()):
+        return self._timed(self._execute, sql, params)
+
+    def executemany(self, sql, rows):
+        return self._timed(self._executemany, sql, rows)
+
+    def query(self, sql, params=()):
+        return self._timed(self._query, sql, params)
+
+    def query_one(self, sql, params=()):
+        return self._timed(self._query_one, sql, params)
+
+    def close_all(self):
+        """Close the idle connections; checked-out ones close on return."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+
+    # -------------------------------
+    # PREDICTIONS
+    # -------------------------------
+    def insert_prediction(self, data):
+        return self.execute(INSERT_PREDICTION, prediction_params(data))
+
+    def rebuild_rollups(self):
+        with self.checkout() as conn, conn:
+            for statement in REBUILD_ROLLUPS:
+                conn.execute(statement)
+
+    def recent_predictions(self, limit=10):
+        return self.query(SELECT_RECENT_PREDICTIONS, (limit,))
+
+    def label_predictions(self, labels):
+        """Record observed outcomes: rows of (id, actual_demand, labeled_at or None)."""
+        return self.executemany(
+            LABEL_PREDICTION, [(actual, labeled_at, pid) for pid, actual, labeled_at in labels]
+        )
+
+    def labeled_count(self):
+        return self.query_one(COUNT_LABELED)["n"]
+
+    def labeled_after(self, labeled_at="", after_id=0):
+        return self.query(SELECT_LABELED_AFTER, (labeled_at, after_id))
+
+    def prediction_page(self, limit=10, before_id=None, **filters):
+        """
+        One keyset page of history, newest first. Returns (rows,
+        next_cursor); pass next_cursor back as before_id for the next
+        page. Cost depends on the page size, not on the offset.
+        """
+        clauses = []
+        params = []
+
+        for column in HISTORY_FILTERS:
+            value = filters.get(column)
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(before_id)
+
+        sql = HISTORY_COLUMNS
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit + 1)
+
+        rows = self.query(sql, params)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1]["id"]
+
+        return rows, next_cursor
+
+
+db = Database()
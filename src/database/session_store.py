@@ -0,0 +1,238 @@
+import json
+import os
+import secrets
+import threading
+import time
+
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+from src.database.connection import db
+
+# ===============================
+# SETTINGS
+# ===============================
+SESSION_BACKEND = os.environ.get("JOBAI_SESSION_BACKEND", "sqlite")
+PURGE_INTERVAL = 300
+# An unmodified session's expiry is only pushed back (one UPDATE) once
+# less than this fraction of the lifetime is left
+TOUCH_FRACTION = 0.5
+
+# ===============================
+# STATEMENTS
+# ===============================
+SELECT_SESSION = "SELECT data, expires_at FROM sessions WHERE id = ? AND expires_at > ?"
+
+UPSERT_SESSION = """
+    INSERT INTO sessions (id, data, expires_at) VALUES (?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        data = excluded.data,
+        expires_at = excluded.expires_at
+"""
+
+TOUCH_SESSION = "UPDATE sessions SET expires_at = ? WHERE id = ?"
+
+DELETE_SESSION = "DELETE FROM sessions WHERE id = ?"
+
+PURGE_SESSIONS = "DELETE FROM sessions WHERE expires_at <= ?"
+
+
+def dumps(data):
+    # Compact JSON keeps the stored prediction state small
+    return json.dumps(data, separators=(",", ":"))
+
+
+# ===============================
+# BACKENDS
+# ===============================
+class SQLiteSessionBackend:
+
+    def __init__(self, database=db):
+        self.database = database
+        self._next_purge = 0.0
+
+    def load_entry(self, sid):
+        """(data, expires_at) of a live session, else None."""
+        row = self.database.query_one(SELECT_SESSION, (sid, time.time()))
+        return (json.loads(row["data"]), row["expires_at"]) if row else None
+
+    def load(self, sid):
+        entry = self.load_entry(sid)
+        return entry[0] if entry else None
+
+    def save(self, sid, data, expires_at):
+        self.database.execute(UPSERT_SESSION, (sid, dumps(data), expires_at))
+        self.purge_expired()
+
+    def touch(self, sid, expires_at):
+        self.database.execute(TOUCH_SESSION, (expires_at, sid))
+
+    def delete(self, sid):
+        self.database.execute(DELETE_SESSION, (sid,))
+
+    def purge_expired(self, force=False):
+        now = time.time()
+        if not force and now < self._next_purge:
+            return 0
+        self._next_purge = now + PURGE_INTERVAL
+        return self.database.execute(PURGE_SESSIONS, (now,))
+
+
+class MemorySessionBackend:
+    """Single-process backend; expired entries are evicted lazily."""
+
+    def __init__(self):
+        self._store = {}
+        self._lock = threading.Lock()
+        self._next_purge = 0.0
+
+    def load_entry(self, sid):
+        """(data, expires_at) of a live session, else None."""
+        with self._lock:
+            entry = self._store.get(sid)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= time.time():
+                del self._store[sid]
+                return None
+        return json.loads(payload), expires_at
+
+    def load(self, sid):
+        entry = self.load_entry(sid)
+        return entry[0] if entry else None
+
+    def save(self, sid, data, expires_at):
+        with self._lock:
+            self._store[sid] = (dumps(data), expires_at)
+        self.purge_expired()
+
+    def touch(self, sid, expires_at):
+        with self._lock:
+            entry = self._store.get(sid)
+            if entry is not None:
+                self._store[sid] = (entry[0], expires_at)
+
+    def delete(self, sid):
+        with self._lock:
+            self._store.pop(sid, None)
+
+    def purge_expired(self, force=False):
+        now = time.time()
+        if not force and now < self._next_purge:
+            return 0
+        self._next_purge = now + PURGE_INTERVAL
+        with self._lock:
+            expired = [sid for sid, (_, exp) in self._store.items() if exp <= now]
+            for sid in expired:
+                del self._store[sid]
+        return len(expired)
+
+
+# ===============================
+# FLASK SESSION INTERFACE
+# ===============================
+def generate_sid():
+    return secrets.token_urlsafe(24)
+
+
+class ServerSession(CallbackDict, SessionMixin):
+
+    def __init__(self, initial=None, sid=None, new=False, expires_at=None):
+        def on_update(self):
+            self.modified = True
+            self.accessed = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid or generate_sid()
+        self.new = new
+        self.expires_at = expires_at
+        self.modified = False
+        self.accessed = False
+        self.stale_sid = None
+
+    # Reads mark the session accessed, so responses get Vary: Cookie
+    def __getitem__(self, key):
+        self.accessed = True
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.accessed = True
+        return super().get(key, default)
+
+    def setdefault(self, key, default=None):
+        self.accessed = True
+        return super().setdefault(key, default)
+
+    def clear(self):
+        # Login and logout both clear the session; hand out a fresh id
+        # so a pre-login id can never be replayed afterwards
+        if not self.new and self.stale_sid is None:
+            self.stale_sid = self.sid
+        self.sid = generate_sid()
+        super().clear()
+
+
+class ServerSessionInterface(SessionInterface):
+    """
+    Keeps session data server-side; the cookie only carries a random
+    opaque id, so page requests stop uploading the prediction state.
+    """
+
+    def __init__(self, backend=None):
+        if backend is None:
+            backend = MemorySessionBackend() if SESSION_BACKEND == "memory" \
+                else SQLiteSessionBackend()
+        self.backend = backend
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            entry = self.backend.load_entry(sid)
+            if entry is not None:
+                data, expires_at = entry
+                return ServerSession(data, sid=sid, expires_at=expires_at)
+        return ServerSession(new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        if session.stale_sid is not None:
+            self.backend.delete(session.stale_sid)
+
+        if not session:
+            if session.modified:
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        if not self.should_set_cookie(app, session):
+            return
+
+        # Sliding expiry: an unmodified session is only touched once it
+        # has used up TOUCH_FRACTION of its lifetime; until then the row
+        # and the cookie already carry a good enough expiry
+        lifetime = app.permanent_session_lifetime.total_seconds()
+        now = time.time()
+        if session.modified:
+            self.backend.save(session.sid, dict(session), now + lifetime)
+        elif session.expires_at is not None and session.expires_at - now > lifetime * TOUCH_FRACTION:
+            return
+        else:
+            self.backend.touch(session.sid, now + lifetime)
+
+        expires = self.get_expiration_time(app, session)
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=expires,
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
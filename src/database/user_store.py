@@ -0,0 +1,167 @@
+import csv
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from src.database.connection import BASE_DIR, db
+
+# ===============================
+# PATH SETUP
+# ===============================
+USERS_CSV_PATH = os.path.join(BASE_DIR, "data", "users.csv")
+
+CACHE_SIZE = int(os.environ.get("JOBAI_USER_CACHE_SIZE", 10000))
+CACHE_TTL = float(os.environ.get("JOBAI_USER_CACHE_TTL", 300))
+
+# ===============================
+# STATEMENTS
+# ===============================
+SELECT_USER = "SELECT email, password FROM users WHERE email = ?"
+
+INSERT_USER = """
+    INSERT INTO users (email, password, created_at)
+    VALUES (?, ?, datetime('now'))
+"""
+
+INSERT_USER_IGNORE = """
+    INSERT OR IGNORE INTO users (email, password, created_at)
+    VALUES (?, ?, datetime('now'))
+"""
+
+DELETE_USER = "DELETE FROM users WHERE email = ?"
+
+COUNT_USERS = "SELECT COUNT(*) AS total FROM users"
+
+
+# ===============================
+# USER STORE
+# ===============================
+class UserStore:
+    """
+    Email-indexed user table with a bounded in-process lookup cache.
+    Only existing users are cached, so a signup never has to chase a
+    stale "not found" entry; writes invalidate the email they touch and
+    the TTL bounds staleness across worker processes.
+    """
+
+    def __init__(self, database=db, cache_size=CACHE_SIZE, cache_ttl=CACHE_TTL):
+        self.database = database
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    # -------------------------------
+    # CACHE
+    # -------------------------------
+    def _cache_get(self, email):
+        with self._lock:
+            entry = self._cache.get(email)
+            if entry is None:
+                return None
+            user, expires = entry
+            if expires < time.monotonic():
+                del self._cache[email]
+                return None
+            self._cache.move_to_end(email)
+            return user
+
+    def _cache_put(self, email, user):
+        if self.cache_size <= 0:
+            return
+        with self._lock:
+            self._cache[email] = (user, time.monotonic() + self.cache_ttl)
+            self._cache.move_to_end(email)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, email=None):
+        with self._lock:
+            if email is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(email, None)
+
+    # -------------------------------
+    # LOOKUPS
+    # -------------------------------
+    def get(self, email):
+        # Same normalization as migrate_from_csv and create
+        email = (email or "").strip()
+        if not email:
+            return None
+
+        user = self._cache_get(email)
+        if user is not None:
+            self.hits += 1
+            return user
+
+        self.misses += 1
+        user = self.database.query_one(SELECT_USER, (email,))
+        if user is not None:
+            self._cache_put(email, user)
+        return user
+
+    def authenticate(self, email, password):
+        user = self.get(email)
+        return user is not None and user["password"] == password
+
+    def count(self):
+        return self.database.query_one(COUNT_USERS)["total"]
+
+    # -------------------------------
+    # WRITES
+    # -------------------------------
+    def create(self, email, password):
+        """Return False when the email is already registered."""
+        email = email.strip()
+        try:
+            self.database.execute(INSERT_USER, (email, password))
+        except sqlite3.IntegrityError:
+            return False
+        finally:
+            self.invalidate(email)
+        return True
+
+    def delete(self, email):
+        self.database.execute(DELETE_USER, (email,))
+        self.invalidate(email)
+
+    # -------------------------------
+    # ONE-SHOT CSV MIGRATION
+    # -------------------------------
+    def migrate_from_csv(self, csv_path=USERS_CSV_PATH, force=False):
+        """
+        Import data/users.csv into the users table. Runs only while the
+        table is empty unless forced. A duplicate email keeps its last
+        (most recently registered) row; existing users are never changed.
+        """
+        if not os.path.exists(csv_path):
+            return 0
+        if not force and self.count() > 0:
+            return 0
+
+        with open(csv_path, newline="") as f:
+            passwords = {
+                row["email"].strip(): row["password"]
+                for row in csv.DictReader(f)
+                if row.get("email")
+            }
+
+        inserted = self.database.executemany(INSERT_USER_IGNORE, list(passwords.items()))
+        self.invalidate()
+        return inserted
+
+
+user_store = UserStore()
+
+if __name__ == "__main__":
+    db.init_schema()
+    migrated = user_store.migrate_from_csv(force=True)
+    print(f"✅ Migrated {migrated} users from {USERS_CSV_PATH}")
+    print(f"📊 Users in table: {user_store.count()}")
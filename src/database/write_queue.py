@@ -0,0 +1,199 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from src.database.connection import INSERT_PREDICTION_AT, prediction_params
+
+# ===============================
+# DEFAULTS
+# ===============================
+BATCH_SIZE = int(os.environ.get("JOBAI_WRITE_BATCH_SIZE", 200))
+FLUSH_INTERVAL = float(os.environ.get("JOBAI_WRITE_FLUSH_INTERVAL", 0.25))
+MAX_QUEUE = int(os.environ.get("JOBAI_WRITE_MAX_QUEUE", 10000))
+
+_STOP = object()
+
+
+def utc_timestamp():
+    # Same text format as SQLite's datetime('now')
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+# ===============================
+# WRITE-BEHIND QUEUE
+# ===============================
+class PredictionWriteQueue:
+    """
+    Accepts prediction records from request handlers and writes them
+    in grouped transactions from a background thread, so /predict
+    never waits on an INSERT + commit.
+    """
+
+    def __init__(self, database, batch_size=BATCH_SIZE,
+                 flush_interval=FLUSH_INTERVAL, max_queue=MAX_QUEUE):
+        self.database = database
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        # Every queued record gets a sequence number; flush() waits for
+        # the last one handed out at call time, not for an empty queue
+        self._submit_lock = threading.Lock()
+        self._written = threading.Condition()
+        self._last_submitted = 0
+        self._last_written = 0
+        self._thread = None
+        self._pid = None
+
+        self.enqueued = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.sync_fallbacks = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+    # -------------------------------
+    # LIFECYCLE
+    # -------------------------------
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() \
+                    and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="prediction-writer",
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout=10.0):
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            print(f"⚠️ prediction writer did not drain its queue within {timeout}s")
+            return
+        thread.join(timeout)
+
+    # -------------------------------
+    # PRODUCER SIDE
+    # -------------------------------
+    def submit(self, data):
+        record = dict(data)
+        record.setdefault("created_at", utc_timestamp())
+
+        self.start()
+        with self._submit_lock:
+            try:
+                self._queue.put_nowait((self._last_submitted + 1, record))
+                self._last_submitted += 1
+                queued = True
+            except queue.Full:
+                queued = False
+
+        if not queued:
+            # Backpressure: fall back to a direct write instead of dropping
+            self.sync_fallbacks += 1
+            self._write([record])
+            return
+        self.enqueued += 1
+
+    def flush(self, timeout=None):
+        """
+        Block until everything submitted so far is on disk (or failed).
+        Records submitted while waiting are not waited for. Returns False
+        if timeout (seconds) ran out or the writer died first.
+        """
+        target = self._last_submitted
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._written:
+            while self._last_written < target:
+                thread = self._thread
+                if thread is None or not thread.is_alive():
+                    return self._last_written >= target
+                wait = 0.1 if deadline is None else min(0.1, deadline - time.monotonic())
+                if wait <= 0:
+                    return False
+                self._written.wait(wait)
+        return True
+
+    # -------------------------------
+    # CONSUMER SIDE
+    # -------------------------------
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=max(remaining, 0)) \
+                        if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._write([record for _, record in batch])
+            with self._written:
+                self._last_written = batch[-1][0]
+                self._written.notify_all()
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+
+            if stop:
+                return
+
+    def _write(self, batch):
+        start = time.perf_counter()
+        try:
+            self.database.executemany(
+                INSERT_PREDICTION_AT,
+                [prediction_params(r) + (r["created_at"],) for r in batch]
+            )
+        except sqlite3.Error as exc:
+            self.failed += len(batch)
+            print(f"⚠️ prediction write failed ({len(batch)} rows): {exc}")
+            return
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.written += len(batch)
+        self.batches += 1
+        self.last_flush_ms = elapsed_ms
+        self.total_flush_ms += elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+
+    # -------------------------------
+    # COUNTERS
+    # -------------------------------
+    def stats(self):
+        return {
+            "queue_depth": self._queue.qsize(),
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+            "sync_fallbacks": self.sync_fallbacks,
+            "avg_batch_size": round(self.written / self.batches, 2) if self.batches else 0.0,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "avg_flush_ms": round(self.total_flush_ms / self.batches, 3) if self.batches else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 3)
+        }
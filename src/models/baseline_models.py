@@ -1,49 +1,27 @@
-import pandas as pd
-import numpy as np
+import os
+import sys
 
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import OneHotEncoder
 from sklearn.compose import ColumnTransformer
-from sklearn.pipeline import Pipeline
-from sklearn.metrics import (
-    accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
-)
 
 from sklearn.linear_model import LogisticRegression
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.ensemble import RandomForestClassifier
 
-print("\n📊 BASELINE MODEL COMPARISON (WITH AUC)\n")
-
 # ===============================
-# LOAD DATA
+# PATH SETUP
 # ===============================
-df = pd.read_csv("data/processed/job_market_analytics_final_with_certificates.csv")
-df.fillna("Unknown", inplace=True)
-df.columns = [c.lower() for c in df.columns]
-
-# 🔑 COLUMN NORMALIZATION (CRITICAL FIX)
-COLUMN_MAP = {
-    "job_title": "jobtitle",
-    "jobrole": "jobtitle",
-    "job_role": "jobtitle",
-    "city": "location",
-    "experience": "experience_level",
-    "skills": "required_skills"
-}
-
-df.rename(
-    columns={k: v for k, v in COLUMN_MAP.items() if k in df.columns},
-    inplace=True
-)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-# ===============================
-# FEATURE ENGINEERING
-# ===============================
-df["skill_count"] = df["required_skills"].apply(
-    lambda x: len(str(x).split(",")) if x != "Unknown" else 0
-)
-df.drop(columns=["required_skills"], inplace=True)
+from src.data_pipeline.feature_store import load_features  # noqa: E402
+from src.models.model_comparison import compare_models  # noqa: E402
+
+# Machine-specific (fit / predict seconds), so written next to the other
+# generated reports rather than over the tracked results/baseline_results.csv
+RESULTS_PATH = os.path.join(PROJECT_ROOT, "results", "reports", "baseline_comparison.csv")
 
 REQUIRED_COLUMNS = [
     "jobtitle",
@@ -54,51 +32,67 @@ REQUIRED_COLUMNS = [
     "demand_label"
 ]
 
-df = df[REQUIRED_COLUMNS]
+categorical_cols = ["jobtitle", "location", "experience_level", "industry"]
+numeric_cols = ["skill_count"]
+
 
-X = df.drop("demand_label", axis=1)
-y = df["demand_label"]
+def main():
+    print("\n📊 BASELINE MODEL COMPARISON (WITH AUC)\n")
 
-# ===============================
-# TRAIN TEST SPLIT
-# ===============================
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, stratify=y, random_state=42
-)
+    # ===============================
+    # LOAD FEATURES (SHARED FEATURE STORE)
+    # ===============================
+    df = load_features()[REQUIRED_COLUMNS]
 
-categorical_cols = ["jobtitle", "location", "experience_level", "industry"]
-numeric_cols = ["skill_count"]
+    X = df.drop("demand_label", axis=1)
+    y = df["demand_label"]
+
+    # ===============================
+    # TRAIN TEST SPLIT
+    # ===============================
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, stratify=y, random_state=42
+    )
 
-preprocessor = ColumnTransformer([
-    ("cat", OneHotEncoder(handle_unknown="ignore"), categorical_cols),
-    ("num", "passthrough", numeric_cols)
-])
-
-models = {
-    "Logistic Regression": LogisticRegression(max_iter=1000),
-    "Decision Tree": DecisionTreeClassifier(random_state=42),
-    "Random Forest": RandomForestClassifier(random_state=42)
-}
-
-for name, model in models.items():
-    pipe = Pipeline([
-        ("preprocessor", preprocessor),
-        ("model", model)
+    preprocessor = ColumnTransformer([
+        ("cat", OneHotEncoder(handle_unknown="ignore"), categorical_cols),
+        ("num", "passthrough", numeric_cols)
     ])
 
-    pipe.fit(X_train, y_train)
-    y_pred = pipe.predict(X_test)
-
-    # AUC requires probabilities
-    if hasattr(model, "predict_proba"):
-        y_prob = pipe.predict_proba(X_test)
-        auc = roc_auc_score(pd.get_dummies(y_test), y_prob, multi_class="ovr")
-    else:
-        auc = "N/A"
-
-    print(f"\n🔹 {name}")
-    print("Accuracy :", accuracy_score(y_test, y_pred))
-    print("Precision:", precision_score(y_test, y_pred, average="weighted"))
-    print("Recall   :", recall_score(y_test, y_pred, average="weighted"))
-    print("F1 Score :", f1_score(y_test, y_pred, average="weighted"))
-    print("AUC      :", auc)
+    # ===============================
+    # ENCODE ONCE (SHARED BY ALL MODELS)
+    # ===============================
+    X_train_enc = preprocessor.fit_transform(X_train)
+    X_test_enc = preprocessor.transform(X_test)
+
+    models = {
+        "Logistic Regression": LogisticRegression(max_iter=1000),
+        "Decision Tree": DecisionTreeClassifier(random_state=42),
+        "Random Forest": RandomForestClassifier(random_state=42)
+    }
+
+    # ===============================
+    # FIT MODELS IN PARALLEL
+    # ===============================
+    # One worker process per model over the same read-only matrices
+    results = compare_models(models, X_train_enc, X_test_enc, y_train, y_test)
+
+    for _, row in results.iterrows():
+        print(f"\n🔹 {row['Model']}")
+        print("Accuracy :", row["Accuracy"])
+        print("Precision:", row["Precision"])
+        print("Recall   :", row["Recall"])
+        print("F1 Score :", row["F1"])
+        print("AUC      :", row["AUC"])
+        print(f"Fit / predict time: {row['Fit_Seconds']:.3f}s / {row['Predict_Seconds']:.3f}s")
+
+    # ===============================
+    # SAVE RESULTS TABLE
+    # ===============================
+    os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
+    results.to_csv(RESULTS_PATH, index=False)
+    print("\n✅ Baseline results saved to", RESULTS_PATH)
+
+
+if __name__ == "__main__":
+    main()
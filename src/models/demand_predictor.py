@@ -1,5 +1,3 @@
-import numpy as np
-
 # ===============================
 # ROLE BASE DEMAND (EXPLAINABLE)
 # ===============================
@@ -23,15 +21,15 @@ AI_EXPOSURE_BASE = {
 # ===============================
 # EXPERIENCE BONUS
 # ===============================
+EXPERIENCE_BONUS = {
+    "fresher": -10,
+    "2-5 years": 5,
+    "5+ years": 10
+}
+
+
 def experience_bonus(exp):
-    exp = exp.lower()
-    if exp == "fresher":
-        return -10
-    elif exp == "2-5 years":
-        return 5
-    elif exp == "5+ years":
-        return 10
-    return 0
+    return EXPERIENCE_BONUS.get(exp.lower(), 0)
 
 # ===============================
 # SKILL BONUS
@@ -104,3 +102,61 @@ def predict_job_demand(jobtitle, location, experience_level, industry, required_
     ai_probability = max(10, min(90, ai_probability))
 
     return demand, confidence, career_risk, ai_probability
+
+
+# ===============================
+# BATCH PREDICTOR (VECTORIZED)
+# ===============================
+# NumPy is imported inside the batch helpers so that importing this
+# module for the scalar rules (e.g. the web app) stays cheap.
+# count_skills, factorize and map_codes are shared with rule_engine.
+DEMAND_LABELS = ("Low", "Medium", "High")
+RISK_LABELS = ("High Risk", "Medium Risk", "Low Risk")
+
+
+def count_skills(required_skills):
+    """Number of non-empty comma-separated skills."""
+    return len([s for s in required_skills.split(",") if s.strip()])
+
+
+def factorize(values):
+    """(distinct values in first-seen order, int64 code per input value)."""
+    import numpy as np
+
+    # Traffic repeats the same few strings, so each distinct value is
+    # normalized and scored once and broadcast back through its code
+    codes = {}
+    inverse = np.fromiter(
+        (codes.setdefault(v, len(codes)) for v in values),
+        dtype=np.int64,
+        count=len(values)
+    )
+    return list(codes), inverse
+
+
+def map_codes(values, fn):
+    """fn applied once per distinct value, broadcast back as an int64 array."""
+    import numpy as np
+
+    uniques, inverse = factorize(values)
+    mapped = np.array([fn(v) for v in uniques], dtype=np.int64)
+    return mapped[inverse]
+
+
+def predict_job_demand_batch(jobtitles, experience_levels, required_skills):
+    """
+    Column-wise equivalent of predict_job_demand. Returns four arrays
+    (demand, confidence, career_risk, ai_probability) whose elements
+    match the scalar function row for row.
+    """
+    from src.models.rule_engine import rule_engine
+
+    jobtitles = list(jobtitles)
+    experience_levels = list(experience_levels)
+    required_skills = list(required_skills)
+
+    if not (len(jobtitles) == len(experience_levels) == len(required_skills)):
+        raise ValueError("jobtitles, experience_levels and required_skills must have the same length")
+
+    # Answered from the compiled (role, experience, skill bucket) table
+    return rule_engine.predict_batch(jobtitles, experience_levels, required_skills)
@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder
+
+# ===============================
+# FEATURE COLUMNS
+# ===============================
+CATEGORICAL_COLUMNS = ["jobtitle", "location", "experience_level", "industry"]
+NUMERIC_COLUMNS = ["skill_count"]
+
+# ===============================
+# ENCODING MODES
+# ===============================
+# dense   : one-hot, densified float64 matrix (the original behaviour)
+# sparse  : one-hot kept as a float32 CSR matrix, memory ~ non-zeros,
+#           but RandomForest's sparse splitter fits several times slower
+# ordinal : one float32 integer code per categorical column; smallest
+#           matrix and fastest fit (benchmarks/bench_train_encoding.py)
+ENCODING_MODES = ("dense", "sparse", "ordinal")
+DEFAULT_ENCODING = os.environ.get("JOBAI_TRAIN_ENCODING", "ordinal")
+
+
+def build_preprocessor(encoding=DEFAULT_ENCODING,
+                       categorical_cols=CATEGORICAL_COLUMNS,
+                       numeric_cols=NUMERIC_COLUMNS):
+    if encoding == "dense":
+        encoder = OneHotEncoder(handle_unknown="ignore", sparse_output=False)
+        sparse_threshold = 0.0
+    elif encoding == "sparse":
+        encoder = OneHotEncoder(
+            handle_unknown="ignore", sparse_output=True, dtype=np.float32
+        )
+        # Never let ColumnTransformer densify the stacked output
+        sparse_threshold = 1.0
+    elif encoding == "ordinal":
+        # scikit-learn's RandomForest has no native categorical splits;
+        # ordinal codes keep one column per feature and trees isolate
+        # categories with successive threshold splits
+        encoder = OrdinalEncoder(
+            handle_unknown="use_encoded_value", unknown_value=-1, dtype=np.float32
+        )
+        sparse_threshold = 0.0
+    else:
+        raise ValueError(f"unknown encoding {encoding!r}, expected one of {ENCODING_MODES}")
+
+    return ColumnTransformer(
+        transformers=[
+            ("cat", encoder, list(categorical_cols)),
+            ("num", "passthrough", list(numeric_cols))
+        ],
+        sparse_threshold=sparse_threshold
+    )
@@ -0,0 +1,135 @@
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy.stats import ttest_rel
+from sklearn.base import clone
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import RepeatedStratifiedKFold, StratifiedKFold
+
+
+# ===============================
+# FOLDS
+# ===============================
+def make_folds(X, y, n_splits=3, n_repeats=1, random_state=42):
+    """
+    n_repeats=1 reproduces cross_val_score(cv=n_splits) exactly
+    (unshuffled stratified folds); more repeats reshuffle each round
+    and give the paired t-test n_splits x n_repeats samples.
+    """
+    if n_repeats == 1:
+        cv = StratifiedKFold(n_splits=n_splits)
+    else:
+        cv = RepeatedStratifiedKFold(
+            n_splits=n_splits, n_repeats=n_repeats, random_state=random_state
+        )
+    return list(cv.split(X, y))
+
+
+def encode_folds(preprocessor, X, y_codes, folds, cache_dir):
+    """
+    Fit the preprocessor once per fold and cache the encoded train/test
+    matrices, so every model is scored on identical fold data.
+    """
+    paths, encode_seconds = [], []
+    for i, (train_idx, test_idx) in enumerate(folds):
+        start = time.perf_counter()
+        encoder = clone(preprocessor)
+        X_train = encoder.fit_transform(X.iloc[train_idx])
+        X_test = encoder.transform(X.iloc[test_idx])
+        encode_seconds.append(time.perf_counter() - start)
+
+        path = os.path.join(cache_dir, f"fold_{i}.joblib")
+        joblib.dump({
+            "X_train": X_train,
+            "X_test": X_test,
+            "y_train": y_codes[train_idx],
+            "y_test": y_codes[test_idx]
+        }, path)
+        paths.append(path)
+    return paths, encode_seconds
+
+
+# ===============================
+# WORKER
+# ===============================
+def _score_fold(fold, model_name, estimator, fold_path, scoring):
+    data = joblib.load(fold_path, mmap_mode="r")
+
+    start = time.perf_counter()
+    estimator.fit(data["X_train"], data["y_train"])
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score = get_scorer(scoring)(estimator, data["X_test"], data["y_test"])
+    score_seconds = time.perf_counter() - start
+
+    return {
+        "fold": fold,
+        "model": model_name,
+        "score": score,
+        "fit_seconds": fit_seconds,
+        "score_seconds": score_seconds
+    }
+
+
+# ===============================
+# VALIDATION ENGINE
+# ===============================
+def validate_models(models, preprocessor, X, y, n_splits=3, n_repeats=1,
+                    scoring="f1_weighted", max_workers=None):
+    """
+    Cross-validate every model in `models` ({name: estimator}) on the
+    same cached fold matrices, running (fold, model) fits in a process
+    pool. Returns one row per (fold, model).
+    """
+    _, y_codes = np.unique(np.asarray(y), return_inverse=True)
+    folds = make_folds(X, y_codes, n_splits, n_repeats)
+    tasks = [(fold, name) for fold in range(len(folds)) for name in models]
+    max_workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+
+    cache_dir = tempfile.mkdtemp(prefix="jobai_folds_")
+    try:
+        paths, encode_seconds = encode_folds(preprocessor, X, y_codes, folds, cache_dir)
+
+        args = [
+            (fold, name, clone(models[name]), paths[fold], scoring)
+            for fold, name in tasks
+        ]
+        if max_workers == 1:
+            rows = [_score_fold(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                rows = list(pool.map(_score_fold, *zip(*args)))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    results = pd.DataFrame(rows)
+    results["repeat"] = results["fold"] // n_splits
+    results["encode_seconds"] = results["fold"].map(dict(enumerate(encode_seconds)))
+    return results
+
+
+def paired_ttest(results, model_a, model_b):
+    """Paired t-test of model_a vs model_b scores over the same folds."""
+    scores = results.pivot(index="fold", columns="model", values="score")
+    return ttest_rel(scores[model_a], scores[model_b])
+
+
+def fold_report(results):
+    """One line per fold: encode time, then score and fit time per model."""
+    scores = results.pivot(index="fold", columns="model", values="score")
+    fits = results.pivot(index="fold", columns="model", values="fit_seconds")
+    report = pd.DataFrame({
+        "repeat": results.groupby("fold")["repeat"].first(),
+        "encode_s": results.groupby("fold")["encode_seconds"].first()
+    })
+    for model in results["model"].unique():
+        report[f"{model} score"] = scores[model]
+        report[f"{model} fit_s"] = fits[model]
+    return report.round(4)
@@ -0,0 +1,213 @@
+import json
+import os
+
+import numpy as np
+
+# ===============================
+# FLAT FOREST FORMAT
+# ===============================
+# All trees are concatenated into one node table. `children[n]` holds
+# the global (left, right) node ids of n; leaves point to themselves on
+# both sides and test feature 0, so every tree can be walked in
+# lock-step for max_depth steps with plain integer indexing and no leaf
+# checks. `value` holds each node's class distribution normalised per
+# tree, exactly as DecisionTreeClassifier.predict_proba sees it; the
+# forest probability is the mean over trees.
+ARRAY_FIELDS = ("feature", "threshold", "children", "value", "roots")
+
+
+def _export_encoding(preprocessor):
+    """
+    Describe the ColumnTransformer as a list of input-column specs:
+    one-hot columns map category -> output column, ordinal columns map
+    category -> code, passthrough columns copy the value.
+    """
+    from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder
+
+    specs = []
+    for name, transformer, columns in preprocessor.transformers_:
+        if name == "remainder" and transformer == "drop":
+            continue
+        out = preprocessor.output_indices_[name]
+
+        if transformer == "passthrough":
+            for i, column in enumerate(columns):
+                specs.append({"column": column, "kind": "passthrough", "index": out.start + i})
+
+        elif isinstance(transformer, OneHotEncoder):
+            if transformer.drop is not None or getattr(transformer, "_infrequent_enabled", False):
+                raise ValueError("one-hot encoders with drop or infrequent categories are not supported")
+            offset = out.start
+            for column, categories in zip(columns, transformer.categories_):
+                specs.append({
+                    "column": column,
+                    "kind": "onehot",
+                    "mapping": {str(c): offset + j for j, c in enumerate(categories)}
+                })
+                offset += len(categories)
+
+        elif isinstance(transformer, OrdinalEncoder):
+            unknown = transformer.unknown_value if transformer.handle_unknown == "use_encoded_value" else None
+            for i, (column, categories) in enumerate(zip(columns, transformer.categories_)):
+                specs.append({
+                    "column": column,
+                    "kind": "ordinal",
+                    "index": out.start + i,
+                    "mapping": {str(c): j for j, c in enumerate(categories)},
+                    "unknown": unknown
+                })
+        else:
+            raise ValueError(f"unsupported transformer {type(transformer).__name__} for {name!r}")
+
+    return specs
+
+
+def _export_trees(forest):
+    feature, threshold, children, value, roots = [], [], [], [], []
+    offset = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        n = tree.node_count
+        is_leaf = tree.children_left == -1
+        own = np.arange(offset, offset + n, dtype=np.int32)
+
+        counts = tree.value[:, 0, :]
+        feature.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+        threshold.append(tree.threshold.astype(np.float64))
+        children.append(np.column_stack([
+            np.where(is_leaf, own, tree.children_left + offset),
+            np.where(is_leaf, own, tree.children_right + offset)
+        ]).astype(np.int32))
+        value.append(counts / counts.sum(axis=1, keepdims=True))
+        roots.append(offset)
+        offset += n
+
+    return {
+        "feature": np.concatenate(feature),
+        "threshold": np.concatenate(threshold),
+        "children": np.concatenate(children),
+        "value": np.concatenate(value),
+        "roots": np.array(roots, dtype=np.int32)
+    }
+
+
+# ===============================
+# INFERENCE ENGINE
+# ===============================
+class ForestEngine:
+    """
+    Pure-NumPy scorer for a fitted Pipeline(preprocessor, RandomForest).
+    Rows are dicts (or a DataFrame) with the pipeline's input columns;
+    predict_proba matches pipeline.predict_proba and predict matches
+    pipeline.predict.
+
+    Built for request-sized batches: large offline batches are still
+    faster through sklearn's compiled per-tree traversal.
+    """
+
+    def __init__(self, arrays, meta):
+        self.arrays = arrays
+        self.meta = meta
+        for field in ARRAY_FIELDS:
+            setattr(self, field, arrays[field])
+
+        self.classes = np.array(meta["classes"])
+        self.n_features = meta["n_features"]
+        self.max_depth = meta["max_depth"]
+        self.specs = meta["encoding"]
+
+    @classmethod
+    def from_pipeline(cls, pipeline):
+        preprocessor = pipeline.named_steps["preprocessor"]
+        forest = pipeline.steps[-1][1]
+
+        arrays = _export_trees(forest)
+        meta = {
+            "classes": forest.classes_.tolist(),
+            "n_features": int(forest.n_features_in_),
+            "max_depth": int(max(e.tree_.max_depth for e in forest.estimators_)),
+            "input_columns": list(preprocessor.feature_names_in_),
+            "encoding": _export_encoding(preprocessor)
+        }
+        return cls(arrays, meta)
+
+    # -------------------------------
+    # PERSISTENCE
+    # -------------------------------
+    # One .npy per array so load(mmap_mode="r") can map them read-only:
+    # every worker process then shares the same page-cache copy.
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        for field in ARRAY_FIELDS:
+            np.save(os.path.join(path, f"{field}.npy"), self.arrays[field])
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump(self.meta, f)
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        arrays = {
+            field: np.load(os.path.join(path, f"{field}.npy"), mmap_mode=mmap_mode)
+            for field in ARRAY_FIELDS
+        }
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        return cls(arrays, meta)
+
+    # -------------------------------
+    # ENCODING
+    # -------------------------------
+    def encode(self, rows):
+        if hasattr(rows, "to_dict"):
+            rows = rows.to_dict("records")
+        elif isinstance(rows, dict):
+            rows = [rows]
+
+        # sklearn trees compare float32 features against float64 thresholds
+        X = np.zeros((len(rows), self.n_features), dtype=np.float32)
+        for spec in self.specs:
+            column, kind = spec["column"], spec["kind"]
+            if kind == "passthrough":
+                X[:, spec["index"]] = [row[column] for row in rows]
+            elif kind == "onehot":
+                mapping = spec["mapping"]
+                for i, row in enumerate(rows):
+                    j = mapping.get(str(row[column]))
+                    if j is not None:
+                        X[i, j] = 1.0
+            else:
+                mapping, unknown = spec["mapping"], spec["unknown"]
+                codes = []
+                for row in rows:
+                    code = mapping.get(str(row[column]), unknown)
+                    if code is None:
+                        raise ValueError(f"unknown category {row[column]!r} in {column!r}")
+                    codes.append(code)
+                X[:, spec["index"]] = codes
+        return X
+
+    # -------------------------------
+    # SCORING
+    # -------------------------------
+    def apply(self, X):
+        """Leaf index reached in every tree, shape (rows, trees)."""
+        rows = np.arange(X.shape[0])[:, None]
+        node = np.broadcast_to(self.roots, (X.shape[0], self.roots.size)).copy()
+
+        for _ in range(self.max_depth):
+            go_right = ~(X[rows, self.feature[node]] <= self.threshold[node])
+            node = self.children[node, go_right.view(np.int8)]
+        return node
+
+    def predict_proba_encoded(self, X):
+        leaves = self.apply(X)
+        # Sum tree by tree, in order, like RandomForestClassifier does
+        proba = np.zeros((X.shape[0], self.value.shape[1]))
+        for t in range(leaves.shape[1]):
+            proba += self.value[leaves[:, t]]
+        return proba / leaves.shape[1]
+
+    def predict_proba(self, rows):
+        return self.predict_proba_encoded(self.encode(rows))
+
+    def predict(self, rows):
+        return self.classes[self.predict_proba(rows).argmax(axis=1)]
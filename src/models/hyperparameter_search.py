@@ -0,0 +1,191 @@
+import csv
+import json
+import math
+import os
+import time
+
+from sklearn.base import clone
+from sklearn.model_selection import ParameterGrid, ParameterSampler, cross_validate
+from sklearn.utils import resample
+
+# ===============================
+# SEARCH LOG
+# ===============================
+LOG_FIELDS = [
+    "search", "rung", "candidate", "resource", "params",
+    "mean_score", "std_score", "fit_seconds", "elapsed_seconds", "promoted"
+]
+
+
+def save_search_log(rows, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=LOG_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def random_search_log(search):
+    """Same log layout for a fitted RandomizedSearchCV (one rung)."""
+    results = search.cv_results_
+    best = search.best_index_
+    rows = []
+    for i, params in enumerate(results["params"]):
+        folds = search.n_splits_
+        rows.append({
+            "search": "random",
+            "rung": 0,
+            "candidate": i,
+            "resource": params.get("model__n_estimators", ""),
+            "params": json.dumps(params, sort_keys=True),
+            "mean_score": round(float(results["mean_test_score"][i]), 6),
+            "std_score": round(float(results["std_test_score"][i]), 6),
+            "fit_seconds": round(float(results["mean_fit_time"][i]) * folds, 3),
+            "elapsed_seconds": "",
+            "promoted": int(i == best)
+        })
+    return rows
+
+
+# ===============================
+# SUCCESSIVE HALVING
+# ===============================
+class SuccessiveHalvingSearch:
+    """
+    Budgeted successive halving: every candidate is cross-validated on a
+    small resource, the best 1/factor move on to factor x the resource,
+    and only the finalists see the full resource. The resource is either
+    a pipeline parameter (e.g. model__n_estimators) or "n_samples".
+
+    With time_budget (seconds) the search stops starting new evaluations
+    once the budget is spent and keeps the best candidate scored so far;
+    the final refit on the full training set is not counted.
+    """
+
+    def __init__(self, estimator, param_distributions, resource="model__n_estimators",
+                 max_resource=500, factor=3, n_candidates="exhaust", cv=3,
+                 scoring="f1", time_budget=None, random_state=42, refit=True):
+        self.estimator = estimator
+        self.param_distributions = dict(param_distributions)
+        self.resource = resource
+        self.max_resource = max_resource
+        self.factor = factor
+        self.n_candidates = n_candidates
+        self.cv = cv
+        self.scoring = scoring
+        self.time_budget = time_budget
+        self.random_state = random_state
+        self.refit = refit
+
+        self.log_ = []
+        self.best_params_ = None
+        self.best_score_ = None
+        self.best_estimator_ = None
+        self.budget_exhausted_ = False
+        self.search_seconds_ = 0.0
+        self.refit_seconds_ = 0.0
+
+    # -------------------------------
+    # PLANNING
+    # -------------------------------
+    def _candidates(self):
+        # The resource is what the search controls, not a hyperparameter
+        space = {k: v for k, v in self.param_distributions.items() if k != self.resource}
+        grid_size = len(ParameterGrid(space))
+        n = grid_size if self.n_candidates == "exhaust" else min(self.n_candidates, grid_size)
+        return list(ParameterSampler(space, n_iter=n, random_state=self.random_state))
+
+    def _schedule(self, n_candidates, max_resource):
+        # Enough rungs that the last one holds at most `factor` finalists
+        n_rungs = 1
+        while self.factor ** n_rungs < n_candidates:
+            n_rungs += 1
+        return [
+            max(1, int(max_resource / self.factor ** (n_rungs - 1 - rung)))
+            for rung in range(n_rungs)
+        ]
+
+    def _configure(self, params, resource, X, y):
+        estimator = clone(self.estimator).set_params(**params)
+        if self.resource == "n_samples":
+            if resource < len(X):
+                X, y = resample(
+                    X, y, n_samples=resource, replace=False,
+                    stratify=y, random_state=self.random_state
+                )
+        else:
+            estimator.set_params(**{self.resource: resource})
+        return estimator, X, y
+
+    # -------------------------------
+    # SEARCH
+    # -------------------------------
+    def fit(self, X, y):
+        start = time.perf_counter()
+        candidates = self._candidates()
+        max_resource = len(X) if self.resource == "n_samples" else self.max_resource
+        schedule = self._schedule(len(candidates), max_resource)
+
+        survivors = list(range(len(candidates)))
+        best = None  # (score, candidate id)
+        self.log_ = []
+        self.budget_exhausted_ = False
+
+        for rung, resource in enumerate(schedule):
+            scored = []
+            for cid in survivors:
+                # At least one candidate is always scored
+                if (self.time_budget and self.log_
+                        and time.perf_counter() - start >= self.time_budget):
+                    self.budget_exhausted_ = True
+                    break
+
+                estimator, X_r, y_r = self._configure(candidates[cid], resource, X, y)
+                fit_start = time.perf_counter()
+                scores = cross_validate(estimator, X_r, y_r, cv=self.cv, scoring=self.scoring)
+                fit_seconds = time.perf_counter() - fit_start
+
+                mean = float(scores["test_score"].mean())
+                scored.append((mean, cid))
+                self.log_.append({
+                    "search": "halving",
+                    "rung": rung,
+                    "candidate": cid,
+                    "resource": resource,
+                    "params": json.dumps(candidates[cid], sort_keys=True),
+                    "mean_score": round(mean, 6),
+                    "std_score": round(float(scores["test_score"].std()), 6),
+                    "fit_seconds": round(fit_seconds, 3),
+                    "elapsed_seconds": round(time.perf_counter() - start, 3),
+                    "promoted": 0
+                })
+
+            if scored:
+                # A score at a larger resource outranks any earlier rung
+                best = max(scored)
+            if self.budget_exhausted_ or rung == len(schedule) - 1:
+                break
+
+            keep = max(1, math.ceil(len(scored) / self.factor))
+            survivors = [cid for _, cid in sorted(scored, reverse=True)[:keep]]
+            for row in self.log_:
+                if row["rung"] == rung and row["candidate"] in survivors:
+                    row["promoted"] = 1
+
+        self.search_seconds_ = time.perf_counter() - start
+        self.best_score_, best_cid = best
+        for row in reversed(self.log_):
+            if row["candidate"] == best_cid:
+                row["promoted"] = 1
+                break
+        self.best_params_ = dict(candidates[best_cid])
+        if self.resource != "n_samples":
+            self.best_params_[self.resource] = max_resource
+
+        if self.refit:
+            refit_start = time.perf_counter()
+            self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_)
+            self.best_estimator_.fit(X, y)
+            self.refit_seconds_ = time.perf_counter() - refit_start
+
+        return self
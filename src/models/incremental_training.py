@@ -0,0 +1,255 @@
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+
+import joblib
+import pandas as pd
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+
+# ===============================
+# PATH SETUP
+# ===============================
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.database.connection import Database  # noqa: E402
+from src.models.model_registry import ModelRegistry  # noqa: E402
+from src.models.model_server import (  # noqa: E402
+    CATEGORICAL_COLUMNS, FEATURE_COLUMNS, MODEL_PATH, category_lookup
+)
+
+STATE_PATH = os.path.join(PROJECT_ROOT, "data", "models", "retrain_state.json")
+
+# ===============================
+# RETRAINING SETTINGS
+# ===============================
+NEW_TREES = int(os.environ.get("JOBAI_RETRAIN_TREES", 50))
+MIN_NEW_ROWS = int(os.environ.get("JOBAI_RETRAIN_MIN_ROWS", 200))
+HOLDOUT_SIZE = 0.2
+
+# A new version may not lose more than this much F1 on the original
+# test split, so feedback rows cannot silently erode the base model
+MAX_REFERENCE_DROP = 0.02
+
+
+# ===============================
+# STATE
+# ===============================
+def load_state(path=STATE_PATH):
+    """(labeled_at, id) of the last labeled row a promoted version used."""
+    state = {"last_labeled_at": "", "last_prediction_id": 0}
+    if os.path.exists(path):
+        with open(path) as f:
+            saved = json.load(f)
+        # Older watermarks counted served (unlabeled) rows; start over
+        if "last_labeled_at" in saved:
+            state.update(saved)
+    return state
+
+
+def save_state(state, path=STATE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ===============================
+# NEW LABELED ROWS
+# ===============================
+def labeled_rows(database, pipeline, labeled_at="", after_id=0):
+    """
+    Predictions labeled after the (labeled_at, after_id) watermark as a
+    feature frame. Inputs are mapped back to the model's category casing
+    and the observed actual_demand becomes the binary target (High -> 1,
+    Not High -> 0). The demand the app served is never used as a label:
+    that would only teach the model its own (or the rules') output.
+    """
+    df = pd.DataFrame(
+        database.labeled_after(labeled_at, after_id),
+        columns=["id", *FEATURE_COLUMNS, "actual_demand", "labeled_at"]
+    )
+
+    lookup = category_lookup(pipeline)
+    for column in CATEGORICAL_COLUMNS:
+        mapping = lookup[column]
+        df[column] = [mapping.get(str(v).lower().strip(), v) for v in df[column]]
+
+    df["skill_count"] = df["skill_count"].fillna(0).astype(int)
+    df["demand_binary"] = (df["actual_demand"].str.lower().str.strip() == "high").astype(int)
+    return df
+
+
+# ===============================
+# WARM START
+# ===============================
+def add_trees(pipeline, X, y, n_new_trees=NEW_TREES):
+    """
+    Copy of `pipeline` whose forest keeps every existing tree and grows
+    n_new_trees more on (X, y). The fitted preprocessor is reused as-is,
+    so the old trees keep seeing the encoding they were trained on.
+    """
+    updated = copy.deepcopy(pipeline)
+    forest = updated.steps[-1][1]
+    X_encoded = updated.named_steps["preprocessor"].transform(X)
+
+    forest.set_params(warm_start=True, n_estimators=len(forest.estimators_) + n_new_trees)
+    forest.fit(X_encoded, y)
+    forest.set_params(warm_start=False)
+    return updated
+
+
+def evaluate(pipeline, X, y):
+    y_pred = pipeline.predict(X)
+    return {
+        "f1": round(float(f1_score(y, y_pred, pos_label=1, zero_division=0)), 4),
+        "accuracy": round(float(accuracy_score(y, y_pred)), 4)
+    }
+
+
+# ===============================
+# RETRAIN
+# ===============================
+def retrain(pipeline=None, database=None, registry=None, n_new_trees=NEW_TREES,
+            min_rows=MIN_NEW_ROWS, reference=None, model_path=MODEL_PATH,
+            state_path=STATE_PATH):
+    """
+    One incremental refresh: pull labeled predictions past the
+    watermark, grow the forest on 80% of them, score old and new model
+    on the other 20%
+    (and on `reference`, an (X, y) holdout from the original data, when
+    given) and register the result as the next model version.
+
+    The version is promoted (served, and exported to model_path) only if
+    it is at least as good on the new holdout and within
+    MAX_REFERENCE_DROP on the reference; the watermark only moves on
+    promotion, so rejected rows are retried with the next batch.
+
+    Raises ValueError when the database holds no labeled predictions.
+    """
+    start = time.perf_counter()
+    database = database or Database()
+    if database.labeled_count() == 0:
+        raise ValueError(
+            "no labeled predictions: record observed outcomes with "
+            "Database.label_predictions (or --labels) before retraining"
+        )
+
+    registry = registry or ModelRegistry()
+    if pipeline is None:
+        if registry.current_version() is not None:
+            pipeline = registry.load_pipeline()
+        else:
+            pipeline = joblib.load(model_path)
+    state = load_state(state_path)
+
+    df = labeled_rows(database, pipeline, state["last_labeled_at"], state["last_prediction_id"])
+    summary = {"new_rows": len(df), "base_trees": len(pipeline.steps[-1][1].estimators_)}
+    if len(df) < min_rows or df["demand_binary"].nunique() < 2:
+        summary["status"] = "skipped"
+        return summary
+
+    X_new, X_holdout, y_new, y_holdout = train_test_split(
+        df[FEATURE_COLUMNS], df["demand_binary"],
+        test_size=HOLDOUT_SIZE, stratify=df["demand_binary"], random_state=42
+    )
+
+    fit_start = time.perf_counter()
+    updated = add_trees(pipeline, X_new, y_new, n_new_trees)
+    summary["fit_seconds"] = round(time.perf_counter() - fit_start, 3)
+
+    summary["before"] = evaluate(pipeline, X_holdout, y_holdout)
+    summary["after"] = evaluate(updated, X_holdout, y_holdout)
+    promoted = summary["after"]["f1"] >= summary["before"]["f1"]
+    if reference is not None:
+        summary["reference_before"] = evaluate(pipeline, *reference)
+        summary["reference_after"] = evaluate(updated, *reference)
+        drop = summary["reference_before"]["f1"] - summary["reference_after"]["f1"]
+        promoted = promoted and drop <= MAX_REFERENCE_DROP
+
+    summary.update({
+        "source": "incremental",
+        "base_version": registry.current_version(),
+        "trees": len(updated.steps[-1][1].estimators_),
+        "last_labeled_at": df["labeled_at"].iloc[-1],
+        "last_prediction_id": int(df["id"].iloc[-1]),
+        "promoted": promoted
+    })
+    summary["version"] = registry.register(updated, summary)
+
+    if promoted:
+        registry.promote(summary["version"], export_path=model_path)
+        state["last_labeled_at"] = summary["last_labeled_at"]
+        state["last_prediction_id"] = summary["last_prediction_id"]
+        save_state(state, state_path)
+
+    summary["status"] = "promoted" if promoted else "rejected"
+    summary["total_seconds"] = round(time.perf_counter() - start, 3)
+    return summary
+
+
+def import_labels(database, csv_path):
+    """Label predictions from a CSV with columns id, actual_demand[, labeled_at]."""
+    labels = pd.read_csv(csv_path)
+    if "labeled_at" not in labels.columns:
+        labels["labeled_at"] = None
+    labels = labels.astype(object).where(labels.notna(), None)
+    return database.label_predictions(
+        labels[["id", "actual_demand", "labeled_at"]].itertuples(index=False, name=None)
+    )
+
+
+def reference_holdout():
+    """The test split train_demand_model.py held out from the CSV."""
+    from src.data_pipeline.feature_store import load_features
+
+    df = load_features()
+    _, X_test, _, y_test = train_test_split(
+        df[FEATURE_COLUMNS], df["demand_binary"],
+        test_size=0.2, stratify=df["demand_binary"], random_state=42
+    )
+    return X_test, y_test
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warm-start the demand model on new predictions")
+    parser.add_argument("--trees", type=int, default=NEW_TREES, help="trees to add")
+    parser.add_argument("--min-rows", type=int, default=MIN_NEW_ROWS, help="minimum new rows")
+    parser.add_argument("--no-reference", action="store_true",
+                        help="skip the check against the original test split")
+    parser.add_argument("--labels", help="CSV of observed outcomes (id, actual_demand[, labeled_at]) to record first")
+    args = parser.parse_args()
+
+    database = Database()
+    if args.labels:
+        print(f"🏷️ Labeled {import_labels(database, args.labels)} predictions from {args.labels}")
+
+    print("🔹 Incremental retraining started")
+    try:
+        summary = retrain(
+            database=database,
+            n_new_trees=args.trees,
+            min_rows=args.min_rows,
+            reference=None if args.no_reference else reference_holdout()
+        )
+    except ValueError as exc:
+        raise SystemExit(f"❌ {exc}")
+
+    if summary["status"] == "skipped":
+        print(f"⏭️ Only {summary['new_rows']} new labeled rows (need {args.min_rows} with both classes)")
+    else:
+        print(f"🌲 Trees: {summary['base_trees']} → {summary['trees']} "
+              f"on {summary['new_rows']} new rows ({summary['fit_seconds']}s)")
+        print("📈 Holdout F1:", summary["before"]["f1"], "→", summary["after"]["f1"])
+        if "reference_after" in summary:
+            print("📊 Reference F1:", summary["reference_before"]["f1"], "→",
+                  summary["reference_after"]["f1"])
+        icon = "✅" if summary["promoted"] else "⚠️"
+        print(f"{icon} Version {summary['version']} {summary['status']} "
+              f"in {summary['total_seconds']}s")
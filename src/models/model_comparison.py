@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import (
+    accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
+)
+
+RESULT_COLUMNS = [
+    "Model", "Accuracy", "Precision", "Recall", "F1", "AUC",
+    "Fit_Seconds", "Predict_Seconds"
+]
+
+
+# ===============================
+# WORKER
+# ===============================
+def _evaluate(name, estimator, matrix_path):
+    """Fit one model on the shared, memory-mapped matrices and score it."""
+    data = joblib.load(matrix_path, mmap_mode="r")
+    X_train, X_test = data["X_train"], data["X_test"]
+    y_train, y_test = data["y_train"], data["y_test"]
+
+    start = time.perf_counter()
+    estimator.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    y_pred = estimator.predict(X_test)
+    y_prob = estimator.predict_proba(X_test) if hasattr(estimator, "predict_proba") else None
+    predict_seconds = time.perf_counter() - start
+
+    if y_prob is not None:
+        auc = roc_auc_score(y_test, y_prob, multi_class="ovr", labels=estimator.classes_)
+    else:
+        auc = np.nan
+
+    return {
+        "Model": name,
+        "Accuracy": accuracy_score(y_test, y_pred),
+        "Precision": precision_score(y_test, y_pred, average="weighted"),
+        "Recall": recall_score(y_test, y_pred, average="weighted"),
+        "F1": f1_score(y_test, y_pred, average="weighted"),
+        "AUC": auc,
+        "Fit_Seconds": round(fit_seconds, 4),
+        "Predict_Seconds": round(predict_seconds, 4)
+    }
+
+
+# ===============================
+# COMPARISON HARNESS
+# ===============================
+def compare_models(models, X_train, X_test, y_train, y_test, max_workers=None):
+    """
+    Fit every model in `models` ({name: estimator}) on already encoded
+    matrices. The matrices are written once to a joblib file and every
+    worker process memory-maps it read-only, so nothing is re-encoded
+    or copied per model. Labels are integer-coded for the same reason.
+    Returns one row per model, in the order given.
+    """
+    max_workers = max_workers or min(len(models), os.cpu_count() or 1)
+
+    _, y_codes = np.unique(np.concatenate([np.asarray(y_train), np.asarray(y_test)]),
+                           return_inverse=True)
+    y_train_codes = y_codes[:len(y_train)]
+    y_test_codes = y_codes[len(y_train):]
+
+    tmp_dir = tempfile.mkdtemp(prefix="jobai_models_")
+    matrix_path = os.path.join(tmp_dir, "matrices.joblib")
+    try:
+        joblib.dump({
+            "X_train": X_train,
+            "X_test": X_test,
+            "y_train": y_train_codes,
+            "y_test": y_test_codes
+        }, matrix_path)
+
+        if max_workers == 1:
+            rows = [_evaluate(name, est, matrix_path) for name, est in models.items()]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(_evaluate, name, est, matrix_path)
+                    for name, est in models.items()
+                ]
+                rows = [f.result() for f in futures]
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return pd.DataFrame(rows, columns=RESULT_COLUMNS)
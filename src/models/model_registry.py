@@ -0,0 +1,183 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# ===============================
+# PATH SETUP
+# ===============================
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+REGISTRY_DIR = os.environ.get(
+    "JOBAI_MODEL_REGISTRY", os.path.join(PROJECT_ROOT, "data", "models", "registry")
+)
+MODEL_PATH = os.path.join(PROJECT_ROOT, "data", "models", "job_demand_model.pkl")
+
+PIPELINE_FILE = "pipeline.joblib"
+FOREST_DIR = "forest"
+METADATA_FILE = "metadata.json"
+CURRENT_FILE = "CURRENT"
+
+
+# ===============================
+# MODEL REGISTRY
+# ===============================
+class ModelRegistry:
+    """
+    Versioned model artifacts on disk:
+
+        registry/v0001/pipeline.joblib   full sklearn pipeline
+        registry/v0001/forest/*.npy      ForestEngine arrays (mmap-able)
+        registry/v0001/metadata.json
+        registry/CURRENT                 the version being served
+
+    Versions are written to a temp directory and renamed into place and
+    CURRENT is swapped with os.replace, so readers never see a
+    half-written version.
+    """
+
+    def __init__(self, root=REGISTRY_DIR):
+        self.root = root
+
+    def path(self, version):
+        return os.path.join(self.root, f"v{version:04d}")
+
+    def versions(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            int(name[1:]) for name in os.listdir(self.root)
+            if name.startswith("v") and name[1:].isdigit()
+        )
+
+    def current_version(self):
+        try:
+            with open(os.path.join(self.root, CURRENT_FILE)) as f:
+                return int(f.read().strip()[1:])
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def metadata(self, version):
+        with open(os.path.join(self.path(version), METADATA_FILE)) as f:
+            return json.load(f)
+
+    # -------------------------------
+    # WRITE
+    # -------------------------------
+    def register(self, pipeline, metadata=None, promote=False):
+        """Store `pipeline` as the next version and return its number."""
+        import joblib
+        from src.models.forest_engine import ForestEngine
+
+        os.makedirs(self.root, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=self.root)
+        try:
+            joblib.dump(pipeline, os.path.join(staging, PIPELINE_FILE))
+            try:
+                ForestEngine.from_pipeline(pipeline).save(os.path.join(staging, FOREST_DIR))
+                forest_engine = True
+            except (AttributeError, ValueError):
+                forest_engine = False
+
+            while True:
+                version = max(self.versions(), default=0) + 1
+                meta = dict(metadata or {})
+                meta.update({
+                    "version": version,
+                    "forest_engine": forest_engine,
+                    "registered_at": time.strftime("%Y-%m-%d %H:%M:%S")
+                })
+                with open(os.path.join(staging, METADATA_FILE), "w") as f:
+                    json.dump(meta, f, indent=2)
+                try:
+                    os.rename(staging, self.path(version))
+                    break
+                except OSError:
+                    # Another writer took this number first
+                    if not os.path.exists(self.path(version)):
+                        raise
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        if promote:
+            self.promote(version)
+        return version
+
+    def promote(self, version, export_path=MODEL_PATH):
+        """
+        Point CURRENT at `version`. The pipeline is also copied to
+        export_path (the legacy job_demand_model.pkl) for the scripts
+        that still joblib.load it directly.
+        """
+        if version not in self.versions():
+            raise ValueError(f"unknown model version {version}")
+
+        if export_path:
+            tmp_path = export_path + ".tmp"
+            shutil.copyfile(os.path.join(self.path(version), PIPELINE_FILE), tmp_path)
+            os.replace(tmp_path, export_path)
+
+        tmp_path = os.path.join(self.root, CURRENT_FILE + ".tmp")
+        with open(tmp_path, "w") as f:
+            f.write(f"v{version:04d}")
+        os.replace(tmp_path, os.path.join(self.root, CURRENT_FILE))
+
+    # -------------------------------
+    # READ
+    # -------------------------------
+    def load_pipeline(self, version=None):
+        import joblib
+
+        version = version or self.current_version()
+        if version is None:
+            raise FileNotFoundError(f"no model version promoted in {self.root}")
+        return joblib.load(os.path.join(self.path(version), PIPELINE_FILE))
+
+    def load_engine(self, version=None, mmap_mode="r"):
+        """
+        ForestEngine for `version` with its node arrays memory-mapped,
+        or None if that version has no forest export.
+        """
+        from src.models.forest_engine import ForestEngine
+
+        version = version or self.current_version()
+        if version is None:
+            raise FileNotFoundError(f"no model version promoted in {self.root}")
+        forest_dir = os.path.join(self.path(version), FOREST_DIR)
+        if not os.path.isdir(forest_dir):
+            return None
+        return ForestEngine.load(forest_dir, mmap_mode=mmap_mode)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage demand model versions")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="show registered versions")
+    commands.add_parser("import", help="register data/models/job_demand_model.pkl and promote it")
+    promote_cmd = commands.add_parser("promote", help="serve a registered version")
+    promote_cmd.add_argument("version", type=int)
+    args = parser.parse_args()
+
+    registry = ModelRegistry()
+    if args.command == "import":
+        import joblib
+
+        version = registry.register(joblib.load(MODEL_PATH), {"source": MODEL_PATH}, promote=True)
+        print(f"✅ Registered and promoted version {version}")
+    elif args.command == "promote":
+        registry.promote(args.version)
+        print(f"✅ Version {args.version} is now current")
+    else:
+        current = registry.current_version()
+        print(f"📦 Model registry: {registry.root}")
+        for version in registry.versions():
+            meta = registry.metadata(version)
+            marker = "→" if version == current else " "
+            print(f"{marker} v{version:04d}  {meta['registered_at']}  "
+                  f"engine={meta['forest_engine']}  {meta.get('source', '')}")
@@ -0,0 +1,332 @@
+import os
+import queue
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+
+# model_registry has no numpy/sklearn imports at module level; the
+# forest engine (numpy) is imported on the first model load
+from src.models.model_registry import ModelRegistry
+from src.models.rule_engine import rule_engine
+
+# ===============================
+# PATH SETUP
+# ===============================
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MODEL_PATH = os.path.join(PROJECT_ROOT, "data", "models", "job_demand_model.pkl")
+
+# ===============================
+# SERVING SETTINGS
+# ===============================
+MAX_BATCH_SIZE = int(os.environ.get("JOBAI_MODEL_MAX_BATCH", 32))
+MAX_DELAY_MS = float(os.environ.get("JOBAI_MODEL_MAX_DELAY_MS", 5))
+# How often a worker checks the registry's CURRENT pointer for a new version
+POLL_SECONDS = float(os.environ.get("JOBAI_MODEL_POLL_SECONDS", 30))
+REQUEST_TIMEOUT = 10.0
+
+FEATURE_COLUMNS = ["jobtitle", "location", "experience_level", "industry", "skill_count"]
+CATEGORICAL_COLUMNS = ["jobtitle", "location", "experience_level", "industry"]
+
+# Threshold chosen in business_optimization.py
+HIGH_THRESHOLD = 0.6
+MEDIUM_THRESHOLD = 0.4
+
+_STOP = object()
+
+# Everything one model version needs to score a batch, swapped as a
+# single reference so a batch never mixes two versions
+ServedModel = namedtuple("ServedModel", "version pipeline engine lookup high_index")
+
+
+def demand_from_probability(p_high):
+    if p_high >= HIGH_THRESHOLD:
+        return "High", "Low Risk"
+    if p_high >= MEDIUM_THRESHOLD:
+        return "Medium", "Medium Risk"
+    return "Low", "High Risk"
+
+
+def category_lookup(pipeline):
+    """
+    The web app lower-cases inputs while the model was trained on the
+    dataset's original casing; map back case-insensitively.
+    """
+    encoder = pipeline.named_steps["preprocessor"].named_transformers_["cat"]
+    lookup = {}
+    for column, categories in zip(CATEGORICAL_COLUMNS, encoder.categories_):
+        lookup[column] = {str(c).lower().strip(): c for c in categories}
+    return lookup
+
+
+def served_model(pipeline=None, engine=None, version=None):
+    """
+    Random-forest pipelines are scored by the array-based ForestEngine;
+    anything else falls back to sklearn's predict_proba.
+    """
+    from src.models.forest_engine import ForestEngine
+
+    if engine is None:
+        try:
+            engine = ForestEngine.from_pipeline(pipeline)
+        except (AttributeError, ValueError):
+            engine = None
+
+    if engine is not None:
+        lookup = {
+            spec["column"]: {str(c).lower().strip(): c for c in spec["mapping"]}
+            for spec in engine.specs if "mapping" in spec
+        }
+        classes = engine.classes.tolist()
+    else:
+        lookup = category_lookup(pipeline)
+        classes = list(pipeline.classes_)
+    return ServedModel(version, pipeline, engine, lookup, classes.index(1))
+
+
+# ===============================
+# MICRO-BATCHING MODEL SERVER
+# ===============================
+class MicroBatchModelServer:
+    """
+    Loads the trained demand pipeline once per worker and scores
+    concurrent requests together: the first queued request opens a
+    batch that closes after max_batch_size rows or max_delay_ms,
+    whichever comes first, and the whole batch goes through a single
+    predict_proba call.
+
+    With a registry, the worker serves the CURRENT version from its
+    memory-mapped forest arrays and swaps to a newly promoted version
+    between batches; queued requests are never dropped. Without one (or
+    before anything is promoted) it loads the pipeline at model_path.
+    """
+
+    def __init__(self, model_path=MODEL_PATH, max_batch_size=MAX_BATCH_SIZE,
+                 max_delay_ms=MAX_DELAY_MS, registry=None, poll_seconds=POLL_SECONDS):
+        self.model_path = model_path
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000.0
+        self.registry = registry
+        self.poll_seconds = poll_seconds
+
+        self.model = None
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._swap_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._next_poll = 0.0
+
+        self.requests = 0
+        self.batches = 0
+        self.max_batch_seen = 0
+        self.total_queue_delay = 0.0
+        self.max_queue_delay = 0.0
+        self.total_inference = 0.0
+        self.swaps = 0
+
+    # -------------------------------
+    # LIFECYCLE
+    # -------------------------------
+    def load(self):
+        with self._lock:
+            if self.model is not None and self._pid == os.getpid():
+                return self.model
+
+            import pandas  # noqa: F401  (imported here, not on the first batch)
+
+            self.model = self._load_model()
+            self._pid = os.getpid()
+            self._next_poll = time.monotonic() + self.poll_seconds
+            self._thread = threading.Thread(
+                target=self._run, name="model-batcher", daemon=True
+            )
+            self._thread.start()
+            return self.model
+
+    def _load_model(self, version=None):
+        if self.registry is not None:
+            version = version or self.registry.current_version()
+            if version is not None:
+                engine = self.registry.load_engine(version)
+                pipeline = None if engine is not None else self.registry.load_pipeline(version)
+                return served_model(pipeline, engine, version)
+
+        import joblib
+        return served_model(joblib.load(self.model_path))
+
+    def swap(self, version=None):
+        """
+        Load `version` (default: the registry's CURRENT) and serve it
+        from the next batch on. A batch already being scored finishes
+        on the old model.
+        """
+        if self.model is None or self._pid != os.getpid():
+            return self.load()
+
+        with self._swap_lock:
+            if version is not None and self.model.version == version:
+                return self.model
+            model = self._load_model(version)
+            self.model = model
+            self.swaps += 1
+            return model
+
+    def _poll_registry(self):
+        now = time.monotonic()
+        if self.registry is None or now < self._next_poll:
+            return
+        self._next_poll = now + self.poll_seconds
+
+        current = self.registry.current_version()
+        if current is not None and current != self.model.version:
+            try:
+                self.swap(current)
+            except Exception as exc:
+                print(f"⚠️ model swap to v{current:04d} failed, keeping v{self.model.version}: {exc}")
+
+    def served_version(self):
+        """
+        Registry version scored from the next batch on (after a throttled
+        registry poll), or None before the first load / without a registry.
+        """
+        if self.model is None or self._pid != os.getpid():
+            return None
+        self._poll_registry()
+        return self.model.version
+
+    def stop(self, timeout=5.0):
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    # -------------------------------
+    # REQUEST SIDE
+    # -------------------------------
+    def make_row(self, jobtitle, location, experience_level, industry, skill_count):
+        row = {
+            "jobtitle": jobtitle,
+            "location": location,
+            "experience_level": experience_level,
+            "industry": industry
+        }
+        lookup = self.model.lookup if self.model is not None else {}
+        for column in CATEGORICAL_COLUMNS:
+            value = row[column]
+            row[column] = lookup.get(column, {}).get(
+                str(value).lower().strip(), value
+            )
+        row["skill_count"] = skill_count
+        return row
+
+    def submit(self, row):
+        if self.model is None or self._pid != os.getpid():
+            self.load()
+        self._poll_registry()
+        future = Future()
+        self._queue.put((row, future, time.perf_counter()))
+        return future
+
+    def predict_proba_high(self, row, timeout=REQUEST_TIMEOUT):
+        return self.submit(row).result(timeout)
+
+    def predict_job_demand(self, jobtitle, location, experience_level, industry, required_skills):
+        """Drop-in replacement for the rule-based predict_job_demand."""
+        if self.model is None or self._pid != os.getpid():
+            self.load()
+        self._poll_registry()
+
+        skill_count = len([s for s in required_skills.split(",") if s.strip()])
+        row = self.make_row(jobtitle, location, experience_level, industry, skill_count)
+        p_high = self.predict_proba_high(row)
+
+        demand, career_risk = demand_from_probability(p_high)
+        confidence = round(max(p_high, 1 - p_high) * 100, 2)
+
+        # The model does not estimate AI exposure; keep the rule-based value
+        ai_probability = rule_engine.predict(
+            jobtitle, location, experience_level, industry, required_skills
+        )[3]
+
+        return demand, confidence, career_risk, ai_probability
+
+    # -------------------------------
+    # BATCHER THREAD
+    # -------------------------------
+    def _collect(self):
+        item = self._queue.get()
+        if item is _STOP:
+            return None
+
+        batch = [item]
+        deadline = time.perf_counter() + self.max_delay
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        import pandas as pd
+
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+
+            start = time.perf_counter()
+            model = self.model
+            rows = [row for row, _, _ in batch]
+            try:
+                if model.engine is not None:
+                    proba = model.engine.predict_proba(rows)[:, model.high_index]
+                else:
+                    frame = pd.DataFrame(rows, columns=FEATURE_COLUMNS)
+                    proba = model.pipeline.predict_proba(frame)[:, model.high_index]
+            except Exception as exc:
+                for _, future, _ in batch:
+                    future.set_exception(exc)
+                continue
+
+            done = time.perf_counter()
+            for (_, future, enqueued), p in zip(batch, proba):
+                future.set_result(float(p))
+                delay = start - enqueued
+                self.total_queue_delay += delay
+                self.max_queue_delay = max(self.max_queue_delay, delay)
+
+            self.requests += len(batch)
+            self.batches += 1
+            self.max_batch_seen = max(self.max_batch_seen, len(batch))
+            self.total_inference += done - start
+
+    # -------------------------------
+    # COUNTERS
+    # -------------------------------
+    def stats(self):
+        return {
+            "loaded": int(self.model is not None),
+            "numpy_engine": int(self.model is not None and self.model.engine is not None),
+            "model_version": (self.model.version or 0) if self.model is not None else 0,
+            "swaps": self.swaps,
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch_seen,
+            "avg_queue_delay_ms": round(self.total_queue_delay / self.requests * 1000, 3) if self.requests else 0.0,
+            "max_queue_delay_ms": round(self.max_queue_delay * 1000, 3),
+            "avg_batch_inference_ms": round(self.total_inference / self.batches * 1000, 3) if self.batches else 0.0,
+            "queue_depth": self._queue.qsize()
+        }
+
+
+model_server = MicroBatchModelServer(registry=ModelRegistry())
@@ -0,0 +1,168 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from src.models import demand_predictor
+from src.models.rule_engine import rule_engine
+
+# ===============================
+# PATH SETUP
+# ===============================
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MODEL_PATH = os.path.join(PROJECT_ROOT, "data", "models", "job_demand_model.pkl")
+
+CACHE_SIZE = int(os.environ.get("JOBAI_PREDICTION_CACHE_SIZE", 4096))
+CHECK_INTERVAL = float(os.environ.get("JOBAI_PREDICTION_CACHE_CHECK", 1.0))
+
+
+# ===============================
+# KEY NORMALIZATION
+# ===============================
+def canonical_key(jobtitle, location, experience_level, industry, required_skills):
+    """
+    Collapse inputs that predict_job_demand treats identically onto one
+    key. Skill order and case never change the result, but duplicates
+    do (they count towards skill_count), so skills stay a sorted tuple.
+    Experience is only lower-cased because the rules do not strip it.
+    """
+    skills = tuple(sorted(
+        s.strip().lower() for s in required_skills.split(",") if s.strip()
+    ))
+    return (
+        jobtitle.lower().strip(),
+        experience_level.lower(),
+        skills,
+        location.lower().strip(),
+        industry.lower().strip()
+    )
+
+
+def rules_fingerprint(model_path=MODEL_PATH):
+    """Changes whenever the rule tables or the model artifact change."""
+    h = hashlib.sha1()
+    for table in (
+        demand_predictor.ROLE_BASE_DEMAND,
+        demand_predictor.AI_EXPOSURE_BASE,
+        demand_predictor.EXPERIENCE_BONUS
+    ):
+        h.update(repr(sorted(table.items())).encode())
+
+    try:
+        st = os.stat(model_path)
+        h.update(f"{st.st_mtime_ns}:{st.st_size}".encode())
+    except OSError:
+        h.update(b"no-model")
+
+    return h.hexdigest()
+
+
+# ===============================
+# LRU CACHE
+# ===============================
+class PredictionCache:
+    """
+    LRU cache in front of predict_fn. version_fn, if given, returns the
+    model version predict_fn is serving right now; entries are dropped
+    as soon as it changes, so a hot swap never serves old results.
+    """
+
+    def __init__(self, predict_fn=None, maxsize=CACHE_SIZE,
+                 check_interval=CHECK_INTERVAL, model_path=MODEL_PATH,
+                 version_fn=None):
+        self.predict_fn = predict_fn or rule_engine.predict
+        self.maxsize = maxsize
+        self.check_interval = check_interval
+        self.model_path = model_path
+        self.version_fn = version_fn
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._fingerprint = rules_fingerprint(model_path)
+        self._version = version_fn() if version_fn else None
+        self._next_check = time.monotonic() + check_interval
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_fingerprint(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+
+        fingerprint = rules_fingerprint(self.model_path)
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            rule_engine.refresh()
+            self.clear()
+            self.invalidations += 1
+
+    def _check_version(self):
+        if self.version_fn is None:
+            return None
+        version = self.version_fn()
+        if version != self._version:
+            # None -> first version is the initial load, not a swap
+            if self._version is not None:
+                self.invalidations += 1
+            self._version = version
+            self.clear()
+        return version
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def predict(self, jobtitle, location, experience_level, industry, required_skills):
+        self._check_fingerprint()
+        version = self._check_version()
+        key = canonical_key(jobtitle, location, experience_level, industry, required_skills)
+
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+        result = self.predict_fn(jobtitle, location, experience_level, industry, required_skills)
+        self.misses += 1
+
+        # A swap while predict_fn ran: the result may come from either model
+        if self.version_fn is not None and self.version_fn() != version:
+            return result
+
+        if self.maxsize > 0:
+            with self._lock:
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+        return result
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+
+prediction_cache = PredictionCache()
+
+
+def cached_predict_job_demand(jobtitle, location, experience_level, industry, required_skills):
+    return prediction_cache.predict(
+        jobtitle, location, experience_level, industry, required_skills
+    )
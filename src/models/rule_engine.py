@@ -0,0 +1,191 @@
+import threading
+
+from src.models import demand_predictor
+
+# ===============================
+# INPUT BUCKETS
+# ===============================
+# predict_job_demand only depends on the role key (unknown roles fall
+# back to 55 in both tables), the lower-cased experience level, and
+# which side of the 2|3 and 4|5 boundaries the skill count falls on.
+# Location and industry are ignored by the rules.
+SKILL_BUCKETS = ("0-2 skills", "3-4 skills", "5+ skills")
+SKILL_REPRESENTATIVES = (0, 3, 5)
+
+OTHER_ROLE = "<other role>"
+OTHER_EXPERIENCE = "<other experience>"
+
+
+def skill_bucket(skill_count):
+    if skill_count >= 5:
+        return 2
+    if skill_count >= 3:
+        return 1
+    return 0
+
+
+def table_signature():
+    return tuple(
+        tuple(sorted(table.items()))
+        for table in (
+            demand_predictor.ROLE_BASE_DEMAND,
+            demand_predictor.AI_EXPOSURE_BASE,
+            demand_predictor.EXPERIENCE_BONUS
+        )
+    )
+
+
+# ===============================
+# COMPILER
+# ===============================
+def compile_rule_table(predict_fn=None):
+    """
+    Run the reference predictor once per (role, experience, skill
+    bucket) cell and return the axes plus dense NumPy tables of shape
+    (roles, experience levels, skill buckets).
+    """
+    import numpy as np
+
+    predict_fn = predict_fn or demand_predictor.predict_job_demand
+
+    roles = sorted(set(demand_predictor.ROLE_BASE_DEMAND) | set(demand_predictor.AI_EXPOSURE_BASE))
+    roles.append(OTHER_ROLE)
+    experience = list(demand_predictor.EXPERIENCE_BONUS)
+    experience.append(OTHER_EXPERIENCE)
+
+    shape = (len(roles), len(experience), len(SKILL_BUCKETS))
+    table = {
+        "roles": roles,
+        "experience": experience,
+        "demand_code": np.zeros(shape, dtype=np.int8),
+        "confidence": np.zeros(shape, dtype=np.int16),
+        "risk_code": np.zeros(shape, dtype=np.int8),
+        "ai_probability": np.zeros(shape, dtype=np.int16)
+    }
+
+    for r, role in enumerate(roles):
+        for e, exp in enumerate(experience):
+            for s, count in enumerate(SKILL_REPRESENTATIVES):
+                skills = ",".join(f"skill{i}" for i in range(count))
+                demand, confidence, career_risk, ai_probability = predict_fn(
+                    role, "", exp, "", skills
+                )
+                table["demand_code"][r, e, s] = demand_predictor.DEMAND_LABELS.index(demand)
+                table["confidence"][r, e, s] = confidence
+                table["risk_code"][r, e, s] = demand_predictor.RISK_LABELS.index(career_risk)
+                table["ai_probability"][r, e, s] = ai_probability
+
+    return table
+
+
+# ===============================
+# LOOKUP ENGINE
+# ===============================
+class RuleTableEngine:
+    """
+    Answers predict_job_demand queries by integer indexing into the
+    compiled table. The table is built on first use (or by compile()
+    during warmup) and rebuilt by refresh() when the rule tables change.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._signature = None
+        self.table = None
+
+        self._role_index = {}
+        self._experience_index = {}
+        self._other_role = 0
+        self._other_experience = 0
+        self._n_experience = 0
+        self._results = ()
+
+    def compile(self):
+        with self._lock:
+            signature = table_signature()
+            table = compile_rule_table()
+
+            roles, experience = table["roles"], table["experience"]
+            self._role_index = {role: i for i, role in enumerate(roles[:-1])}
+            self._experience_index = {exp: i for i, exp in enumerate(experience[:-1])}
+            self._other_role = len(roles) - 1
+            self._other_experience = len(experience) - 1
+            self._n_experience = len(experience)
+
+            # Scalar answers are the same cells as plain tuples, flattened
+            # in C order so a single index replaces the whole rule walk
+            self._results = tuple(
+                (
+                    demand_predictor.DEMAND_LABELS[d],
+                    c,
+                    demand_predictor.RISK_LABELS[k],
+                    a
+                )
+                for d, c, k, a in zip(
+                    table["demand_code"].ravel().tolist(),
+                    table["confidence"].ravel().tolist(),
+                    table["risk_code"].ravel().tolist(),
+                    table["ai_probability"].ravel().tolist()
+                )
+            )
+            self.table = table
+            self._signature = signature
+        return table
+
+    def refresh(self):
+        """Recompile if the rule tables changed since the last compile."""
+        if self.table is not None and self._signature != table_signature():
+            self.compile()
+
+    def _ensure_compiled(self):
+        if self.table is None:
+            self.compile()
+
+    # -------------------------------
+    # SCALAR
+    # -------------------------------
+    def cell(self, jobtitle, experience_level, skill_count):
+        self._ensure_compiled()
+        r = self._role_index.get(jobtitle.lower().strip(), self._other_role)
+        e = self._experience_index.get(experience_level.lower(), self._other_experience)
+        return (r * self._n_experience + e) * len(SKILL_BUCKETS) + skill_bucket(skill_count)
+
+    def predict(self, jobtitle, location, experience_level, industry, required_skills):
+        skill_count = len([s for s in required_skills.split(",") if s.strip()])
+        cell = self.cell(jobtitle, experience_level, skill_count)
+        return self._results[cell]
+
+    # -------------------------------
+    # BATCH
+    # -------------------------------
+    def predict_batch(self, jobtitles, experience_levels, required_skills):
+        import numpy as np
+
+        self._ensure_compiled()
+        table = self.table
+
+        roles, role_codes = demand_predictor.factorize(jobtitles)
+        role_idx = np.array(
+            [self._role_index.get(r.lower().strip(), self._other_role) for r in roles],
+            dtype=np.int64
+        )[role_codes]
+
+        levels, level_codes = demand_predictor.factorize(experience_levels)
+        exp_idx = np.array(
+            [self._experience_index.get(e.lower(), self._other_experience) for e in levels],
+            dtype=np.int64
+        )[level_codes]
+
+        skill_idx = demand_predictor.map_codes(required_skills, demand_predictor.count_skills)
+        skill_idx = (skill_idx >= 3).astype(np.int64) + (skill_idx >= 5)
+
+        cells = (role_idx, exp_idx, skill_idx)
+        demand = np.array(demand_predictor.DEMAND_LABELS)[table["demand_code"][cells]]
+        confidence = table["confidence"][cells].astype(np.int64)
+        career_risk = np.array(demand_predictor.RISK_LABELS)[table["risk_code"][cells]]
+        ai_probability = table["ai_probability"][cells].astype(np.int64)
+
+        return demand, confidence, career_risk, ai_probability
+
+
+rule_engine = RuleTableEngine()
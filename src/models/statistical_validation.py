@@ -1,49 +1,24 @@
-import pandas as pd
-import numpy as np
+import os
+import sys
+
 import joblib
-from scipy.stats import ttest_rel
 
-from sklearn.model_selection import cross_val_score
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.pipeline import Pipeline
-
-print("🔍 Statistical Validation Started")
 
 # ===============================
-# LOAD TRAINED PIPELINE (ONLY FOR PREPROCESSOR)
+# PATH SETUP
 # ===============================
-trained_pipeline = joblib.load("data/models/job_demand_model.pkl")
-preprocessor = trained_pipeline.named_steps["preprocessor"]
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-# ===============================
-# LOAD DATA
-# ===============================
-df = pd.read_csv("data/processed/job_market_analytics_final_with_certificates.csv")
-df.fillna("Unknown", inplace=True)
-df.columns = [c.lower() for c in df.columns]
-
-# 🔑 SAME COLUMN NORMALIZATION AS TRAINING
-COLUMN_MAP = {
-    "job_title": "jobtitle",
-    "jobrole": "jobtitle",
-    "job_role": "jobtitle",
-    "city": "location",
-    "experience": "experience_level",
-    "skills": "required_skills"
-}
-
-df.rename(
-    columns={k: v for k, v in COLUMN_MAP.items() if k in df.columns},
-    inplace=True
-)
+from src.data_pipeline.feature_store import load_features  # noqa: E402
+from src.models.fold_validation import fold_report, paired_ttest, validate_models  # noqa: E402
 
-# ===============================
-# SAME FEATURE ENGINEERING
-# ===============================
-df["skill_count"] = df["required_skills"].apply(
-    lambda x: len(str(x).split(",")) if x != "Unknown" else 0
-)
-df.drop(columns=["required_skills"], inplace=True)
+CV_SPLITS = 3
+CV_REPEATS = int(os.environ.get("JOBAI_CV_REPEATS", 1))
+
+MODEL_PATH = os.path.join(PROJECT_ROOT, "data", "models", "job_demand_model.pkl")
 
 REQUIRED_COLUMNS = [
     "jobtitle",
@@ -54,70 +29,81 @@ REQUIRED_COLUMNS = [
     "demand_label"
 ]
 
-df = df[REQUIRED_COLUMNS]
-
-X = df.drop("demand_label", axis=1)
-y = df["demand_label"]
-
-# ===============================
-# BASELINE MODEL (NO CLASS WEIGHT)
-# ===============================
-baseline_rf = RandomForestClassifier(
-    n_estimators=100,
-    random_state=42
-)
-
-baseline_pipe = Pipeline([
-    ("preprocessor", preprocessor),
-    ("model", baseline_rf)
-])
-
-# ===============================
-# TUNED MODEL (NO CLASS WEIGHT – FOR FAIR VALIDATION)
-# ===============================
-tuned_rf = RandomForestClassifier(
-    n_estimators=200,
-    max_depth=None,
-    min_samples_split=2,
-    min_samples_leaf=1,
-    random_state=42
-)
-
-tuned_pipe = Pipeline([
-    ("preprocessor", preprocessor),
-    ("model", tuned_rf)
-])
-
-# ===============================
-# CROSS-VALIDATION
-# ===============================
-baseline_scores = cross_val_score(
-    baseline_pipe,
-    X, y,
-    cv=3,
-    scoring="f1_weighted"
-)
-
-tuned_scores = cross_val_score(
-    tuned_pipe,
-    X, y,
-    cv=3,
-    scoring="f1_weighted"
-)
-
-print("\nBaseline CV Scores:", baseline_scores)
-print("Tuned CV Scores   :", tuned_scores)
-
-# ===============================
-# PAIRED T-TEST
-# ===============================
-t_stat, p_value = ttest_rel(tuned_scores, baseline_scores)
-
-print("\n📊 Paired T-Test Results")
-print("t-statistic:", t_stat)
-print("p-value    :", p_value)
 
-if p_value < 0.05:
-    print("✅ Improvement is statistically significant")
-else:
-    print("⚠️ Improvement is NOT statistically significant")
+def main():
+    print("🔍 Statistical Validation Started")
+
+    # ===============================
+    # LOAD TRAINED PIPELINE (ONLY FOR PREPROCESSOR)
+    # ===============================
+    trained_pipeline = joblib.load(MODEL_PATH)
+    preprocessor = trained_pipeline.named_steps["preprocessor"]
+
+    # ===============================
+    # LOAD FEATURES (SAME FEATURE STORE AS TRAINING)
+    # ===============================
+    df = load_features()[REQUIRED_COLUMNS]
+
+    X = df.drop("demand_label", axis=1)
+    y = df["demand_label"]
+
+    # ===============================
+    # BASELINE MODEL (NO CLASS WEIGHT)
+    # ===============================
+    baseline_rf = RandomForestClassifier(
+        n_estimators=100,
+        random_state=42
+    )
+
+    # ===============================
+    # TUNED MODEL (NO CLASS WEIGHT – FOR FAIR VALIDATION)
+    # ===============================
+    tuned_rf = RandomForestClassifier(
+        n_estimators=200,
+        max_depth=None,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        random_state=42
+    )
+
+    # ===============================
+    # CROSS-VALIDATION (CACHED FOLDS, PARALLEL FITS)
+    # ===============================
+    # The preprocessor is fitted once per fold and both models are scored
+    # on the same cached fold matrices. JOBAI_CV_REPEATS > 1 switches to
+    # repeated stratified k-fold for more paired samples.
+    results = validate_models(
+        {"baseline": baseline_rf, "tuned": tuned_rf},
+        preprocessor,
+        X, y,
+        n_splits=CV_SPLITS,
+        n_repeats=CV_REPEATS,
+        scoring="f1_weighted"
+    )
+
+    baseline_scores = results.loc[results["model"] == "baseline", "score"].to_numpy()
+    tuned_scores = results.loc[results["model"] == "tuned", "score"].to_numpy()
+
+    print("\nBaseline CV Scores:", baseline_scores)
+    print("Tuned CV Scores   :", tuned_scores)
+
+    print(f"\n⏱️ Per-fold timing ({CV_SPLITS} folds x {CV_REPEATS} repeats)")
+    print(fold_report(results).to_string())
+
+    # ===============================
+    # PAIRED T-TEST
+    # ===============================
+    t_stat, p_value = paired_ttest(results, "tuned", "baseline")
+
+    print("\n📊 Paired T-Test Results")
+    print("t-statistic:", t_stat)
+    print("p-value    :", p_value)
+
+    if p_value < 0.05:
+        print("✅ Improvement is statistically significant")
+    else:
+        print("⚠️ Improvement is NOT statistically significant")
+
+
+if __name__ == "__main__":
+    main()
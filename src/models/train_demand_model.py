@@ -1,11 +1,10 @@
-import pandas as pd
 import numpy as np
+import json
 import os
-import joblib
+import sys
+import time
 
 from sklearn.model_selection import train_test_split, RandomizedSearchCV
-from sklearn.preprocessing import OneHotEncoder
-from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 from sklearn.ensemble import RandomForestClassifier
@@ -31,60 +30,39 @@ MODEL_PATH = os.path.join(
 
 REPORT_PATH = os.path.join(PROJECT_ROOT, "results", "reports")
 
-# ===============================
-# LOAD DATA
-# ===============================
-df = pd.read_csv(DATA_PATH)
-df.columns = df.columns.str.lower()
-df = df.replace([np.inf, -np.inf], np.nan)
-df.fillna("Unknown", inplace=True)
-
-# ===============================
-# COLUMN NORMALIZATION
-# ===============================
-COLUMN_MAP = {
-    "job_title": "jobtitle",
-    "jobrole": "jobtitle",
-    "job_role": "jobtitle",
-    "city": "location",
-    "experience": "experience_level",
-    "skills": "required_skills"
-}
-
-df.rename(
-    columns={k: v for k, v in COLUMN_MAP.items() if k in df.columns},
-    inplace=True
+# Written only by this script (the pickle above is also rewritten
+# whenever the registry promotes an incrementally retrained version)
+TRAINING_RECORD_PATH = os.path.join(
+    PROJECT_ROOT, "data", "models", "last_training.json"
 )
 
-REQUIRED_COLUMNS = [
-    "jobtitle",
-    "location",
-    "experience_level",
-    "industry",
-    "required_skills",
-    "demand_label"
-]
-
-df = df[REQUIRED_COLUMNS]
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-# ===============================
-# FEATURE ENGINEERING
-# ===============================
-df["skill_count"] = df["required_skills"].apply(
-    lambda x: len(str(x).split(",")) if x != "Unknown" else 0
+from src.data_pipeline.feature_store import FEATURE_COLUMNS, load_features  # noqa: E402
+from src.models.encoding import DEFAULT_ENCODING, build_preprocessor  # noqa: E402
+from src.models.hyperparameter_search import (  # noqa: E402
+    SuccessiveHalvingSearch, random_search_log, save_search_log
 )
+from src.models.model_registry import ModelRegistry  # noqa: E402
+
+# dense | sparse | ordinal (see src/models/encoding.py)
+ENCODING = DEFAULT_ENCODING
 
-df.drop(columns=["required_skills"], inplace=True)
+# halving | random, optional wall-clock budget in seconds (0 = none),
+# halving resource: model__n_estimators | n_samples
+SEARCH_MODE = os.environ.get("JOBAI_TRAIN_SEARCH", "halving")
+SEARCH_BUDGET = float(os.environ.get("JOBAI_SEARCH_BUDGET", 0)) or None
+SEARCH_RESOURCE = os.environ.get("JOBAI_SEARCH_RESOURCE", "model__n_estimators")
 
 # ===============================
-# 🔥 BINARY TARGET (NUMERIC – CRITICAL FIX)
+# LOAD FEATURES (SHARED FEATURE STORE)
 # ===============================
-# High → 1, Not High → 0
-df["demand_binary"] = df["demand_label"].apply(
-    lambda x: 1 if x == "High" else 0
-)
+# Column normalization, skill_count and the binary target
+# (High → 1, Not High → 0) come from src/data_pipeline/feature_store.py
+df = load_features(DATA_PATH)
 
-X = df.drop(["demand_label", "demand_binary"], axis=1)
+X = df[FEATURE_COLUMNS]
 y = df["demand_binary"]
 
 # ===============================
@@ -106,19 +84,8 @@ categorical_cols = [
 ]
 numeric_cols = ["skill_count"]
 
-preprocessor = ColumnTransformer(
-    transformers=[
-        (
-            "cat",
-            OneHotEncoder(
-                handle_unknown="ignore",
-                sparse_output=False
-            ),
-            categorical_cols
-        ),
-        ("num", "passthrough", numeric_cols)
-    ]
-)
+preprocessor = build_preprocessor(ENCODING, categorical_cols, numeric_cols)
+print("\n🧮 Encoding mode:", ENCODING)
 
 # ===============================
 # CLASS WEIGHTS (NOW NUMERIC)
@@ -160,22 +127,47 @@ param_dist = {
     "model__min_samples_leaf": [1, 2]
 }
 
-search = RandomizedSearchCV(
-    estimator=pipeline,
-    param_distributions=param_dist,
-    n_iter=10,
-    cv=3,
-    scoring="f1",          # works correctly now (numeric labels)
-    random_state=42,
-    n_jobs=-1,
-    error_score="raise"
-)
-
-print("\n🔍 Starting hyperparameter tuning...")
+if SEARCH_MODE == "halving":
+    search = SuccessiveHalvingSearch(
+        estimator=pipeline,
+        param_distributions=param_dist,
+        resource=SEARCH_RESOURCE,
+        max_resource=max(param_dist["model__n_estimators"]),
+        factor=3,
+        cv=3,
+        scoring="f1",
+        time_budget=SEARCH_BUDGET,
+        random_state=42
+    )
+else:
+    search = RandomizedSearchCV(
+        estimator=pipeline,
+        param_distributions=param_dist,
+        n_iter=10,
+        cv=3,
+        scoring="f1",          # works correctly now (numeric labels)
+        random_state=42,
+        n_jobs=-1,
+        error_score="raise"
+    )
+
+print(f"\n🔍 Starting hyperparameter tuning ({SEARCH_MODE} search)...")
+search_start = time.perf_counter()
 search.fit(X_train, y_train)
+search_seconds = time.perf_counter() - search_start
 
 pipeline = search.best_estimator_
 
+print(f"⏱️ Search + refit time: {search_seconds:.1f}s")
+if SEARCH_MODE == "halving" and search.budget_exhausted_:
+    print("⚠️ Search budget exhausted – best candidate scored so far was kept")
+
+# ===============================
+# SAVE SEARCH LOG
+# ===============================
+search_log = search.log_ if SEARCH_MODE == "halving" else random_search_log(search)
+save_search_log(search_log, os.path.join(REPORT_PATH, f"search_log_{SEARCH_MODE}.csv"))
+
 # ===============================
 # SAVE BEST PARAMETERS
 # ===============================
@@ -190,17 +182,37 @@ print("\n✅ Best Parameters Saved")
 # ===============================
 y_pred = pipeline.predict(X_test)
 
+metrics = {
+    "accuracy": float(accuracy_score(y_test, y_pred)),
+    "precision": float(precision_score(y_test, y_pred, pos_label=1)),
+    "recall": float(recall_score(y_test, y_pred, pos_label=1)),
+    "f1": float(f1_score(y_test, y_pred, pos_label=1))
+}
+
 print("\n📈 Model Performance (BINARY):")
-print("Accuracy :", accuracy_score(y_test, y_pred))
-print("Precision:", precision_score(y_test, y_pred, pos_label=1))
-print("Recall   :", recall_score(y_test, y_pred, pos_label=1))
-print("F1 Score :", f1_score(y_test, y_pred, pos_label=1))
+print("Accuracy :", metrics["accuracy"])
+print("Precision:", metrics["precision"])
+print("Recall   :", metrics["recall"])
+print("F1 Score :", metrics["f1"])
 
 # ===============================
-# SAVE MODEL
+# REGISTER + PROMOTE MODEL
 # ===============================
+# The registry version is what the server and incremental retraining
+# use; MODEL_PATH is only the exported copy for scripts that load it
 os.makedirs(os.path.dirname(MODEL_PATH), exist_ok=True)
-joblib.dump(pipeline, MODEL_PATH)
-
-print("\n💾 Model saved successfully")
+registry = ModelRegistry()
+version = registry.register(pipeline, {
+    "source": "full",
+    "encoding": ENCODING,
+    "search": SEARCH_MODE,
+    "params": {k: str(v) for k, v in search.best_params_.items()},
+    "test": {k: round(v, 4) for k, v in metrics.items()}
+})
+registry.promote(version, export_path=MODEL_PATH)
+
+with open(TRAINING_RECORD_PATH, "w") as f:
+    json.dump(registry.metadata(version), f, indent=2)
+
+print(f"\n💾 Model registered and promoted as version {version} (exported to {MODEL_PATH})")
 print("🏁 Training completed successfully")
@@ -0,0 +1,202 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+from flask import Response, before_render_template, g, has_request_context, request, template_rendered
+
+# ===============================
+# SETTINGS
+# ===============================
+METRICS_ENABLED = os.environ.get("JOBAI_METRICS", "1") == "1"
+
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+)
+
+PREFIX = "jobai"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels):
+    inner = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+    return "{" + inner + "}" if inner else ""
+
+
+# ===============================
+# HISTOGRAM
+# ===============================
+class Histogram:
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name, **labels):
+        lines = []
+        cumulative = 0
+        for bound, n in zip(self.buckets, self.counts):
+            cumulative += n
+            lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {cumulative}")
+        lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {self.count}")
+        lines.append(f"{name}_sum{_labels(**labels)} {self.sum:.6f}")
+        lines.append(f"{name}_count{_labels(**labels)} {self.count}")
+        return lines
+
+
+# ===============================
+# REQUEST METRICS
+# ===============================
+class RequestMetrics:
+    """
+    Per-route latency histograms, request/error counters and a split of
+    each request into DB, template render and remaining compute time.
+    Nothing is hooked into Flask or the database unless init_app runs,
+    so a disabled instance costs nothing per request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.latency = defaultdict(Histogram)
+        self.db_time = defaultdict(Histogram)
+        self.render_time = defaultdict(Histogram)
+        self.compute_time = defaultdict(Histogram)
+        self.template_time = defaultdict(Histogram)
+        self.collectors = {}
+        self.enabled = False
+
+    # -------------------------------
+    # REGISTRATION
+    # -------------------------------
+    def init_app(self, app, database=None, enabled=METRICS_ENABLED):
+        self.enabled = enabled
+        if not enabled:
+            return
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        before_render_template.connect(self._before_render, app)
+        template_rendered.connect(self._after_render, app)
+
+        if database is not None:
+            database.observer = self._on_db_time
+
+        app.add_url_rule("/metrics", "metrics", self.metrics_view)
+
+    def register_collector(self, name, fn):
+        """fn() -> dict of numeric values exported as gauges."""
+        self.collectors[name] = fn
+
+    # -------------------------------
+    # HOOKS
+    # -------------------------------
+    def _before_request(self):
+        g._metrics_start = time.perf_counter()
+        g._metrics_db = 0.0
+        g._metrics_render = 0.0
+
+    def _on_db_time(self, seconds):
+        # Background writers have no request context; only request time counts
+        if has_request_context() and "_metrics_db" in g:
+            g._metrics_db += seconds
+
+    def _before_render(self, sender, template, context, **extra):
+        if has_request_context():
+            g._metrics_render_start = time.perf_counter()
+
+    def _after_render(self, sender, template, context, **extra):
+        start = g.get("_metrics_render_start")
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        g._metrics_render += elapsed
+        with self._lock:
+            self.template_time[template.name or "<string>"].observe(elapsed)
+
+    def _after_request(self, response):
+        start = g.get("_metrics_start")
+        if start is None:
+            return response
+
+        elapsed = time.perf_counter() - start
+        db_seconds = g.get("_metrics_db", 0.0)
+        render_seconds = g.get("_metrics_render", 0.0)
+
+        # Unmatched paths share one label so 404 scans cannot blow up cardinality
+        route = request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+        status = response.status_code
+
+        with self._lock:
+            self.requests[(route, request.method, status)] += 1
+            if status >= 500:
+                self.errors[route] += 1
+            self.latency[route].observe(elapsed)
+            self.db_time[route].observe(db_seconds)
+            self.render_time[route].observe(render_seconds)
+            self.compute_time[route].observe(max(elapsed - db_seconds - render_seconds, 0.0))
+
+        return response
+
+    # -------------------------------
+    # EXPOSITION
+    # -------------------------------
+    def render(self):
+        lines = []
+
+        with self._lock:
+            name = f"{PREFIX}_http_requests_total"
+            lines += [f"# HELP {name} HTTP requests by route, method and status.",
+                      f"# TYPE {name} counter"]
+            for (route, method, status), n in sorted(self.requests.items()):
+                lines.append(f"{name}{_labels(route=route, method=method, status=status)} {n}")
+
+            name = f"{PREFIX}_http_request_errors_total"
+            lines += [f"# HELP {name} HTTP 5xx responses by route.",
+                      f"# TYPE {name} counter"]
+            for route, n in sorted(self.errors.items()):
+                lines.append(f"{name}{_labels(route=route)} {n}")
+
+            for suffix, help_text, series in (
+                ("http_request_duration_seconds", "Total request latency.", self.latency),
+                ("http_request_db_seconds", "Time spent in SQLite per request.", self.db_time),
+                ("http_request_render_seconds", "Template render time per request.", self.render_time),
+                ("http_request_compute_seconds", "Request time outside DB and rendering.", self.compute_time),
+            ):
+                name = f"{PREFIX}_{suffix}"
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for route, hist in sorted(series.items()):
+                    lines += hist.render(name, route=route)
+
+            name = f"{PREFIX}_template_render_seconds"
+            lines += [f"# HELP {name} Render time by template.", f"# TYPE {name} histogram"]
+            for template, hist in sorted(self.template_time.items()):
+                lines += hist.render(name, template=template)
+
+        for collector, fn in sorted(self.collectors.items()):
+            for key, value in sorted(fn().items()):
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                name = f"{PREFIX}_{collector}_{key}"
+                lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+
+        return "\n".join(lines) + "\n"
+
+    def metrics_view(self):
+        return Response(self.render(), mimetype="text/plain; version=0.0.4")
+
+
+metrics = RequestMetrics()
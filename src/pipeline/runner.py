@@ -0,0 +1,378 @@
+import argparse
+import hashlib
+import importlib
+import json
+import multiprocessing
+import os
+import runpy
+import sys
+import time
+import traceback
+from collections import namedtuple
+from multiprocessing.connection import wait
+
+# ===============================
+# PATH SETUP
+# ===============================
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+STATE_PATH = os.path.join(PROJECT_ROOT, "data", "pipeline_state.json")
+MAX_WORKERS = int(os.environ.get("JOBAI_PIPELINE_WORKERS", os.cpu_count() or 1))
+
+# Imported once before any stage starts, so forked stages share them
+PRELOAD_MODULES = ["numpy", "pandas", "sklearn.ensemble", "matplotlib.pyplot"]
+
+# A stage is a flat script plus the files it reads and writes (paths
+# relative to the project root; directories are hashed file by file).
+# Environment variables listed in `env` are part of its cache key.
+Stage = namedtuple("Stage", "name script inputs outputs env", defaults=((), (), ()))
+
+
+# ===============================
+# REVIEW-2 STAGES
+# ===============================
+ANALYTICS_CSV = "data/processed/job_market_analytics_final_with_certificates.csv"
+FEATURE_STORE = "data/features"
+MODEL_PKL = "data/models/job_demand_model.pkl"
+TRAINING_RECORD = "data/models/last_training.json"
+
+REVIEW_STAGES = [
+    Stage(
+        "features", "src/data_pipeline/feature_store.py",
+        inputs=[ANALYTICS_CSV, "src/data_pipeline/schema.py"],
+        outputs=[FEATURE_STORE]
+    ),
+    Stage(
+        "eda", "eda_feature_engineering.py",
+        inputs=[FEATURE_STORE],
+        outputs=[
+            "data/processed/job_market_features_engineered.csv",
+            "results/demand_distribution.png",
+            "results/top_industries.png",
+            "results/top_locations.png"
+        ]
+    ),
+    Stage(
+        "baseline", "src/models/baseline_models.py",
+        inputs=[FEATURE_STORE, "src/models/model_comparison.py"],
+        outputs=["results/reports/baseline_comparison.csv"]
+    ),
+    Stage(
+        "train", "src/models/train_demand_model.py",
+        inputs=[FEATURE_STORE, "src/models/encoding.py", "src/models/hyperparameter_search.py"],
+        # Not MODEL_PKL: the registry re-exports it on every promotion,
+        # and an incremental version must not trigger a full retrain
+        outputs=[TRAINING_RECORD, "results/reports/best_params.txt"],
+        env=["JOBAI_TRAIN_ENCODING", "JOBAI_TRAIN_SEARCH", "JOBAI_SEARCH_BUDGET",
+             "JOBAI_SEARCH_RESOURCE"]
+    ),
+    Stage(
+        "validation", "src/models/statistical_validation.py",
+        inputs=[FEATURE_STORE, TRAINING_RECORD, MODEL_PKL, "src/models/fold_validation.py"],
+        env=["JOBAI_CV_REPEATS"]
+    ),
+    Stage("business", "src/models/business_optimization.py"),
+]
+
+
+# ===============================
+# CONTENT HASHES
+# ===============================
+def file_digest(path):
+    """sha1 of a file, or of every file under a directory (None if missing)."""
+    if os.path.isdir(path):
+        h = hashlib.sha1()
+        for folder, dirs, files in sorted(os.walk(path)):
+            dirs.sort()
+            for name in sorted(files):
+                full = os.path.join(folder, name)
+                h.update(os.path.relpath(full, path).encode())
+                h.update(file_digest(full).encode())
+        return h.hexdigest()
+    if not os.path.exists(path):
+        return None
+
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def stage_key(stage, root):
+    """Hash of the stage's script, inputs and environment settings."""
+    h = hashlib.sha1()
+    for path in [stage.script, *stage.inputs]:
+        h.update(f"{path}={file_digest(os.path.join(root, path))}\n".encode())
+    for name in stage.env:
+        h.update(f"${name}={os.environ.get(name)}\n".encode())
+    return h.hexdigest()[:16]
+
+
+def output_digests(stage, root):
+    return {path: file_digest(os.path.join(root, path)) for path in stage.outputs}
+
+
+def load_state(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_state(state, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ===============================
+# DAG
+# ===============================
+def dependencies(stages):
+    """
+    {stage name: names of the stages producing its inputs}. Raises
+    ValueError on duplicate names, an output written by two stages or
+    a cycle.
+    """
+    producers = {}
+    for stage in stages:
+        if stage.name in {s.name for s in stages if s is not stage}:
+            raise ValueError(f"duplicate stage name {stage.name!r}")
+        for path in stage.outputs:
+            if path in producers:
+                raise ValueError(f"{path} is written by both {producers[path]!r} and {stage.name!r}")
+            producers[path] = stage.name
+
+    deps = {
+        stage.name: sorted({producers[p] for p in stage.inputs if p in producers} - {stage.name})
+        for stage in stages
+    }
+
+    # Kahn's algorithm, only to reject cycles up front
+    remaining = {name: set(d) for name, d in deps.items()}
+    while remaining:
+        ready = [name for name, d in remaining.items() if not d]
+        if not ready:
+            raise ValueError(f"dependency cycle between stages {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for d in remaining.values():
+            d.difference_update(ready)
+    return deps
+
+
+# ===============================
+# STAGE EXECUTION
+# ===============================
+def run_script(stage, root):
+    """
+    Run the stage's script in this interpreter as __main__, from the
+    project root. Returns an error message, or None on success.
+    """
+    argv, cwd = sys.argv, os.getcwd()
+    script = os.path.join(root, stage.script)
+    sys.argv = [script]
+    os.chdir(root)
+    try:
+        runpy.run_path(script, run_name="__main__")
+        return None
+    except SystemExit as exc:
+        if exc.code in (None, 0):
+            return None
+        return f"exited with status {exc.code}"
+    except Exception:
+        return traceback.format_exc()
+    finally:
+        sys.argv = argv
+        os.chdir(cwd)
+
+
+def _child(stage, root, conn):
+    sys.stdout.flush()
+    error = run_script(stage, root)
+    sys.stdout.flush()
+    conn.send(error)
+    conn.close()
+
+
+def process_context():
+    """
+    fork where the platform has it (children inherit the preloaded
+    modules); spawn elsewhere, e.g. Windows, where each child imports
+    what its stage needs.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+
+def banner(stage):
+    print("\n" + "=" * 70)
+    print(f"▶ {stage.name}: {stage.script}")
+    print("=" * 70)
+    sys.stdout.flush()
+
+
+# ===============================
+# RUNNER
+# ===============================
+def run_pipeline(stages=REVIEW_STAGES, root=PROJECT_ROOT, state_path=STATE_PATH,
+                 max_workers=MAX_WORKERS, force=False, dry_run=False, preload=PRELOAD_MODULES):
+    """
+    Run `stages` in dependency order. Returns one report row per stage
+    (status ran / cached / failed / blocked) and the wall-clock seconds.
+
+    A stage is skipped ("cached") when its script, inputs and env match
+    the last successful run and its outputs are unchanged since then;
+    otherwise it runs and everything downstream sees the new outputs.
+
+    With max_workers > 1, stages whose dependencies are done run at the
+    same time, each in a forked child that inherits the modules already
+    imported here (`preload`), so no stage pays for a fresh interpreter
+    or re-imports pandas and sklearn (spawned where fork is missing). A single runnable stage runs
+    directly in this process. After a failure, its downstream stages
+    are not run; independent stages still are.
+    """
+    deps = dependencies(stages)
+    by_name = {stage.name: stage for stage in stages}
+    state = load_state(state_path)
+    report = {}
+    context = None  # only created once two stages actually run together
+
+    pending = [stage.name for stage in stages]
+    running = {}  # connection -> (stage, process, started)
+    start = time.perf_counter()
+
+    def finish(stage, error, started):
+        seconds = time.perf_counter() - started
+        if error is None:
+            state[stage.name] = {
+                "key": stage_key(stage, root),
+                "outputs": output_digests(stage, root),
+                "seconds": round(seconds, 3)
+            }
+            save_state(state, state_path)
+        else:
+            print(f"❌ {stage.name} failed: {error}")
+        report[stage.name] = {
+            "stage": stage.name,
+            "status": "ran" if error is None else "failed",
+            "seconds": round(seconds, 3),
+            "started": round(started - start, 3)
+        }
+
+    def settle():
+        """Report blocked and cached stages; return the ones ready to run."""
+        ready, resolved = [], True
+        while resolved:
+            ready, resolved = [], False
+            for name in list(pending):
+                statuses = [report.get(d, {}).get("status") for d in deps[name]]
+                if None in statuses:
+                    continue
+                stage = by_name[name]
+
+                if any(s in ("failed", "blocked") for s in statuses):
+                    status = "blocked"
+                elif dry_run and "would run" in statuses:
+                    status = "would run"
+                else:
+                    saved = state.get(name, {})
+                    cached = (
+                        not force
+                        and saved.get("key") == stage_key(stage, root)
+                        and saved.get("outputs") == output_digests(stage, root)
+                    )
+                    if cached:
+                        status = "cached"
+                    elif dry_run:
+                        status = "would run"
+                    else:
+                        ready.append(stage)
+                        continue
+
+                pending.remove(name)
+                report[name] = {"stage": name, "status": status, "seconds": 0.0, "started": None}
+                resolved = True
+        return ready
+
+    while pending or running:
+        ready = settle()
+
+        # Only pay for the imports when something actually runs
+        for module in preload if ready else ():
+            importlib.import_module(module)
+
+        for stage in ready[:max(max_workers - len(running), 0)]:
+            pending.remove(stage.name)
+            banner(stage)
+            started = time.perf_counter()
+            if max_workers == 1 or (not running and len(ready) == 1):
+                finish(stage, run_script(stage, root), started)
+                break
+
+            context = context or process_context()
+            parent_conn, child_conn = context.Pipe(duplex=False)
+            sys.stdout.flush()
+            process = context.Process(target=_child, args=(stage, root, child_conn), name=stage.name)
+            process.start()
+            child_conn.close()
+            running[parent_conn] = (stage, process, started)
+
+        if not running:
+            continue
+
+        # Wait for any running stage to finish
+        for conn in wait(list(running)):
+            stage, process, started = running.pop(conn)
+            try:
+                error = conn.recv()
+            except EOFError:
+                error = None
+            process.join()
+            if error is None and process.exitcode != 0:
+                error = f"worker exited with status {process.exitcode}"
+            finish(stage, error, started)
+
+    total = time.perf_counter() - start
+    return [report[stage.name] for stage in stages], total
+
+
+def print_report(rows, total):
+    print("\n⏱️ Pipeline timing")
+    print("=" * 52)
+    print(f"{'stage':<12} | {'status':<9} | {'start s':>8} | {'seconds':>8}")
+    print("-" * 52)
+    for row in rows:
+        started = "" if row["started"] is None else f"{row['started']:.2f}"
+        print(f"{row['stage']:<12} | {row['status']:<9} | {started:>8} | {row['seconds']:>8.2f}")
+    print("-" * 52)
+    busy = sum(row["seconds"] for row in rows if row["status"] in ("ran", "failed"))
+    print(f"Wall clock: {total:.2f}s (stage time {busy:.2f}s)")
+
+
+def failed(rows):
+    return [row["stage"] for row in rows if row["status"] in ("failed", "blocked")]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Review-2 pipeline stages")
+    parser.add_argument("--force", action="store_true", help="rerun every stage, ignoring the cache")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS,
+                        help="stages run at the same time (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="only show what would run")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    rows, total = run_pipeline(max_workers=args.workers, force=args.force, dry_run=args.dry_run)
+    print_report(rows, total)
+    if failed(rows):
+        raise SystemExit(f"❌ Failed stages: {', '.join(failed(rows))}")
@@ -0,0 +1,104 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from src.data_pipeline.cleaning_pipeline import (
+    QuantileSketch, clean_job_data, clean_job_data_streaming, feature_engineering
+)
+
+
+def reference_feature_engineering(df):
+    # The original per-row implementation
+    df["skill_count"] = df["skills"].apply(
+        lambda x: len(x.split(",")) if x != "unknown" else 0
+    )
+    metros = ["bangalore", "hyderabad", "pune", "chennai", "mumbai", "delhi"]
+    df["location_tier"] = df["joblocation_address"].apply(
+        lambda x: "Metro" if any(city in x for city in metros) else "Non-Metro"
+    )
+    return df
+
+
+def make_raw():
+    return pd.DataFrame({
+        "jobtitle": ["Data Analyst", "ML Engineer", None, "Data Analyst", "DevOps", "Tester", "Data Analyst"],
+        "skills": ["Python, SQL", "python", None, "Python, SQL", "aws,docker,", "", "Python, SQL"],
+        "joblocation_address": ["Bangalore, Karnataka", "Navi Mumbai", "Indore", "Bangalore, Karnataka",
+                                "Punekar Road, Nagpur", None, "Bangalore, Karnataka"],
+        "payrate": [10.0, None, 7.5, 10.0, 12.0, 3.0, 11.0]
+    })
+
+
+def test_vectorized_features_match_per_row_version():
+    cleaned = clean_job_data(make_raw())
+
+    got = feature_engineering(cleaned.copy())
+    expected = reference_feature_engineering(cleaned.copy())
+
+    assert_frame_equal(got, expected)
+    assert got["skill_count"].tolist() == [2, 1, 0, 3, 1, 2]
+    assert got["location_tier"].tolist() == ["Metro", "Metro", "Non-Metro", "Metro", "Non-Metro", "Metro"]
+
+
+def write_raw_csv(path, n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "jobtitle": rng.choice(["Data Analyst", "ML Engineer", None], n),
+        "skills": rng.choice(["Python, SQL", "aws,docker", "  Excel ", None], n),
+        "joblocation_address": rng.choice(["Pune", "Indore, MP", "NEW DELHI", None], n),
+        "payrate": np.where(rng.random(n) < 0.2, np.nan, rng.integers(1, 20, n)),
+        "openings": rng.integers(1, 4, n)
+    })
+    # Duplicates spread over chunk boundaries, and a payrate column
+    # whose first chunk has no gaps (read as int there, float later)
+    df = pd.concat([df, df.sample(25, random_state=1)], ignore_index=True)
+    df.loc[:6, "payrate"] = [3, 5, 7, 9, 11, 13, 15]
+    df["payrate"] = df["payrate"].astype("Int64")
+    df.to_csv(path, index=False)
+
+
+def test_streaming_output_matches_in_memory_pipeline():
+    tmp = tempfile.mkdtemp()
+    raw_path = os.path.join(tmp, "raw.csv")
+    write_raw_csv(raw_path)
+
+    expected_path = os.path.join(tmp, "expected.csv")
+    df = feature_engineering(clean_job_data(pd.read_csv(raw_path)))
+    df.to_csv(expected_path, index=False)
+
+    out_path = os.path.join(tmp, "clean.csv")
+    stats = clean_job_data_streaming(raw_path, out_path, chunksize=7)
+
+    with open(out_path) as got, open(expected_path) as expected:
+        assert got.read() == expected.read()
+    assert stats["rows_out"] == len(df)
+    assert stats["duplicates"] == stats["rows_in"] - len(df)
+    assert stats["chunks"] == 13
+    assert stats["exact_medians"]
+
+
+def test_quantile_sketch_median():
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 50, 1001).astype(float)
+
+    sketch = QuantileSketch()
+    for part in np.array_split(values, 7):
+        sketch.update(part)
+    sketch.update([np.nan])
+    assert sketch.exact
+    assert sketch.median() == pd.Series(values).median()
+
+    sketch.update([np.nan, 4.0])
+    assert sketch.median() == pd.Series(np.append(values, 4.0)).median()
+
+    # Past max_bins the median becomes approximate with bounded rank error
+    values = rng.normal(size=20_000)
+    sketch = QuantileSketch(max_bins=200)
+    for part in np.array_split(values, 20):
+        sketch.update(part)
+    assert not sketch.exact
+    rank = (values < sketch.median()).mean()
+    assert abs(rank - 0.5) < 0.02
@@ -0,0 +1,52 @@
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+
+from src.data_pipeline import columnar_store
+from src.data_pipeline.columnar_store import is_fresh, load_dataset, parquet_path, write_parquet
+
+
+def write_csv(path, n=50):
+    pd.DataFrame({
+        "job_title": ["Data Analyst", "ML Engineer"] * (n // 2),
+        "company": ["Company_1", "Company_2"] * (n // 2),
+        "location": ["Pune", "Delhi"] * (n // 2),
+        "required_skills": ["Python, SQL", "Java"] * (n // 2),
+        "demand_label": ["High", "Low"] * (n // 2)
+    }).to_csv(path, index=False)
+
+
+def test_csv_fallback_reads_requested_columns_as_categoricals(monkeypatch):
+    monkeypatch.setattr(columnar_store, "HAS_PYARROW", False)
+    path = os.path.join(tempfile.mkdtemp(), "jobs.csv")
+    write_csv(path)
+
+    df = load_dataset(path, columns=["job_title", "demand_label"])
+    assert list(df.columns) == ["job_title", "demand_label"]
+    assert df["job_title"].dtype == "category"
+    assert df["demand_label"].dtype == "category"
+
+    assert write_parquet(path) is None
+    assert not os.path.exists(parquet_path(path))
+    assert load_dataset(path)["company"].dtype == "category"
+
+
+def test_parquet_round_trip_and_refresh():
+    pytest.importorskip("pyarrow")
+    path = os.path.join(tempfile.mkdtemp(), "jobs.csv")
+    write_csv(path)
+    expected = pd.read_csv(path)
+
+    df = load_dataset(path, columns=["job_title", "location"])
+    assert is_fresh(path)
+    assert list(df.columns) == ["job_title", "location"]
+    assert df["location"].dtype == "category"
+    assert df["job_title"].astype(str).tolist() == expected["job_title"].tolist()
+
+    # A newer CSV invalidates the columnar copy
+    write_csv(path, n=10)
+    os.utime(path, (os.path.getmtime(parquet_path(path)) + 10,) * 2)
+    assert not is_fresh(path)
+    assert len(load_dataset(path)) == 10
@@ -0,0 +1,65 @@
+import os
+import sqlite3
+import tempfile
+import threading
+
+import pytest
+
+from src.database.connection import Database
+
+
+def make_database(pool_size=2):
+    database = Database(os.path.join(tempfile.mkdtemp(), "pool.db"), pool_size=pool_size)
+    database.init_schema()
+
+    opened = []
+    connect = database.connect
+
+    def counting_connect():
+        conn = connect()
+        opened.append(conn)
+        return conn
+
+    database.connect = counting_connect
+    return database, opened
+
+
+def test_request_threads_reuse_pooled_connections():
+    database, opened = make_database()
+
+    # werkzeug's threaded server handles each request on a new thread
+    for _ in range(50):
+        thread = threading.Thread(target=database.query_one, args=("SELECT 1 AS n",))
+        thread.start()
+        thread.join()
+
+    assert len(opened) == 1
+    assert len(database._idle) == 1
+
+
+def test_pool_keeps_at_most_pool_size_idle_connections():
+    database, opened = make_database(pool_size=2)
+    barrier = threading.Barrier(6)
+
+    def request():
+        with database.checkout() as conn:
+            barrier.wait()
+            conn.execute("SELECT 1")
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(opened) == 6
+    assert len(database._idle) == 2
+    # The four extra connections were closed when they were returned
+    extra = [conn for conn in opened if conn not in database._idle]
+    assert len(extra) == 4
+    for conn in extra:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    assert database.query_one("SELECT 1 AS n")["n"] == 1
+    database.close_all()
+    assert database._idle == []
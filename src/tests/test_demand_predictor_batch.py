@@ -0,0 +1,67 @@
+import itertools
+import random
+
+import numpy as np
+
+from src.models.demand_predictor import (
+    ROLE_BASE_DEMAND,
+    predict_job_demand,
+    predict_job_demand_batch
+)
+
+ROLES = list(ROLE_BASE_DEMAND) + ["  AI Engineer ", "Mechanical Engineer", ""]
+EXPERIENCE = ["Fresher", "2-5 years", "5+ YEARS", "10 years", " fresher", ""]
+SKILLS = [
+    "",
+    "python",
+    "python, sql",
+    "python, sql, , aws",
+    "a, b, c, d",
+    "a, b, c, d, e",
+    "a,b,c,d,e,f,g",
+    " , ,"
+]
+
+
+def assert_matches_scalar(titles, experience, skills):
+    batch = predict_job_demand_batch(titles, experience, skills)
+    columns = [col.tolist() for col in batch]
+
+    for i, row in enumerate(zip(titles, experience, skills)):
+        expected = predict_job_demand(row[0], "india", row[1], "it", row[2])
+        got = tuple(col[i] for col in columns)
+        assert got == expected, (row, got, expected)
+
+
+def test_batch_matches_scalar_on_full_grid():
+    grid = list(itertools.product(ROLES, EXPERIENCE, SKILLS))
+    titles, experience, skills = map(list, zip(*grid))
+    assert_matches_scalar(titles, experience, skills)
+
+
+def test_batch_matches_scalar_on_random_rows():
+    rng = random.Random(7)
+    n = 5000
+    titles = [rng.choice(ROLES) for _ in range(n)]
+    experience = [rng.choice(EXPERIENCE) for _ in range(n)]
+    skills = [rng.choice(SKILLS) for _ in range(n)]
+    assert_matches_scalar(titles, experience, skills)
+
+
+def test_empty_batch():
+    demand, confidence, career_risk, ai_probability = predict_job_demand_batch([], [], [])
+    assert demand.size == confidence.size == career_risk.size == ai_probability.size == 0
+
+
+def test_mismatched_columns_are_rejected():
+    try:
+        predict_job_demand_batch(["a"], ["b", "c"], ["d"])
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
+
+
+def test_returns_numpy_arrays():
+    demand, confidence, _, _ = predict_job_demand_batch(["ai engineer"], ["5+ years"], ["a,b,c,d,e"])
+    assert isinstance(demand, np.ndarray)
+    assert confidence.tolist() == [85]
@@ -0,0 +1,49 @@
+import pandas as pd
+from scipy import sparse
+
+from src.models.encoding import ENCODING_MODES, build_preprocessor
+
+X = pd.DataFrame({
+    "jobtitle": ["AI Engineer", "Data Analyst", "AI Engineer"],
+    "location": ["Pune", "Delhi", "Delhi"],
+    "experience_level": ["Senior", "Fresher", "Mid"],
+    "industry": ["IT", "IT", "Finance"],
+    "skill_count": [3, 4, 3]
+})
+UNSEEN = pd.DataFrame([{
+    "jobtitle": "Chef", "location": "Goa", "experience_level": "Senior",
+    "industry": "Food", "skill_count": 5
+}])
+
+
+def test_sparse_mode_keeps_csr_output():
+    encoded = build_preprocessor("sparse").fit_transform(X)
+    assert sparse.isspmatrix_csr(encoded)
+    # one non-zero per categorical column plus the skill count
+    assert encoded.nnz == len(X) * 5
+
+
+def test_dense_and_sparse_encode_the_same_matrix():
+    dense = build_preprocessor("dense").fit_transform(X)
+    csr = build_preprocessor("sparse").fit_transform(X)
+    assert (csr.toarray() == dense).all()
+
+
+def test_ordinal_mode_has_one_column_per_feature():
+    encoded = build_preprocessor("ordinal").fit_transform(X)
+    assert encoded.shape == (3, 5)
+
+
+def test_unseen_categories_are_tolerated_in_every_mode():
+    for mode in ENCODING_MODES:
+        preprocessor = build_preprocessor(mode)
+        preprocessor.fit(X)
+        assert preprocessor.transform(UNSEEN).shape[0] == 1
+
+
+def test_unknown_mode_is_rejected():
+    try:
+        build_preprocessor("hashing")
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
@@ -0,0 +1,107 @@
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+
+from src.data_pipeline import feature_store
+from src.data_pipeline.feature_store import (
+    DATA_PATH, artifact_path, build_features, engineered_output, load_features
+)
+
+CSV = """Job_Title,Location,Experience_Level,Industry,Required_Skills,Demand_Label,Certificates
+AI Engineer,Pune,Senior,IT,"Python, SQL, AWS",High,AWS Certified
+Data Analyst,Delhi,Fresher,Finance,,Low,
+DevOps Engineer,Delhi,Mid,IT,Docker,Medium,"CKA, AWS Certified"
+"""
+
+
+def write_csv(text=CSV):
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "jobs.csv")
+    with open(path, "w") as f:
+        f.write(text)
+    return path, os.path.join(folder, "store")
+
+
+def legacy_features(csv_path):
+    # The per-script code this module replaces
+    df = pd.read_csv(csv_path)
+    df.fillna("Unknown", inplace=True)
+    df.columns = [c.lower() for c in df.columns]
+    df.rename(columns={"job_title": "jobtitle"}, inplace=True)
+    df["skill_count"] = df["required_skills"].apply(
+        lambda x: len(str(x).split(",")) if x != "Unknown" else 0
+    )
+    df["certificate_count"] = df["certificates"].apply(
+        lambda x: len(str(x).split(",")) if x != "Unknown" else 0
+    )
+    df["demand_binary"] = df["demand_label"].apply(lambda x: 1 if x == "High" else 0)
+    return df
+
+
+def test_build_matches_legacy_feature_code():
+    csv_path, _ = write_csv()
+    features = build_features(pd.read_csv(csv_path))
+    pd.testing.assert_frame_equal(features, legacy_features(csv_path))
+    assert features["skill_count"].tolist() == [3, 0, 1]
+    assert features["demand_binary"].tolist() == [1, 0, 0]
+
+
+def test_artifact_is_reused_until_csv_changes():
+    csv_path, store = write_csv()
+    first = load_features(csv_path, store_dir=store)
+    path = artifact_path(csv_path, store_dir=store)
+    assert os.path.exists(path)
+
+    mtime = os.stat(path).st_mtime_ns
+    pd.testing.assert_frame_equal(load_features(csv_path, store_dir=store), first)
+    assert os.stat(path).st_mtime_ns == mtime
+
+    with open(csv_path, "a") as f:
+        f.write("Data Engineer,Pune,Senior,IT,\"Spark, SQL\",High,\n")
+
+    second = load_features(csv_path, store_dir=store)
+    assert len(second) == 4
+    assert artifact_path(csv_path, store_dir=store) != path
+    # The stale artifact is replaced, not accumulated
+    assert os.listdir(store) == [os.path.basename(artifact_path(csv_path, store_dir=store))]
+
+
+def test_cleanup_keeps_artifacts_of_other_csvs():
+    csv_path, store = write_csv()
+    other = os.path.join(os.path.dirname(csv_path), "jobs-extra.csv")
+    with open(other, "w") as f:
+        f.write(CSV)
+
+    load_features(other, store_dir=store)
+    with open(csv_path, "a") as f:
+        f.write("Data Engineer,Pune,Senior,IT,SQL,High,\n")
+    load_features(csv_path, store_dir=store)
+
+    assert sorted(os.listdir(store)) == sorted([
+        os.path.basename(artifact_path(csv_path, store_dir=store)),
+        os.path.basename(artifact_path(other, store_dir=store))
+    ])
+
+
+def test_feature_key_is_cached_by_size_and_mtime(monkeypatch):
+    csv_path, _ = write_csv()
+    key = feature_store.feature_key(csv_path)
+
+    def no_hashing():
+        raise AssertionError("CSV re-hashed on a cache hit")
+
+    monkeypatch.setattr(feature_store.hashlib, "sha1", no_hashing)
+    assert feature_store.feature_key(csv_path) == key
+
+
+ENGINEERED_PATH = os.path.join(os.path.dirname(DATA_PATH), "job_market_features_engineered.csv")
+
+
+@pytest.mark.skipif(not os.path.exists(DATA_PATH), reason="processed dataset not present")
+def test_engineered_csv_keeps_its_tracked_header():
+    features = build_features(pd.read_csv(DATA_PATH, nrows=50))
+    tracked = pd.read_csv(ENGINEERED_PATH, nrows=0).columns.tolist()
+    assert engineered_output(features).columns.tolist() == tracked
+    assert "job_title" in tracked and "demand_binary" not in tracked
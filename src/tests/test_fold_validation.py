@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import cross_val_score
+from sklearn.pipeline import Pipeline
+from sklearn.tree import DecisionTreeClassifier
+
+from src.models.encoding import build_preprocessor
+from src.models.fold_validation import fold_report, paired_ttest, validate_models
+
+
+def make_data(n=300):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({
+        "jobtitle": rng.choice(["AI Engineer", "Data Analyst", "DevOps Engineer"], n),
+        "location": rng.choice(["Pune", "Delhi"], n),
+        "experience_level": rng.choice(["Senior", "Fresher"], n),
+        "industry": rng.choice(["IT", "Finance"], n),
+        "skill_count": rng.integers(1, 8, n)
+    })
+    y = np.where(X["skill_count"] > 4, "High", np.where(X["jobtitle"] == "AI Engineer", "Medium", "Low"))
+    noisy = rng.random(n) < 0.25
+    y[noisy] = rng.choice(["High", "Medium", "Low"], noisy.sum())
+    return X, pd.Series(y)
+
+
+MODELS = {
+    "shallow": DecisionTreeClassifier(max_depth=2, random_state=0),
+    "deep": DecisionTreeClassifier(random_state=0)
+}
+
+
+def test_scores_match_cross_val_score():
+    X, y = make_data()
+    preprocessor = build_preprocessor("dense")
+    results = validate_models(MODELS, preprocessor, X, y, n_splits=3, max_workers=2)
+
+    for name, model in MODELS.items():
+        expected = cross_val_score(
+            Pipeline([("preprocessor", preprocessor), ("model", model)]),
+            X, y, cv=3, scoring="f1_weighted"
+        )
+        got = results[results["model"] == name].sort_values("fold")["score"].to_numpy()
+        assert np.allclose(got, expected)
+
+
+def test_repeated_folds_give_more_paired_samples():
+    X, y = make_data()
+    results = validate_models(
+        MODELS, build_preprocessor("ordinal"), X, y, n_splits=3, n_repeats=2, max_workers=1
+    )
+
+    assert len(results) == 3 * 2 * len(MODELS)
+    assert sorted(results["repeat"].unique()) == [0, 1]
+
+    t_stat, p_value = paired_ttest(results, "deep", "shallow")
+    assert np.isfinite(p_value)
+
+    report = fold_report(results)
+    assert len(report) == 6
+    assert (report["encode_s"] > 0).all()
+    assert {"shallow score", "deep fit_s"} <= set(report.columns)
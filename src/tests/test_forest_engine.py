@@ -0,0 +1,65 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+
+from src.models.encoding import build_preprocessor
+from src.models.forest_engine import ForestEngine
+
+
+def make_data(n=400):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({
+        "jobtitle": rng.choice(["AI Engineer", "Data Analyst", "DevOps Engineer"], n),
+        "location": rng.choice(["Pune", "Delhi"], n),
+        "experience_level": rng.choice(["Senior", "Fresher"], n),
+        "industry": rng.choice(["IT", "Finance"], n),
+        "skill_count": rng.integers(1, 8, n)
+    })
+    y = ((X["jobtitle"] == "AI Engineer") | (X["skill_count"] > 5)).astype(int)
+    noisy = rng.random(n) < 0.2
+    y[noisy] = 1 - y[noisy]
+    return X, y
+
+
+def train_pipeline(encoding):
+    X, y = make_data()
+    pipeline = Pipeline([
+        ("preprocessor", build_preprocessor(encoding)),
+        ("model", RandomForestClassifier(n_estimators=25, min_samples_leaf=2, random_state=0))
+    ])
+    pipeline.fit(X, y)
+    return pipeline, X
+
+
+def test_matches_pipeline_for_every_encoding():
+    for encoding in ("dense", "sparse", "ordinal"):
+        pipeline, X = train_pipeline(encoding)
+        engine = ForestEngine.from_pipeline(pipeline)
+
+        assert np.array_equal(engine.predict_proba(X), pipeline.predict_proba(X))
+        assert np.array_equal(engine.predict(X), pipeline.predict(X))
+
+
+def test_single_row_and_unknown_categories():
+    for encoding in ("dense", "ordinal"):
+        pipeline, X = train_pipeline(encoding)
+        engine = ForestEngine.from_pipeline(pipeline)
+
+        row = {"jobtitle": "Chef", "location": "Pune", "experience_level": "Senior",
+               "industry": "Retail", "skill_count": 6}
+        expected = pipeline.predict_proba(pd.DataFrame([row]))
+        assert np.array_equal(engine.predict_proba(row), expected)
+
+
+def test_save_and_load_round_trip():
+    pipeline, X = train_pipeline("ordinal")
+    path = os.path.join(tempfile.mkdtemp(), "forest")
+    ForestEngine.from_pipeline(pipeline).save(path)
+
+    engine = ForestEngine.load(path, mmap_mode="r")
+    assert isinstance(engine.children, np.memmap)
+    assert np.array_equal(engine.predict_proba(X), pipeline.predict_proba(X))
@@ -0,0 +1,78 @@
+import os
+import tempfile
+
+from src.database.connection import INSERT_PREDICTION, Database
+
+
+def make_database(n=53):
+    database = Database(os.path.join(tempfile.mkdtemp(), "history.db"))
+    database.init_schema()
+    database.executemany(INSERT_PREDICTION, [
+        (
+            "ai engineer" if i % 3 == 0 else "data analyst",
+            "pune" if i % 2 else "delhi",
+            "2-5 years", "it", 3,
+            ["High", "Medium", "Low"][i % 3],
+            70.0
+        )
+        for i in range(n)
+    ])
+    return database
+
+
+def walk(database, **filters):
+    ids = []
+    cursor = None
+    while True:
+        rows, cursor = database.prediction_page(limit=10, before_id=cursor, **filters)
+        ids.extend(row["id"] for row in rows)
+        if cursor is None:
+            return ids
+
+
+def test_pages_cover_all_rows_newest_first():
+    database = make_database()
+    ids = walk(database)
+    assert ids == list(range(53, 0, -1))
+
+
+def test_filters_combine():
+    database = make_database()
+    expected = [
+        row["id"] for row in database.query(
+            "SELECT id FROM predictions WHERE demand = 'High' AND location = 'pune' ORDER BY id DESC"
+        )
+    ]
+    assert walk(database, demand="High", location="pune") == expected
+    assert len(expected) > 0
+
+
+def test_last_page_has_no_cursor():
+    database = make_database(n=10)
+    rows, cursor = database.prediction_page(limit=10)
+    assert len(rows) == 10
+    assert cursor is None
+
+
+def test_filtered_pages_use_an_index():
+    database = make_database()
+    plan = database.query(
+        "EXPLAIN QUERY PLAN SELECT id FROM predictions "
+        "WHERE jobtitle = ? AND id < ? ORDER BY id DESC LIMIT 11",
+        ("ai engineer", 40)
+    )
+    assert "idx_predictions_jobtitle" in plan[0]["detail"]
+
+
+def test_unused_created_at_index_is_dropped():
+    path = os.path.join(tempfile.mkdtemp(), "old.db")
+    old = Database(path)
+    old.init_schema()
+    old.execute("CREATE INDEX idx_predictions_created_at ON predictions (created_at, id)")
+    old.close_all()
+
+    database = Database(path)
+    database.init_schema()
+    indexes = {row["name"] for row in database.query("PRAGMA index_list(predictions)")}
+    assert "idx_predictions_created_at" not in indexes
+    assert "idx_predictions_demand" in indexes
@@ -0,0 +1,86 @@
+import csv
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+
+from src.models.encoding import build_preprocessor
+from src.models.hyperparameter_search import SuccessiveHalvingSearch, save_search_log
+
+PARAM_DIST = {
+    "model__n_estimators": [10, 20],
+    "model__max_depth": [2, 4, 6],
+    "model__min_samples_leaf": [1, 2, 4]
+}
+
+
+def make_data(n=300):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({
+        "jobtitle": rng.choice(["AI Engineer", "Data Analyst", "DevOps Engineer"], n),
+        "location": rng.choice(["Pune", "Delhi"], n),
+        "experience_level": rng.choice(["Senior", "Fresher"], n),
+        "industry": rng.choice(["IT", "Finance"], n),
+        "skill_count": rng.integers(1, 8, n)
+    })
+    y = ((X["jobtitle"] == "AI Engineer") | (X["skill_count"] > 5)).astype(int)
+    return X, y
+
+
+def make_pipeline():
+    return Pipeline([
+        ("preprocessor", build_preprocessor("ordinal")),
+        ("model", RandomForestClassifier(random_state=0))
+    ])
+
+
+def test_halving_schedule_and_log():
+    X, y = make_data()
+    search = SuccessiveHalvingSearch(
+        make_pipeline(), PARAM_DIST, resource="model__n_estimators", max_resource=27
+    ).fit(X, y)
+
+    # 9 candidates (n_estimators is the resource): 9 @ 9 trees, 3 @ 27
+    rungs = [(r["rung"], r["resource"]) for r in search.log_]
+    assert rungs.count((0, 9)) == 9
+    assert rungs.count((1, 27)) == 3
+    assert len(rungs) == 12
+
+    assert search.best_params_["model__n_estimators"] == 27
+    assert search.best_estimator_.predict(X).shape == (len(X),)
+    assert sum(r["promoted"] for r in search.log_ if r["rung"] == 0) == 3
+
+
+def test_sample_count_resource():
+    X, y = make_data()
+    search = SuccessiveHalvingSearch(
+        make_pipeline(), PARAM_DIST, resource="n_samples", n_candidates=9
+    ).fit(X, y)
+
+    resources = sorted({r["resource"] for r in search.log_})
+    assert resources == [100, 300]
+    assert "model__n_estimators" in search.best_params_
+
+
+def test_budget_stops_early_and_log_is_saved():
+    X, y = make_data()
+    search = SuccessiveHalvingSearch(
+        make_pipeline(), PARAM_DIST, max_resource=27, time_budget=1e-9
+    ).fit(X, y)
+
+    assert search.budget_exhausted_
+    assert len(search.log_) == 1
+    assert search.best_params_ == {
+        **json.loads(search.log_[0]["params"]), "model__n_estimators": 27
+    }
+
+    path = os.path.join(tempfile.mkdtemp(), "reports", "search_log.csv")
+    save_search_log(search.log_, path)
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["search"] == "halving"
+    assert rows[0]["promoted"] == "1"
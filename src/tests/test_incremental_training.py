@@ -0,0 +1,131 @@
+import os
+import sqlite3
+import tempfile
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+
+from src.database.connection import INSERT_PREDICTION, Database
+from src.models.encoding import build_preprocessor
+from src.models.incremental_training import load_state, retrain
+from src.models.model_registry import ModelRegistry
+
+TITLES = ["AI Engineer", "Data Analyst", "DevOps Engineer"]
+
+
+def train_base(path):
+    rng = np.random.default_rng(0)
+    n = 300
+    X = pd.DataFrame({
+        "jobtitle": rng.choice(TITLES, n),
+        "location": rng.choice(["Pune", "Delhi"], n),
+        "experience_level": rng.choice(["Senior", "Fresher"], n),
+        "industry": rng.choice(["IT", "Finance"], n),
+        "skill_count": rng.integers(1, 8, n)
+    })
+    y = (X["skill_count"] > 5).astype(int)
+    pipeline = Pipeline([
+        ("preprocessor", build_preprocessor("ordinal")),
+        ("model", RandomForestClassifier(n_estimators=10, random_state=0))
+    ])
+    pipeline.fit(X, y)
+    joblib.dump(pipeline, path)
+    return pipeline
+
+
+def insert_feedback(database, n, seed=1, labeled_at="2026-01-01 00:00:00"):
+    # The web app stores lower-cased inputs and whatever demand it served
+    # (here always "Low"); the observed outcome labels AI roles High
+    rng = np.random.default_rng(seed)
+    first_id = database.query_one("SELECT COALESCE(MAX(id), 0) AS n FROM predictions")["n"] + 1
+    rows, labels = [], []
+    for i in range(n):
+        title = str(rng.choice(TITLES))
+        skills = int(rng.integers(1, 8))
+        actual = "High" if title == "AI Engineer" or skills > 5 else "Low"
+        rows.append((title.lower(), "pune", "senior", "it", skills, "Low", 70.0))
+        labels.append((first_id + i, actual, labeled_at))
+    database.executemany(INSERT_PREDICTION, rows)
+    database.label_predictions(labels)
+
+
+def test_warm_start_adds_trees_and_writes_a_version():
+    tmp = tempfile.mkdtemp()
+    model_path = os.path.join(tmp, "model.pkl")
+    state_path = os.path.join(tmp, "state.json")
+    registry = ModelRegistry(os.path.join(tmp, "registry"))
+    base = train_base(model_path)
+    base_trees = list(base.named_steps["model"].estimators_)
+
+    database = Database(os.path.join(tmp, "jobai.db"))
+    insert_feedback(database, 300)
+
+    summary = retrain(database=database, registry=registry, n_new_trees=20, min_rows=100,
+                      model_path=model_path, state_path=state_path)
+
+    assert summary["status"] == "promoted"
+    assert summary["trees"] == 30
+    assert summary["after"]["f1"] >= summary["before"]["f1"]
+
+    updated = joblib.load(model_path).named_steps["model"]
+    assert len(updated.estimators_) == 30
+    sample = np.array([[0, 0, 0, 0, 3]], dtype=np.float32)
+    for old, new in zip(base_trees, updated.estimators_[:10]):
+        assert np.array_equal(old.predict_proba(sample), new.predict_proba(sample))
+    assert len(base.named_steps["model"].estimators_) == 10
+
+    assert registry.current_version() == summary["version"] == 1
+    assert registry.metadata(1)["promoted"] is True
+    assert load_state(state_path) == {"last_labeled_at": "2026-01-01 00:00:00", "last_prediction_id": 300}
+
+    # Nothing new past the watermark
+    summary = retrain(database=database, registry=registry, min_rows=100,
+                      model_path=model_path, state_path=state_path)
+    assert summary["status"] == "skipped"
+    assert summary["new_rows"] == 0
+    database.close_all()
+
+
+def test_only_observed_outcomes_are_training_rows():
+    tmp = tempfile.mkdtemp()
+    model_path = os.path.join(tmp, "model.pkl")
+    train_base(model_path)
+    database = Database(os.path.join(tmp, "jobai.db"))
+    kwargs = dict(database=database, registry=ModelRegistry(os.path.join(tmp, "registry")),
+                  min_rows=100, model_path=model_path, state_path=os.path.join(tmp, "state.json"))
+
+    # Served predictions alone are not labels
+    database.executemany(INSERT_PREDICTION, [("ai engineer", "pune", "senior", "it", 3, "High", 90.0)] * 200)
+    with pytest.raises(ValueError):
+        retrain(**kwargs)
+
+    insert_feedback(database, 300)
+    assert retrain(**kwargs)["new_rows"] == 300
+
+    # An old prediction labeled later is still picked up
+    database.label_predictions([(1, "High", "2026-02-01 00:00:00")])
+    summary = retrain(**kwargs)
+    assert summary["status"] == "skipped"
+    assert summary["new_rows"] == 1
+    database.close_all()
+
+
+def test_label_columns_are_added_to_existing_databases():
+    path = os.path.join(tempfile.mkdtemp(), "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE predictions (id INTEGER PRIMARY KEY AUTOINCREMENT, jobtitle TEXT, location TEXT, "
+        "experience_level TEXT, industry TEXT, skill_count INTEGER, demand TEXT, confidence REAL, created_at TEXT)"
+    )
+    conn.commit()
+    conn.close()
+
+    database = Database(path)
+    database.executemany(INSERT_PREDICTION, [("tester", "pune", "fresher", "it", 1, "Low", 50.0)])
+    database.label_predictions([(1, "Medium", None)])
+    assert database.labeled_after()[0]["actual_demand"] == "Medium"
+    database.close_all()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+
+from flask import Flask, render_template_string
+
+from src.database.connection import Database
+from src.monitoring.metrics import RequestMetrics
+
+
+def make_app(enabled=True):
+    database = Database(os.path.join(tempfile.mkdtemp(), "metrics.db"))
+    database.init_schema()
+
+    app = Flask(__name__)
+    metrics = RequestMetrics()
+
+    @app.route("/items/<int:item_id>")
+    def item(item_id):
+        database.query("SELECT COUNT(*) FROM predictions")
+        return render_template_string("item {{ item_id }}", item_id=item_id)
+
+    @app.route("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    metrics.init_app(app, database, enabled=enabled)
+    metrics.register_collector("queue", lambda: {"depth": 3, "label": "x"})
+    return app, metrics, database
+
+
+def test_routes_are_labelled_by_rule_and_timed():
+    app, metrics, _ = make_app()
+    client = app.test_client()
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing/path")
+
+    text = client.get("/metrics").text
+    assert 'jobai_http_requests_total{route="/items/<int:item_id>",method="GET",status="200"} 2' in text
+    assert 'jobai_http_requests_total{route="<unmatched>",method="GET",status="404"} 1' in text
+    assert 'jobai_http_request_duration_seconds_count{route="/items/<int:item_id>"} 2' in text
+    assert "jobai_queue_depth 3" in text
+    assert "jobai_queue_label" not in text
+
+    assert metrics.db_time["/items/<int:item_id>"].sum > 0
+    assert metrics.template_time["<string>"].count == 2
+
+
+def test_server_errors_are_counted():
+    app, metrics, _ = make_app()
+    app.config["PROPAGATE_EXCEPTIONS"] = False
+    client = app.test_client()
+
+    assert client.get("/boom").status_code == 500
+    assert metrics.errors["/boom"] == 1
+
+
+def test_disabled_metrics_install_nothing():
+    app, metrics, database = make_app(enabled=False)
+    client = app.test_client()
+
+    client.get("/items/1")
+    assert client.get("/metrics").status_code == 404
+    assert database.observer is None
+    assert not metrics.requests
@@ -0,0 +1,43 @@
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.tree import DecisionTreeClassifier
+
+from src.models.model_comparison import RESULT_COLUMNS, compare_models
+
+
+def make_data(n=400):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n, 4))
+    y = np.where(X[:, 0] + X[:, 1] > 0.5, "High", np.where(X[:, 2] > 0, "Medium", "Low"))
+    return X[:300], X[300:], y[:300], y[300:]
+
+
+def models():
+    return {
+        "Logistic Regression": LogisticRegression(max_iter=1000),
+        "Decision Tree": DecisionTreeClassifier(random_state=0)
+    }
+
+
+def test_parallel_results_match_direct_fit():
+    X_train, X_test, y_train, y_test = make_data()
+    results = compare_models(models(), X_train, X_test, y_train, y_test, max_workers=2)
+
+    assert list(results.columns) == RESULT_COLUMNS
+    assert results["Model"].tolist() == list(models())
+    assert (results["Fit_Seconds"] >= 0).all()
+
+    for name, model in models().items():
+        y_pred = model.fit(X_train, y_train).predict(X_test)
+        row = results.set_index("Model").loc[name]
+        assert row["Accuracy"] == accuracy_score(y_test, y_pred)
+        assert np.isclose(row["F1"], f1_score(y_test, y_pred, average="weighted"))
+        assert 0 <= row["AUC"] <= 1
+
+
+def test_single_worker_runs_inline():
+    X_train, X_test, y_train, y_test = make_data()
+    serial = compare_models(models(), X_train, X_test, y_train, y_test, max_workers=1)
+    parallel = compare_models(models(), X_train, X_test, y_train, y_test, max_workers=2)
+    assert serial["F1"].tolist() == parallel["F1"].tolist()
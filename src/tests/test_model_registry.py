@@ -0,0 +1,142 @@
+import os
+import tempfile
+import threading
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+
+from src.models.encoding import build_preprocessor
+from src.models.model_registry import ModelRegistry
+from src.models.model_server import MicroBatchModelServer
+from src.models.prediction_cache import PredictionCache
+
+
+def make_data(n=300):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({
+        "jobtitle": rng.choice(["AI Engineer", "Data Analyst", "DevOps Engineer"], n),
+        "location": rng.choice(["Pune", "Delhi"], n),
+        "experience_level": rng.choice(["Senior", "Fresher"], n),
+        "industry": rng.choice(["IT", "Finance"], n),
+        "skill_count": rng.integers(1, 8, n)
+    })
+    y = ((X["jobtitle"] == "AI Engineer") | (X["skill_count"] > 5)).astype(int)
+    return X, y
+
+
+def train(n_estimators, seed):
+    X, y = make_data()
+    pipeline = Pipeline([
+        ("preprocessor", build_preprocessor("ordinal")),
+        ("model", RandomForestClassifier(n_estimators=n_estimators, max_depth=3, random_state=seed))
+    ])
+    return pipeline.fit(X, y), X
+
+
+def test_register_promote_and_mmap_load():
+    tmp = tempfile.mkdtemp()
+    registry = ModelRegistry(os.path.join(tmp, "registry"))
+    export_path = os.path.join(tmp, "job_demand_model.pkl")
+    pipeline, X = train(10, 0)
+
+    assert registry.current_version() is None
+    version = registry.register(pipeline, {"source": "test"})
+    assert version == 1
+    assert registry.register(pipeline) == 2
+    assert registry.versions() == [1, 2]
+
+    registry.promote(1, export_path=export_path)
+    assert registry.current_version() == 1
+    assert registry.metadata(1)["source"] == "test"
+    assert registry.metadata(1)["forest_engine"] is True
+    assert np.array_equal(joblib.load(export_path).predict(X), pipeline.predict(X))
+
+    engine = registry.load_engine()
+    assert isinstance(engine.children, np.memmap)
+    assert np.array_equal(engine.predict_proba(X), pipeline.predict_proba(X))
+
+    with pytest.raises(ValueError):
+        registry.promote(7, export_path=None)
+
+
+def test_server_hot_swaps_without_dropping_requests():
+    tmp = tempfile.mkdtemp()
+    registry = ModelRegistry(os.path.join(tmp, "registry"))
+    old, X = train(5, 0)
+    new, _ = train(15, 1)
+    registry.register(old)
+    registry.promote(1, export_path=None)
+
+    server = MicroBatchModelServer(os.path.join(tmp, "missing.pkl"), max_batch_size=8,
+                                   max_delay_ms=2, registry=registry, poll_seconds=0)
+    server.load()
+    rows = X.head(50).to_dict("records")
+    first = [server.predict_proba_high(row) for row in rows[:5]]
+    assert np.allclose(first, old.predict_proba(X.head(5))[:, 1])
+
+    errors = []
+
+    def client():
+        try:
+            for row in rows:
+                server.predict_proba_high(row)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=client) for _ in range(4)]
+    for t in threads:
+        t.start()
+    registry.register(new)
+    registry.promote(2, export_path=None)
+    for t in threads:
+        t.join()
+
+    after = [server.predict_proba_high(row) for row in rows[:5]]
+    server.stop()
+
+    assert errors == []
+    assert np.allclose(after, new.predict_proba(X.head(5))[:, 1])
+    stats = server.stats()
+    assert stats["model_version"] == 2
+    assert stats["swaps"] == 1
+    assert stats["requests"] == 5 + 4 * 50 + 5
+
+
+def test_cache_follows_the_served_version_after_a_swap():
+    tmp = tempfile.mkdtemp()
+    registry = ModelRegistry(os.path.join(tmp, "registry"))
+    old, X = train(5, 0)
+    new, _ = train(15, 1)
+    registry.register(old)
+    registry.promote(1, export_path=None)
+
+    # An input the two models score differently
+    rows = X.drop_duplicates().to_dict("records")
+    row = next(r for r in rows if not np.isclose(
+        old.predict_proba(pd.DataFrame([r]))[0, 1], new.predict_proba(pd.DataFrame([r]))[0, 1]
+    ))
+    args = (row["jobtitle"], row["location"], row["experience_level"], row["industry"],
+            ",".join(f"s{i}" for i in range(row["skill_count"])))
+
+    server = MicroBatchModelServer(os.path.join(tmp, "missing.pkl"), max_delay_ms=1,
+                                   registry=registry, poll_seconds=0)
+    cache = PredictionCache(predict_fn=server.predict_job_demand,
+                            model_path=os.path.join(tmp, "missing.pkl"),
+                            version_fn=server.served_version)
+    before = cache.predict(*args)
+    assert cache.predict(*args) == before
+
+    registry.register(new)
+    registry.promote(2, export_path=None)
+    after = cache.predict(*args)
+    server.stop()
+
+    assert server.stats()["model_version"] == 2
+    p_high = new.predict_proba(pd.DataFrame([row]))[0, 1]
+    assert after != before
+    assert after[1] == round(max(p_high, 1 - p_high) * 100, 2)
+    assert cache.stats()["invalidations"] == 1
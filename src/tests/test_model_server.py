@@ -0,0 +1,92 @@
+import os
+import tempfile
+import threading
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+from src.models.model_server import FEATURE_COLUMNS, MicroBatchModelServer
+
+
+def train_small_pipeline(path):
+    rng = np.random.default_rng(0)
+    n = 400
+    X = pd.DataFrame({
+        "jobtitle": rng.choice(["AI Engineer", "Data Analyst", "DevOps Engineer"], n),
+        "location": rng.choice(["Pune", "Delhi"], n),
+        "experience_level": rng.choice(["Senior", "Fresher"], n),
+        "industry": rng.choice(["IT", "Finance"], n),
+        "skill_count": rng.integers(1, 8, n)
+    })
+    y = ((X["jobtitle"] == "AI Engineer") | (X["skill_count"] > 5)).astype(int)
+
+    pipeline = Pipeline([
+        ("preprocessor", ColumnTransformer([
+            ("cat", OneHotEncoder(handle_unknown="ignore"),
+             ["jobtitle", "location", "experience_level", "industry"]),
+            ("num", "passthrough", ["skill_count"])
+        ])),
+        ("model", RandomForestClassifier(n_estimators=10, random_state=0))
+    ])
+    pipeline.fit(X, y)
+    joblib.dump(pipeline, path)
+    return pipeline, X
+
+
+def test_batched_scores_match_direct_predict_proba():
+    path = os.path.join(tempfile.mkdtemp(), "model.pkl")
+    pipeline, X = train_small_pipeline(path)
+    server = MicroBatchModelServer(path, max_batch_size=8, max_delay_ms=20)
+    server.load()
+
+    rows = X.head(40).to_dict("records")
+    results = [None] * len(rows)
+
+    def client(i):
+        results[i] = server.predict_proba_high(rows[i])
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(len(rows))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    server.stop()
+
+    expected = pipeline.predict_proba(pd.DataFrame(rows, columns=FEATURE_COLUMNS))[:, 1]
+    assert np.allclose(results, expected)
+
+    stats = server.stats()
+    assert stats["requests"] == 40
+    assert stats["batches"] < 40
+    assert stats["max_batch_size"] <= 8
+
+
+def test_lowercase_inputs_map_to_training_categories():
+    path = os.path.join(tempfile.mkdtemp(), "model.pkl")
+    train_small_pipeline(path)
+    server = MicroBatchModelServer(path)
+    server.load()
+
+    row = server.make_row("ai engineer", "pune", "senior", "it", 3)
+    assert row == {
+        "jobtitle": "AI Engineer",
+        "location": "Pune",
+        "experience_level": "Senior",
+        "industry": "IT",
+        "skill_count": 3
+    }
+
+    demand, confidence, career_risk, ai_probability = server.predict_job_demand(
+        "ai engineer", "pune", "senior", "it", "python, sql, aws"
+    )
+    server.stop()
+
+    assert demand in ("High", "Medium", "Low")
+    assert 50 <= confidence <= 100
+    assert career_risk.endswith("Risk")
+    assert 10 <= ai_probability <= 90
@@ -0,0 +1,131 @@
+import os
+import tempfile
+
+import pytest
+
+from src.pipeline import runner
+from src.pipeline.runner import Stage, dependencies, run_pipeline
+
+# Appends its own name to runs.log, then copies `src` to `dst`
+COPY_SCRIPT = """
+import sys
+name, src, dst = {name!r}, {src!r}, {dst!r}
+with open("runs.log", "a") as f:
+    f.write(name + "\\n")
+with open(src) as f:
+    text = f.read()
+with open(dst, "w") as f:
+    f.write(text + name)
+"""
+
+
+def make_project(stages, failing=()):
+    root = tempfile.mkdtemp()
+    with open(os.path.join(root, "raw.txt"), "w") as f:
+        f.write("raw")
+    for name, src, dst in stages:
+        body = "raise RuntimeError('boom')" if name in failing else COPY_SCRIPT.format(
+            name=name, src=src, dst=dst
+        )
+        with open(os.path.join(root, f"{name}.py"), "w") as f:
+            f.write(body)
+    return root, [Stage(name, f"{name}.py", inputs=[src], outputs=[dst]) for name, src, dst in stages]
+
+
+def runs(root):
+    path = os.path.join(root, "runs.log")
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return f.read().split()
+
+
+def statuses(rows):
+    return {row["stage"]: row["status"] for row in rows}
+
+
+DIAMOND = [
+    ("clean", "raw.txt", "clean.txt"),
+    ("left", "clean.txt", "left.txt"),
+    ("right", "clean.txt", "right.txt"),
+]
+
+
+def test_dependencies_come_from_declared_files():
+    _, stages = make_project(DIAMOND)
+    assert dependencies(stages) == {"clean": [], "left": ["clean"], "right": ["clean"]}
+
+    with pytest.raises(ValueError):
+        dependencies(stages + [Stage("again", "again.py", outputs=["left.txt"])])
+    with pytest.raises(ValueError):
+        dependencies([Stage("a", "a.py", ["b.txt"], ["a.txt"]), Stage("b", "b.py", ["a.txt"], ["b.txt"])])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_unchanged_stages_are_skipped(workers):
+    root, stages = make_project(DIAMOND)
+    state = os.path.join(root, "state.json")
+
+    rows, _ = run_pipeline(stages, root, state, max_workers=workers, preload=())
+    assert statuses(rows) == {"clean": "ran", "left": "ran", "right": "ran"}
+    assert runs(root)[0] == "clean" and sorted(runs(root)[1:]) == ["left", "right"]
+    with open(os.path.join(root, "left.txt")) as f:
+        assert f.read() == "rawcleanleft"
+
+    rows, _ = run_pipeline(stages, root, state, max_workers=workers, preload=())
+    assert set(statuses(rows).values()) == {"cached"}
+    assert len(runs(root)) == 3
+
+    # A changed output is rebuilt; a changed input reruns everything downstream
+    os.remove(os.path.join(root, "right.txt"))
+    rows, _ = run_pipeline(stages, root, state, max_workers=workers, preload=())
+    assert statuses(rows) == {"clean": "cached", "left": "cached", "right": "ran"}
+
+    with open(os.path.join(root, "raw.txt"), "w") as f:
+        f.write("new")
+    rows, _ = run_pipeline(stages, root, state, max_workers=workers, preload=())
+    assert set(statuses(rows).values()) == {"ran"}
+    assert len(runs(root)) == 7
+
+
+def test_failure_blocks_only_downstream_stages():
+    root, stages = make_project(DIAMOND + [("other", "raw.txt", "other.txt")], failing=("left",))
+    stages.append(Stage("report", "report.py", inputs=["left.txt"], outputs=["report.txt"]))
+
+    rows, _ = run_pipeline(stages, root, os.path.join(root, "state.json"), max_workers=2, preload=())
+    assert statuses(rows) == {
+        "clean": "ran", "left": "failed", "right": "ran", "other": "ran", "report": "blocked"
+    }
+
+
+def test_dry_run_and_force():
+    root, stages = make_project(DIAMOND)
+    state = os.path.join(root, "state.json")
+
+    rows, _ = run_pipeline(stages, root, state, dry_run=True, preload=())
+    assert set(statuses(rows).values()) == {"would run"}
+    assert runs(root) == []
+
+    run_pipeline(stages, root, state, max_workers=1, preload=())
+    rows, _ = run_pipeline(stages, root, state, max_workers=1, force=True, preload=())
+    assert set(statuses(rows).values()) == {"ran"}
+    assert len(runs(root)) == 6
+
+
+def test_single_worker_never_creates_a_process_context(monkeypatch):
+    # e.g. Windows, where get_context("fork") raises ValueError
+    def no_fork(*args, **kwargs):
+        raise ValueError("cannot find context for 'fork'")
+
+    monkeypatch.setattr(runner.multiprocessing, "get_context", no_fork)
+    root, stages = make_project(DIAMOND)
+    rows, _ = run_pipeline(stages, root, os.path.join(root, "state.json"), max_workers=1, preload=())
+    assert set(statuses(rows).values()) == {"ran"}
+
+
+def test_parallel_stages_fall_back_to_spawn(monkeypatch):
+    monkeypatch.setattr(runner.multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    root, stages = make_project(DIAMOND)
+    rows, _ = run_pipeline(stages, root, os.path.join(root, "state.json"), max_workers=2, preload=())
+    assert set(statuses(rows).values()) == {"ran"}
+    assert sorted(runs(root)) == ["clean", "left", "right"]
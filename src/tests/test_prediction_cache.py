@@ -0,0 +1,73 @@
+import os
+import tempfile
+
+from src.models import demand_predictor
+from src.models.prediction_cache import PredictionCache, canonical_key
+
+
+def make_cache(**kwargs):
+    kwargs.setdefault("model_path", os.path.join(tempfile.mkdtemp(), "model.pkl"))
+    kwargs.setdefault("check_interval", 0)
+    return PredictionCache(**kwargs)
+
+
+def test_equivalent_inputs_share_a_key():
+    a = canonical_key(" AI Engineer", "Pune ", "2-5 Years", "IT", "SQL, python,aws")
+    b = canonical_key("ai engineer", "pune", "2-5 years", "it", "aws, Python , sql")
+    assert a == b
+
+
+def test_duplicate_skills_keep_distinct_keys():
+    a = canonical_key("ai engineer", "", "", "", "python, python, sql")
+    b = canonical_key("ai engineer", "", "", "", "python, sql")
+    assert a != b
+
+
+def test_cached_results_match_predictor():
+    cache = make_cache()
+    args = ("Data Engineer", "Bangalore", "5+ years", "IT", "python, sql, spark")
+
+    first = cache.predict(*args)
+    second = cache.predict("data engineer", "bangalore", "5+ YEARS", "it", "spark,sql,python")
+
+    assert first == second == demand_predictor.predict_job_demand(*args)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction():
+    cache = make_cache(maxsize=2)
+    for role in ["a", "b", "a", "c"]:
+        cache.predict(role, "", "", "", "x")
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    cache.predict("a", "", "", "", "x")
+    assert cache.stats()["hits"] == 2
+
+
+def test_rule_table_change_invalidates():
+    cache = make_cache()
+    before = cache.predict("data analyst", "", "fresher", "", "a")
+
+    demand_predictor.ROLE_BASE_DEMAND["data analyst"] += 30
+    try:
+        after = cache.predict("data analyst", "", "fresher", "", "a")
+    finally:
+        demand_predictor.ROLE_BASE_DEMAND["data analyst"] -= 30
+
+    assert before != after
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_model_artifact_change_invalidates():
+    cache = make_cache()
+    cache.predict("ai engineer", "", "", "", "a")
+
+    with open(cache.model_path, "wb") as f:
+        f.write(b"new model")
+    cache.predict("ai engineer", "", "", "", "a")
+
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["misses"] == 2
@@ -0,0 +1,130 @@
+import os
+import random
+import sqlite3
+import tempfile
+
+from src.analytics import db_summary
+from src.analytics.db_summary import SELECT_TOP_KEYS, get_db_summary, get_dimension, show_db_summary
+from src.database.connection import INSERT_PREDICTION, Database
+
+
+def random_rows(n, seed=1):
+    rng = random.Random(seed)
+    return [
+        (
+            rng.choice(["ai engineer", "data analyst", "data engineer"]),
+            rng.choice(["pune", "delhi", "chennai"]),
+            "2-5 years", "it", 3,
+            rng.choice(["High", "Medium", "Low"]),
+            float(rng.randint(40, 85))
+        )
+        for _ in range(n)
+    ]
+
+
+def expected_counts(database, column):
+    rows = database.query(
+        f"SELECT {column} AS k, COUNT(*) AS n FROM predictions GROUP BY {column}"
+    )
+    return {row["k"]: row["n"] for row in rows}
+
+
+def summary_counts(summary, dimension):
+    return {row[dimension]: row["count"] for row in summary[dimension]}
+
+
+def make_database():
+    database = Database(os.path.join(tempfile.mkdtemp(), "rollups.db"))
+    database.init_schema()
+    return database
+
+
+def test_rollups_track_inserts_and_deletes():
+    database = make_database()
+    database.executemany(INSERT_PREDICTION, random_rows(300))
+    database.execute("DELETE FROM predictions WHERE id % 7 = 0")
+
+    summary = get_db_summary(database, top=None)
+    total = database.query_one("SELECT COUNT(*) AS n, SUM(confidence) AS s FROM predictions")
+
+    assert summary["total"] == total["n"]
+    assert summary["avg_confidence"] == round(total["s"] / total["n"], 2)
+    for dimension in ("demand", "jobtitle", "location"):
+        assert summary_counts(summary, dimension) == expected_counts(database, dimension)
+
+
+def test_existing_rows_are_backfilled_on_first_start():
+    path = os.path.join(tempfile.mkdtemp(), "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE predictions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            jobtitle TEXT, location TEXT, experience_level TEXT,
+            industry TEXT, skill_count INTEGER, demand TEXT,
+            confidence REAL, created_at TEXT
+        )
+    """)
+    conn.executemany(INSERT_PREDICTION, random_rows(50))
+    conn.commit()
+    conn.close()
+
+    database = Database(path)
+    database.init_schema()
+
+    summary = get_db_summary(database)
+    assert summary["total"] == 50
+    assert summary_counts(summary, "demand") == expected_counts(database, "demand")
+
+
+def test_rollups_follow_edited_rows():
+    database = make_database()
+    database.executemany(INSERT_PREDICTION, random_rows(200))
+    database.execute("UPDATE predictions SET demand = 'High', confidence = 99 WHERE id % 3 = 0")
+    database.execute("UPDATE predictions SET jobtitle = 'ml engineer' WHERE id % 5 = 0")
+    database.execute("UPDATE predictions SET location = NULL WHERE id % 11 = 0")
+
+    summary = get_db_summary(database, top=None)
+    total = database.query_one("SELECT COUNT(*) AS n, SUM(confidence) AS s FROM predictions")
+
+    assert summary["total"] == total["n"]
+    assert summary["avg_confidence"] == round(total["s"] / total["n"], 2)
+    assert summary_counts(summary, "demand") == expected_counts(database, "demand")
+    assert summary_counts(summary, "jobtitle") == expected_counts(database, "jobtitle")
+    expected = expected_counts(database, "location")
+    expected[""] = expected.pop(None)
+    assert summary_counts(summary, "location") == expected
+
+
+def test_top_n_is_read_in_count_order_from_the_index():
+    database = make_database()
+    database.executemany(INSERT_PREDICTION, random_rows(300))
+
+    top = get_dimension("jobtitle", database, top=2)
+    counts = sorted(expected_counts(database, "jobtitle").items(), key=lambda kv: (-kv[1], kv[0]))
+    assert [(row["jobtitle"], row["count"]) for row in top] == counts[:2]
+
+    plan = database.query("EXPLAIN QUERY PLAN " + SELECT_TOP_KEYS, ("jobtitle", 2))
+    assert "idx_rollups_count" in plan[0]["detail"]
+    assert not any("TEMP B-TREE" in row["detail"] for row in plan)
+
+
+def test_summary_prints_rows_with_null_fields(capsys):
+    database = Database(os.path.join(tempfile.mkdtemp(), "nulls.db"))
+    database.init_schema()
+    database.execute(INSERT_PREDICTION, (None, None, None, None, None, None, None))
+
+    show_db_summary(database)
+    assert "Total Predictions: 1" in capsys.readouterr().out
+
+
+def test_day_dimension_keeps_the_latest_days(monkeypatch):
+    database = Database(os.path.join(tempfile.mkdtemp(), "days.db"))
+    database.init_schema()
+    database.executemany(
+        "INSERT INTO predictions (jobtitle, demand, confidence, created_at) VALUES (?, ?, ?, ?)",
+        [("ai engineer", "High", 70.0, f"2026-01-{day:02d} 10:00:00") for day in range(1, 11)]
+    )
+
+    monkeypatch.setattr(db_summary, "SUMMARY_DAYS", 3)
+    days = [row["day"] for row in get_db_summary(database)["day"]]
+    assert days == ["2026-01-08", "2026-01-09", "2026-01-10"]
@@ -0,0 +1,82 @@
+import itertools
+
+from src.models import demand_predictor
+from src.models.demand_predictor import predict_job_demand
+from src.models.rule_engine import (
+    OTHER_EXPERIENCE,
+    OTHER_ROLE,
+    SKILL_BUCKETS,
+    RuleTableEngine
+)
+
+UNKNOWN_ROLES = ["Mechanical Engineer", "", "  "]
+UNKNOWN_EXPERIENCE = ["10 years", "", " fresher", "2-5years"]
+SKILL_COUNTS = range(0, 11)
+
+
+def skills_string(count):
+    return ", ".join(f"skill{i}" for i in range(count))
+
+
+def role_variants(role):
+    return [role, role.upper(), f"  {role.title()} "]
+
+
+def experience_variants(exp):
+    # Experience is lower-cased but not stripped by the rules
+    return [exp, exp.upper()]
+
+
+def test_table_covers_every_rule_key():
+    table = RuleTableEngine().compile()
+    assert table["roles"][-1] == OTHER_ROLE
+    assert set(table["roles"][:-1]) == set(demand_predictor.ROLE_BASE_DEMAND)
+    assert table["experience"][-1] == OTHER_EXPERIENCE
+    assert table["experience"][:-1] == list(demand_predictor.EXPERIENCE_BONUS)
+    assert table["confidence"].shape == (
+        len(table["roles"]), len(table["experience"]), len(SKILL_BUCKETS)
+    )
+
+
+def test_scalar_engine_matches_reference_on_every_cell():
+    engine = RuleTableEngine()
+    roles = list(demand_predictor.ROLE_BASE_DEMAND) + UNKNOWN_ROLES
+    experience = list(demand_predictor.EXPERIENCE_BONUS) + UNKNOWN_EXPERIENCE
+
+    for role, exp, count in itertools.product(roles, experience, SKILL_COUNTS):
+        for title in role_variants(role):
+            for level in experience_variants(exp):
+                args = (title, "pune", level, "it", skills_string(count))
+                assert engine.predict(*args) == predict_job_demand(*args), args
+
+
+def test_batch_engine_matches_reference_on_every_cell():
+    engine = RuleTableEngine()
+    roles = list(demand_predictor.ROLE_BASE_DEMAND) + UNKNOWN_ROLES
+    experience = list(demand_predictor.EXPERIENCE_BONUS) + UNKNOWN_EXPERIENCE
+    grid = list(itertools.product(roles, experience, SKILL_COUNTS))
+
+    titles = [r for r, _, _ in grid]
+    levels = [e for _, e, _ in grid]
+    skills = [skills_string(c) for _, _, c in grid]
+    columns = [col.tolist() for col in engine.predict_batch(titles, levels, skills)]
+
+    for i, (title, level, skill) in enumerate(zip(titles, levels, skills)):
+        expected = predict_job_demand(title, "", level, "", skill)
+        assert tuple(col[i] for col in columns) == expected
+
+
+def test_refresh_recompiles_after_rule_change():
+    engine = RuleTableEngine()
+    args = ("data analyst", "", "fresher", "", "a")
+    before = engine.predict(*args)
+
+    demand_predictor.ROLE_BASE_DEMAND["data analyst"] += 30
+    try:
+        engine.refresh()
+        after = engine.predict(*args)
+        assert after == predict_job_demand(*args)
+    finally:
+        demand_predictor.ROLE_BASE_DEMAND["data analyst"] -= 30
+
+    assert before != after
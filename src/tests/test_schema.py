@@ -0,0 +1,58 @@
+import os
+import tempfile
+
+import pandas as pd
+
+from src.data_pipeline import schema
+
+
+def write_csv(n=40):
+    path = os.path.join(tempfile.mkdtemp(), "jobs.csv")
+    pd.DataFrame({
+        "job_title": ["Data Analyst", "ML Engineer"] * (n // 2),
+        "required_skills": ["Python, SQL", "Java"] * (n // 2),
+        "posting_date": ["30-10-2024", "05-01-2024"] * (n // 2),
+        "skill_count": [2, 1] * (n // 2),
+        "salary": [12.5, 8.0] * (n // 2),
+        "demand_label": ["High", "Low"] * (n // 2)
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_read_csv_applies_shared_schema():
+    path = write_csv()
+    df = schema.read_csv(path)
+
+    assert df["job_title"].dtype == "category"
+    assert df["demand_label"].dtype == "category"
+    assert df["required_skills"].dtype == object
+    assert df["skill_count"].dtype == "int8"
+    assert df["salary"].dtype == "float32"
+
+    # Day-first, not month-first
+    assert df["posting_date"].tolist()[:2] == [pd.Timestamp("2024-10-30"), pd.Timestamp("2024-01-05")]
+
+    # Same values as the untyped load
+    raw = pd.read_csv(path)
+    assert df["job_title"].astype(str).tolist() == raw["job_title"].tolist()
+    assert df["skill_count"].tolist() == raw["skill_count"].tolist()
+
+
+def test_read_csv_projects_columns():
+    df = schema.read_csv(write_csv(), columns=["demand_label", "posting_date"])
+    assert sorted(df.columns) == ["demand_label", "posting_date"]
+    assert df["demand_label"].dtype == "category"
+
+
+def test_parse_dates_falls_back_to_coerce():
+    parsed = schema.parse_dates(pd.Series(["2024-03-01", "not a date"]))
+    assert parsed.iloc[0] == pd.Timestamp("2024-03-01")
+    assert pd.isna(parsed.iloc[1])
+
+
+def test_memory_report_totals():
+    path = write_csv(n=2000)
+    report = schema.memory_report(pd.read_csv(path), schema.read_csv(path))
+    assert report.loc["job_title", "dtype_after"] == "category"
+    assert report.loc["TOTAL", "mb_after"] < report.loc["TOTAL", "mb_before"]
+    assert 0 < report.loc["TOTAL", "reduction"] < 1
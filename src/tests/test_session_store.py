@@ -0,0 +1,127 @@
+import os
+import tempfile
+import time
+
+from flask import Flask, session
+
+from src.database.connection import Database
+from src.database.session_store import (
+    MemorySessionBackend,
+    ServerSessionInterface,
+    SQLiteSessionBackend
+)
+
+
+def make_app(backend):
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.session_interface = ServerSessionInterface(backend)
+
+    @app.route("/login")
+    def login():
+        session.clear()
+        session.permanent = True
+        session.update({"user": "a@jobai.com", "demand_trend": [1, 2, 3]})
+        return "ok"
+
+    @app.route("/read")
+    def read():
+        return f"{session.get('user')}:{session.get('demand_trend')}"
+
+    @app.route("/logout")
+    def logout():
+        session.clear()
+        return "bye"
+
+    return app
+
+
+def sqlite_backend():
+    database = Database(os.path.join(tempfile.mkdtemp(), "sessions.db"))
+    database.init_schema()
+    return SQLiteSessionBackend(database)
+
+
+def check_round_trip(backend):
+    client = make_app(backend).test_client()
+    client.get("/login")
+
+    cookie = client.get_cookie("session")
+    assert "a@jobai.com" not in cookie.value
+    assert backend.load(cookie.value)["user"] == "a@jobai.com"
+    assert client.get("/read").text == "a@jobai.com:[1, 2, 3]"
+
+    client.get("/logout")
+    assert client.get_cookie("session") is None
+    assert backend.load(cookie.value) is None
+
+
+def test_sqlite_round_trip():
+    check_round_trip(sqlite_backend())
+
+
+def test_memory_round_trip():
+    check_round_trip(MemorySessionBackend())
+
+
+def test_login_rotates_session_id():
+    backend = MemorySessionBackend()
+    client = make_app(backend).test_client()
+
+    client.get("/login")
+    first = client.get_cookie("session").value
+    client.get("/login")
+    second = client.get_cookie("session").value
+
+    assert first != second
+    assert backend.load(first) is None
+
+
+def test_expired_sessions_are_evicted():
+    for backend in (MemorySessionBackend(), sqlite_backend()):
+        backend.save("old", {"user": "x"}, time.time() - 1)
+        backend.save("new", {"user": "y"}, time.time() + 60)
+
+        assert backend.load("old") is None
+        backend.purge_expired(force=True)
+        assert backend.load("new") == {"user": "y"}
+
+
+def test_unmodified_requests_extend_the_expiry():
+    for backend in (MemorySessionBackend(), sqlite_backend()):
+        app = make_app(backend)
+        app.permanent_session_lifetime = 60
+        client = app.test_client()
+        client.get("/login")
+        sid = client.get_cookie("session").value
+
+        # Pull the stored expiry close, then make a read-only request
+        backend.touch(sid, time.time() + 0.3)
+        assert client.get("/read").text == "a@jobai.com:[1, 2, 3]"
+        assert client.get_cookie("session").value == sid
+
+        time.sleep(0.4)
+        assert backend.load(sid)["user"] == "a@jobai.com"
+
+
+def test_fresh_sessions_are_not_touched_on_every_request():
+    backend = MemorySessionBackend()
+    touched = []
+    touch = backend.touch
+    backend.touch = lambda sid, expires_at: touched.append(sid) or touch(sid, expires_at)
+
+    app = make_app(backend)
+    app.permanent_session_lifetime = 60
+    client = app.test_client()
+    client.get("/login")
+
+    for _ in range(5):
+        response = client.get("/read")
+        assert "Set-Cookie" not in response.headers
+    assert touched == []
+
+
+def test_responses_vary_on_cookie_when_the_session_is_read():
+    client = make_app(MemorySessionBackend()).test_client()
+    client.get("/login")
+    assert "Cookie" in client.get("/read").vary
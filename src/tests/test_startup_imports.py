@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROBE = r"""
+import json, os, sys
+import app
+print(json.dumps({
+    "modules": sorted(sys.modules),
+    "db_created": os.path.exists(os.environ["JOBAI_DB_PATH"])
+}))
+"""
+
+HEAVY_MODULES = ("numpy", "pandas", "sklearn")
+
+
+def import_app():
+    """Loaded modules and DB file state after `import app` in a fresh interpreter."""
+    env = dict(os.environ)
+    env["JOBAI_DB_PATH"] = os.path.join(tempfile.mkdtemp(prefix="jobai_import_"), "jobai.db")
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def test_import_app_does_not_load_heavy_modules():
+    # The forest engine, model registry and pandas are imported on the first model load
+    loaded = set(import_app()["modules"])
+    assert [m for m in HEAVY_MODULES if m in loaded] == []
+
+
+def test_import_app_does_not_create_the_database():
+    # The schema is created by create_app(), not as an import side effect
+    assert not import_app()["db_created"]
@@ -0,0 +1,55 @@
+import csv
+import os
+import tempfile
+
+from src.database.connection import Database
+from src.database.user_store import UserStore
+
+
+def make_store():
+    tmp_dir = tempfile.mkdtemp()
+    database = Database(os.path.join(tmp_dir, "users.db"))
+    database.init_schema()
+    return UserStore(database), tmp_dir
+
+
+def test_migrates_csv_once_and_authenticates():
+    store, tmp_dir = make_store()
+    csv_path = os.path.join(tmp_dir, "users.csv")
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["email", "password"])
+        writer.writerow(["a@jobai.com", "1234"])
+        writer.writerow(["b@jobai.com", "abcd"])
+        writer.writerow(["a@jobai.com", "dup"])
+
+    assert store.migrate_from_csv(csv_path) == 2
+    assert store.migrate_from_csv(csv_path) == 0
+
+    # The later, most recently registered password wins
+    assert store.authenticate("a@jobai.com", "dup")
+    assert not store.authenticate("a@jobai.com", "1234")
+    assert store.authenticate("b@jobai.com", "abcd")
+    assert store.authenticate(" b@jobai.com ", "abcd")
+    assert not store.authenticate("a@jobai.com", "wrong")
+    assert not store.authenticate("missing@jobai.com", "1234")
+
+
+def test_duplicate_signup_is_rejected():
+    store, _ = make_store()
+
+    assert store.create("new@jobai.com", "pw")
+    assert not store.create("new@jobai.com", "other")
+    assert store.authenticate("new@jobai.com", "pw")
+
+
+def test_cache_is_invalidated_on_delete():
+    store, _ = make_store()
+    store.create("gone@jobai.com", "pw")
+
+    assert store.authenticate("gone@jobai.com", "pw")
+    assert store.authenticate("gone@jobai.com", "pw")
+    assert store.hits == 1
+
+    store.delete("gone@jobai.com")
+    assert not store.authenticate("gone@jobai.com", "pw")
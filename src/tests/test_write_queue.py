@@ -0,0 +1,129 @@
+import os
+import tempfile
+import threading
+import time
+
+from src.database.connection import Database
+from src.database.write_queue import PredictionWriteQueue
+
+
+def make_record(i):
+    return {
+        "jobtitle": f"role {i}",
+        "location": "pune",
+        "experience_level": "2-5 years",
+        "industry": "it",
+        "skill_count": 3,
+        "demand": "Medium",
+        "confidence": 70.0
+    }
+
+
+def make_database():
+    path = os.path.join(tempfile.mkdtemp(), "queue.db")
+    database = Database(path)
+    database.init_schema()
+    return database
+
+
+def test_records_are_written_in_batches():
+    database = make_database()
+    writer = PredictionWriteQueue(database, batch_size=50, flush_interval=0.05)
+
+    for i in range(120):
+        writer.submit(make_record(i))
+    writer.flush()
+
+    count = database.query_one("SELECT COUNT(*) AS n FROM predictions")["n"]
+    stats = writer.stats()
+
+    assert count == 120
+    assert stats["written"] == 120
+    assert stats["queue_depth"] == 0
+    assert stats["batches"] < 120
+    writer.stop()
+
+
+def test_stop_drains_pending_records():
+    database = make_database()
+    writer = PredictionWriteQueue(database, batch_size=1000, flush_interval=5.0)
+
+    for i in range(25):
+        writer.submit(make_record(i))
+    writer.stop()
+
+    count = database.query_one("SELECT COUNT(*) AS n FROM predictions")["n"]
+    assert count == 25
+
+
+def test_full_queue_falls_back_to_direct_write():
+    database = make_database()
+    writer = PredictionWriteQueue(database, max_queue=1, flush_interval=0.01)
+
+    for i in range(20):
+        writer.submit(make_record(i))
+    writer.flush()
+    writer.stop()
+
+    count = database.query_one("SELECT COUNT(*) AS n FROM predictions")["n"]
+    assert count == 20
+    assert writer.stats()["failed"] == 0
+
+
+class SlowDatabase:
+    """Stands in for Database: every grouped write takes `delay` seconds."""
+
+    def __init__(self, delay=0.01, gate=None):
+        self.delay = delay
+        self.gate = gate
+        self.rows = []
+
+    def executemany(self, sql, params):
+        if self.gate is not None:
+            self.gate.wait()
+        time.sleep(self.delay)
+        self.rows.extend(params)
+
+
+def test_flush_does_not_wait_for_later_submissions():
+    database = SlowDatabase()
+    writer = PredictionWriteQueue(database, batch_size=10, flush_interval=0.01)
+    writer.submit(make_record(0))
+
+    # A steady stream of other requests keeps the queue from ever emptying
+    running = threading.Event()
+    running.set()
+
+    def producer():
+        i = 1
+        while running.is_set():
+            writer.submit(make_record(i))
+            i += 1
+            time.sleep(0.0005)
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    try:
+        time.sleep(0.05)
+        start = time.monotonic()
+        assert writer.flush(timeout=5.0)
+        assert time.monotonic() - start < 2.0
+        assert database.rows[0][0] == "role 0"
+    finally:
+        running.clear()
+        thread.join()
+        writer.stop()
+
+
+def test_stop_returns_when_the_writer_is_stuck():
+    gate = threading.Event()
+    writer = PredictionWriteQueue(SlowDatabase(delay=0, gate=gate), max_queue=1, flush_interval=0.01)
+    writer.submit(make_record(0))
+    time.sleep(0.05)  # taken by the writer, which now blocks in executemany
+    writer.submit(make_record(1))
+
+    start = time.monotonic()
+    writer.stop(timeout=0.2)
+    assert time.monotonic() - start < 1.0
+    assert not writer.flush(timeout=0.1)
+    gate.set()